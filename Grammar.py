@@ -1,22 +1,90 @@
-from GrammarRule import ParseData
+import re
+from types import MappingProxyType
+
+from GrammarRule import ParseData, ParseBudget, CancellationToken, MatcherCut
 from GrammarTools import Position
-from GrammarParseTree import ParseTree, ParseTreeNode
-from GrammarException import GrammarException
+from GrammarParseTree import ParseTree, ParseTreeNode, ParseTreeBuilder, ParseEventHandler
+from GrammarException import GrammarException, ParseLimitExceeded
+
+# Parsing resumes at the start of the next line that does not start with whitespace
+DEFAULT_SYNC_PATTERN = r"^(?=\S)"
+ERROR_NODE_NAME = "Error"
+
+class ParseError:
+    def __init__(self, position_begin: Position, position_end: Position, farthest_match_position: Position, message: str = None, expected: list[str] = None) -> None:
+        # 'position_begin' to 'position_end' is the skipped text, 'message'
+        # is set if a 'fail' action aborted the item.
+        self.position_begin = position_begin
+        self.position_end = position_end
+        self.farthest_match_position = farthest_match_position
+        self.message = message
+        self.expected = [] if expected is None else expected
 
 class ParseResult:
-    def __init__(self, tree: ParseTree, farthest_match_position: Position) -> None:
+    def __init__(self, tree: ParseTree, farthest_match_position: Position, errors: list[ParseError] = None, expected_position: Position = None, expected: list[str] = None) -> None:
         self.tree = tree
         self.farthest_match_position = farthest_match_position
+        self.errors = [] if errors is None else errors
+        # What could have continued the text at the farthest point any matcher failed at
+        self.expected_position = expected_position
+        self.expected = [] if expected is None else expected
+
+    def get_expected_string(self) -> str:
+        if len(self.expected) == 0:
+            return "Unexpected input"
+        return f"Expected {', '.join(self.expected)}"
 
+# A Grammar is never modified after it was created. Everything a parse
+# changes lives in its own ParseData, so one Grammar can be used by any
+# number of threads at the same time.
 class Grammar:
     def __init__(self, rules: dict) -> None:
-        self.rules = rules
+        self.rules = MappingProxyType(dict(rules))
+
+        # Choices are only tracked for cuts, so grammars without cuts match
+        # without them. Linked rules are left as they are, linking them fails.
+        matchers = []
+        for rule in self.rules.values():
+            stack = [ rule ]
+            while len(stack) > 0:
+                matcher = stack.pop()
+                matchers.append(matcher)
+                stack.extend(matcher._get_sub_matchers())
+        if any(isinstance(matcher, MatcherCut) for matcher in matchers):
+            for matcher in matchers:
+                if not matcher._linked:
+                    matcher._cuts = True
 
-    def apply_to(self, text: str, rule: str, filename: str) -> ParseResult:
+        # Rule references and actions are bound once all rules are known,
+        # the rules cannot be changed or used by another grammar afterwards
+        for rule in self.rules.values():
+            rule._link(self.rules)
+
+    def __reduce__(self):
+        # Read-only mappings cannot be pickled, e.g. to send a grammar to
+        # worker processes. Only the rules are sent, they are linked again.
+        return (Grammar, (dict(self.rules),))
+
+    def apply_to(self, text: str, rule: str, filename: str, max_steps: int = None, deadline: float = None, cancellation: CancellationToken = None, lazy: bool = False, keep: set[str] = None, intern: bool = False) -> ParseResult:
+        # Raises ParseLimitExceeded once the parse takes more than 'max_steps'
+        # matcher calls, runs past 'deadline' (time.monotonic()) or 'cancellation' is cancelled.
+        # With 'lazy', the nodes of lazy rules are only parsed once their
+        # children are accessed. Errors inside them are raised there.
+        # With 'keep', only the nodes of these rules and the root are kept,
+        # every other node is replaced by its kept descendants or its text.
+        # With 'intern', equal leaf values and positions are shared by the
+        # trees, which makes trees of large repetitive texts smaller.
         if rule not in self.rules:
             raise GrammarException(f"Unknown rule '{rule}'")
         
-        parseData = ParseData(text, filename, self.rules)
+        parseData = self.__create_parse_data(text, filename, max_steps, deadline, cancellation)
+        parseData.lazy = lazy
+        if keep is not None:
+            unknown = sorted(name for name in keep if name not in self.rules)
+            if len(unknown) > 0:
+                raise GrammarException(f"Unknown rules to keep: {', '.join(unknown)}")
+            parseData.projection = frozenset(keep)
+        parseData.set_interning(intern)
 
         tree, _ = parseData.get_rule(rule).match(parseData, 0)
 
@@ -26,7 +94,119 @@ class Grammar:
         if not parseData.stacks_are_empty():
             raise GrammarException(f"Stacks not empty after parsing. Data: {dict(map(lambda stack_name: (stack_name, parseData.get_stack(stack_name)), parseData.get_stack_names()))}")
 
-        return ParseResult(tree, parseData.get_position(parseData.farthest_match_index))
+        return self.__make_result(parseData, tree)
+
+    def apply_with_recovery(self, text: str, rule: str, filename: str, sync_pattern: str = DEFAULT_SYNC_PATTERN, error_name: str = ERROR_NODE_NAME, max_steps: int = None, deadline: float = None, cancellation: CancellationToken = None) -> ParseResult:
+        # For rules that repeat top level items. Whenever parsing stops before
+        # the end of the text, everything up to the next match of 'sync_pattern'
+        # beyond the failure becomes a node named 'error_name' and parsing
+        # continues from there with empty stacks. The tree is built from
+        # events, so items committed by a cut survive a 'fail' action.
+        if rule not in self.rules:
+            raise GrammarException(f"Unknown rule '{rule}'")
+
+        parseData = self.__create_parse_data(text, filename, max_steps, deadline, cancellation)
+        entry_rule = parseData.get_rule(rule)
+        sync = re.compile(sync_pattern, re.MULTILINE)
+
+        builder = ParseTreeBuilder()
+        parseData.set_event_handler(builder)
+        builder.enter(rule, parseData.get_position(0))
+
+        errors: list[ParseError] = []
+
+        index = 0
+        while True:
+            message = None
+            try:
+                tree, new_index = entry_rule.match(parseData, index)
+            except ParseLimitExceeded:
+                raise
+            except GrammarException as e:
+                tree, new_index, message = None, index, str(e)
+
+            if tree is not None:
+                tree._emit_events(builder)
+                # Like in 'apply_to', a tree that reaches the end parsed the
+                # whole text, even if the end was only looked at
+                if tree.position_end.index >= len(text):
+                    break
+            else:
+                new_index = max(index, parseData.committed_index)
+
+            if new_index >= len(text):
+                break
+
+            # Skip at least up to where the failed item got stuck
+            farthest = max(parseData.farthest_match_index, new_index)
+            match = sync.search(text, max(farthest, new_index + 1))
+            index = len(text) if match is None else match.start()
+
+            if len(errors) > 0 and errors[-1].position_end.index == new_index:
+                # Nothing could be parsed at the last sync point, continue the previous error
+                builder.tree.children.pop()
+                previous = errors.pop()
+                new_index = previous.position_begin.index
+                message = message if previous.message is None else previous.message
+
+            begin = parseData.get_position(new_index)
+            end = parseData.get_position(index)
+            builder.enter(error_name, begin)
+            builder.leaf(text[new_index:index], begin, end)
+            builder.exit(error_name, end)
+            errors.append(ParseError(begin, end, parseData.get_position(farthest), message, parseData.get_expected()))
+
+            if index >= len(text):
+                break
+
+            parseData.reset_state()
+
+        if not parseData.stacks_are_empty():
+            raise GrammarException(f"Stacks not empty after parsing. Data: {dict(map(lambda stack_name: (stack_name, parseData.get_stack(stack_name)), parseData.get_stack_names()))}")
+
+        builder.exit(rule, parseData.get_position(len(text)))
+
+        return self.__make_result(parseData, builder.tree, errors)
+
+    def stream_to(self, handler: ParseEventHandler, text: str, rule: str, filename: str, max_steps: int = None, deadline: float = None, cancellation: CancellationToken = None) -> ParseResult:
+        # Everything a cut commits is reported and released while parsing
+        # continues. The returned tree has no children left.
+        if rule not in self.rules:
+            raise GrammarException(f"Unknown rule '{rule}'")
+
+        parseData = self.__create_parse_data(text, filename, max_steps, deadline, cancellation)
+        parseData.set_event_handler(handler)
+
+        handler.enter(rule, parseData.get_position(0))
+
+        tree, _ = parseData.get_rule(rule).match(parseData, 0)
+
+        if tree is None:
+            raise GrammarException("Could not parse text")
+
+        if not parseData.stacks_are_empty():
+            raise GrammarException(f"Stacks not empty after parsing. Data: {dict(map(lambda stack_name: (stack_name, parseData.get_stack(stack_name)), parseData.get_stack_names()))}")
+
+        if isinstance(tree, ParseTreeNode):
+            for child in tree.children:
+                child._emit_events(handler)
+            tree.children = []
+        else:
+            tree._emit_events(handler)
+
+        handler.exit(rule, tree.position_end)
+
+        return self.__make_result(parseData, tree)
+
+    def __make_result(self, parseData: ParseData, tree: ParseTree, errors: list[ParseError] = None) -> ParseResult:
+        expected_position = parseData.get_position(parseData.expected_index) if parseData.expected_index >= 0 else None
+        return ParseResult(tree, parseData.get_position(parseData.farthest_match_index), errors, expected_position, parseData.get_expected())
+
+    def __create_parse_data(self, text: str, filename: str, max_steps: int, deadline: float, cancellation: CancellationToken) -> ParseData:
+        parseData = ParseData(text, filename, self.rules)
+        if max_steps is not None or deadline is not None or cancellation is not None:
+            parseData.set_budget(ParseBudget(max_steps, deadline, cancellation))
+        return parseData
 
     def generate_python_code(self, func_name: str = "load_grammar_grammar", add_includes: bool = True) -> str:
         result = ""
@@ -37,6 +217,7 @@ class Grammar:
             result += "from GrammarRule import MatcherMatchAll, MatcherMatchAny\n"
             result += "from GrammarRule import MatcherMatchRange, MatcherMatchExact\n"
             result += "from GrammarRule import MatcherMatchRule, MatcherMatchStack\n"
+            result += "from GrammarRule import MatcherMatchIndentation, MatcherMatchPrecedence, MatcherCut\n"
             result += "\n"
 
         result += f"def {func_name}() -> Grammar:\n"
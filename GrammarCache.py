@@ -0,0 +1,129 @@
+import os
+import json
+import hashlib
+
+import GrammarSerializer
+from Grammar import Grammar, ParseResult
+from GrammarTools import Position
+from GrammarException import GrammarException
+from GrammarParseTree import ParseTree
+
+CACHE_INDEX_FILENAME = "index.json"
+CACHE_TREE_EXTENSION = ".qpt"
+
+def hash_grammar(grammar: Grammar) -> str:
+    # The generated loader code describes every rule completely
+    return hashlib.sha256(grammar.generate_python_code(add_includes=False).encode("utf-8")).hexdigest()
+
+class ParseCacheEntry:
+    def __init__(self, tree_path: str, fully_parsed: bool, farthest_match_position: Position) -> None:
+        self.__tree_path = tree_path
+        self.fully_parsed = fully_parsed
+        self.farthest_match_position = farthest_match_position
+
+    def load_tree(self) -> ParseTree:
+        if self.__tree_path is None or not os.path.exists(self.__tree_path):
+            return None
+        return GrammarSerializer.load(self.__tree_path)
+
+class ParseCache:
+    def __init__(self, grammar: Grammar, rule: str, directory: str) -> None:
+        self.__grammar = grammar
+        self.__rule = rule
+        self.__directory = os.path.join(directory, hash_grammar(grammar)[:32], rule)
+
+        # 'files' maps a path to its last known (mtime, size, content hash),
+        # 'results' maps a content hash to the outcome of parsing it.
+        self.__files: dict[str, dict] = {}
+        self.__results: dict[str, dict] = {}
+        self.__modified = False
+
+        self.__load_index()
+
+    def lookup(self, path: str) -> ParseCacheEntry:
+        return self.__get_entry(self.__get_content_hash(path))
+
+    def store(self, path: str, text: str, result: ParseResult) -> ParseCacheEntry:
+        content_hash = self.__get_content_hash(path)
+
+        tree = result.tree
+        fully_parsed = tree is not None and tree.position_end.index >= len(text)
+        position = result.farthest_match_position
+
+        if tree is not None:
+            os.makedirs(self.__directory, exist_ok=True)
+            GrammarSerializer.dump(tree, self.__get_tree_path(content_hash), text)
+
+        self.__results[content_hash] = {
+            "fully_parsed": fully_parsed,
+            "has_tree": tree is not None,
+            "farthest": [ position.index, position.line, position.column ],
+        }
+        self.__modified = True
+
+        return self.__get_entry(content_hash)
+
+    def apply_to_file(self, path: str) -> ParseCacheEntry:
+        entry = self.lookup(path)
+        if entry is not None:
+            return entry
+
+        with open(path, "r") as f:
+            text = f.read()
+
+        return self.store(path, text, self.__grammar.apply_to(text, self.__rule, path))
+
+    def save(self) -> None:
+        if not self.__modified:
+            return
+
+        os.makedirs(self.__directory, exist_ok=True)
+
+        # Write to a temporary file first so an interrupted run never leaves a broken index
+        index_path = os.path.join(self.__directory, CACHE_INDEX_FILENAME)
+        with open(index_path + ".tmp", "w") as f:
+            json.dump({ "files": self.__files, "results": self.__results }, f)
+        os.replace(index_path + ".tmp", index_path)
+
+        self.__modified = False
+
+    def __load_index(self) -> None:
+        index_path = os.path.join(self.__directory, CACHE_INDEX_FILENAME)
+        if not os.path.exists(index_path):
+            return
+
+        try:
+            with open(index_path, "r") as f:
+                index = json.load(f)
+            self.__files = index["files"]
+            self.__results = index["results"]
+        except (ValueError, KeyError):
+            raise GrammarException("Corrupted parse cache index", index_path)
+
+    def __get_content_hash(self, path: str) -> str:
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+
+        # Unchanged mtime and size, no need to read the file at all
+        info = self.__files.get(key)
+        if info is not None and info["mtime_ns"] == stat.st_mtime_ns and info["size"] == stat.st_size:
+            return info["hash"]
+
+        with open(path, "rb") as f:
+            content_hash = hashlib.sha256(f.read()).hexdigest()
+
+        self.__files[key] = { "mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "hash": content_hash }
+        self.__modified = True
+
+        return content_hash
+
+    def __get_entry(self, content_hash: str) -> ParseCacheEntry:
+        result = self.__results.get(content_hash)
+        if result is None:
+            return None
+
+        tree_path = self.__get_tree_path(content_hash) if result["has_tree"] else None
+        return ParseCacheEntry(tree_path, result["fully_parsed"], Position(*result["farthest"]))
+
+    def __get_tree_path(self, content_hash: str) -> str:
+        return os.path.join(self.__directory, content_hash + CACHE_TREE_EXTENSION)
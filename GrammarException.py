@@ -13,4 +13,11 @@ class GrammarException(Exception):
         if pos_str:
             pos_str += ": "
 
-        super().__init__(f"{pos_str}{message}")
\ No newline at end of file
+        super().__init__(f"{pos_str}{message}")
+class ParseLimitExceeded(GrammarException):
+    # Raised when a parse runs out of steps or time, or is cancelled.
+    # 'profile' describes the work done until then.
+    def __init__(self, message, path = None, position: Position = None, profile = None):
+        super().__init__(message, path, position)
+        self.farthest_match_position = position
+        self.profile = profile
@@ -35,6 +35,8 @@ class GrammarLoader:
         max_pos = result.farthest_match_position
 
         if tree is None or max_pos.index < len(text):
+            if result.expected_position is not None and result.expected_position.index >= max_pos.index:
+                raise self.__make_exception(f"Unable to load grammar: {result.get_expected_string()}", result.expected_position)
             raise self.__make_exception("Unable to load grammar", max_pos)
         
         self.__load_rules_from_tree(tree)
@@ -128,6 +130,16 @@ class GrammarLoader:
             rule.fuse_children = True
         elif name == "collapse":
             rule.collapse = True
+        elif name == "token":
+            rule.token = True
+        elif name == "skip":
+            rule.skip = True
+        elif name == "skipping":
+            rule.skipping = True
+        elif name == "lazy":
+            rule.lazy = True
+        elif name == "comment":
+            rule.comment = True
         else:
             raise self.__make_exception(f"Unknown rule modifier '{name}'", tree.children[0].position_begin)
         
@@ -186,13 +198,53 @@ class GrammarLoader:
             matcher = MatcherMatchExact(self.__load_string_from_tree(tree.children[0]))
         elif self.__is_node(tree, "MatchRule"):
             matcher = MatcherMatchRule(tree.children[0].children[0].value)
+        elif self.__is_node(tree, "MatchIndentation"):
+            matcher = MatcherMatchIndentation(tree.children[0].value)
         elif self.__is_node(tree, "MatchStack"):
             matcher = MatcherMatchStack(tree.children[0].children[0].value, self.__load_integer_from_tree(tree.children[1]))
+        elif self.__is_node(tree, "MatchPrecedence"):
+            matcher = self.__load_match_precedence_from_tree(tree)
+        elif self.__is_node(tree, "MatchCut"):
+            matcher = MatcherCut()
         else:
             raise self.__make_exception(f"Unknown matcher '{tree.name}'", tree.position_begin)
         
         return matcher
     
+    def __load_match_precedence_from_tree(self, tree: ParseTree) -> MatcherMatchPrecedence:
+        self.__expect_node(tree, "MatchPrecedence")
+
+        operand = self.__load_full_matcher_from_tree(tree.children[0])
+
+        operators = []
+        levels: dict[int, tuple[str, str]] = {}
+        for child in tree.children[1:]:
+            operator = self.__load_precedence_operator_from_tree(child)
+            precedence, associativity, name, _ = operator
+
+            if precedence in levels and levels[precedence] != (associativity, name):
+                raise self.__make_exception(f"Operators with precedence {precedence} must share associativity and node name", child.position_begin)
+            levels[precedence] = (associativity, name)
+
+            operators.append(operator)
+
+        return MatcherMatchPrecedence(operand, operators)
+
+    def __load_precedence_operator_from_tree(self, tree: ParseTree) -> tuple[int, str, str, Matcher]:
+        self.__expect_node(tree, "PrecedenceOperator")
+
+        precedence = self.__load_integer_from_tree(tree.children[0])
+
+        self.__expect_node(tree.children[1], "PrecedenceAssociativity")
+        associativity = tree.children[1].children[0].value
+
+        self.__expect_node(tree.children[2], "Identifier")
+        name = tree.children[2].children[0].value
+
+        operator = self.__load_full_matcher_from_tree(tree.children[3])
+
+        return (precedence, associativity, name, operator)
+
     def __load_string_from_tree(self, tree: ParseTree) -> str:
         self.__expect_node(tree, "String")
         result = ""
@@ -0,0 +1,188 @@
+import os
+import ctypes
+import ctypes.util
+
+import GrammarSerializer
+from Grammar import ParseResult
+from GrammarTools import Position
+from GrammarException import GrammarException
+from GrammarParseTree import ParseTree, ParseTreeNode
+
+# The shared library built from libQrawlr (target 'qrawlr_c'). It is looked
+# up at LIBRARY_PATH_VARIABLE, next to this file, in the usual build
+# directories of libQrawlr and finally on the system library path.
+LIBRARY_PATH_VARIABLE = "QRAWLR_LIBRARY"
+LIBRARY_NAME = "qrawlr_c"
+LIBRARY_FILENAMES = [ "libqrawlr_c.so", "libqrawlr_c.dylib", "qrawlr_c.dll" ]
+LIBRARY_DIRECTORIES = [ ".", "libQrawlr/build", "build", "libQrawlr/build/Release", "build/Release" ]
+
+_library: ctypes.CDLL = None
+_library_error: str = None
+
+def _find_library() -> str:
+    path = os.environ.get(LIBRARY_PATH_VARIABLE)
+    if path:
+        return path
+
+    base = os.path.dirname(os.path.abspath(__file__))
+    for directory in LIBRARY_DIRECTORIES:
+        for filename in LIBRARY_FILENAMES:
+            path = os.path.join(base, directory, filename)
+            if os.path.isfile(path):
+                return path
+
+    return ctypes.util.find_library(LIBRARY_NAME)
+
+def _load_library() -> ctypes.CDLL:
+    global _library, _library_error
+    if _library is not None or _library_error is not None:
+        return _library
+
+    path = _find_library()
+    if path is None:
+        _library_error = f"Could not find the {LIBRARY_NAME} library, build libQrawlr or set {LIBRARY_PATH_VARIABLE}"
+        return None
+
+    try:
+        library = ctypes.CDLL(path)
+    except OSError as e:
+        _library_error = f"Could not load '{path}': {e}"
+        return None
+
+    grammar_pointer = ctypes.c_void_p
+    error_pointer = ctypes.POINTER(ctypes.c_void_p)
+
+    library.qrawlr_grammar_load_from_file.argtypes = [ ctypes.c_char_p, ctypes.POINTER(grammar_pointer), error_pointer ]
+    library.qrawlr_grammar_load_from_file.restype = ctypes.c_int
+    library.qrawlr_grammar_load_from_text.argtypes = [ ctypes.c_char_p, ctypes.c_size_t, ctypes.c_char_p, ctypes.POINTER(grammar_pointer), error_pointer ]
+    library.qrawlr_grammar_load_from_text.restype = ctypes.c_int
+    library.qrawlr_grammar_free.argtypes = [ grammar_pointer ]
+    library.qrawlr_grammar_free.restype = None
+    library.qrawlr_grammar_apply_to.argtypes = [ grammar_pointer, ctypes.c_char_p, ctypes.c_size_t, ctypes.c_char_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_void_p), ctypes.POINTER(ctypes.c_size_t), ctypes.POINTER(ctypes.c_int), error_pointer ]
+    library.qrawlr_grammar_apply_to.restype = ctypes.c_int
+    library.qrawlr_free.argtypes = [ ctypes.c_void_p ]
+    library.qrawlr_free.restype = None
+
+    _library = library
+    return _library
+
+def is_available() -> bool:
+    return _load_library() is not None
+
+def _get_library() -> ctypes.CDLL:
+    library = _load_library()
+    if library is None:
+        raise GrammarException(_library_error)
+    return library
+
+def _raise_error(library: ctypes.CDLL, error: ctypes.c_void_p) -> None:
+    message = ctypes.string_at(error.value).decode("utf-8", errors="replace") if error.value else "Unknown error"
+    library.qrawlr_free(error)
+    raise GrammarException(message)
+
+class _CharacterOffsets:
+    # libQrawlr counts bytes of the utf-8 encoded text, Python characters.
+    # Only needed for texts that are not pure ASCII.
+    def __init__(self, text: str) -> None:
+        self.__char_indices: list[int] = []
+        for char_index, char in enumerate(text):
+            self.__char_indices.extend([char_index] * len(char.encode("utf-8")))
+        self.__char_indices.append(len(text))
+
+        self.__newlines = [-1] + [i for i, char in enumerate(text) if char == "\n"]
+
+    def convert(self, position: Position) -> Position:
+        index = self.__char_indices[position.index]
+        return Position(index, position.line, index - self.__newlines[position.line - 1])
+
+    def convert_tree(self, tree: ParseTree) -> None:
+        stack = [ tree ]
+        while len(stack) > 0:
+            tree = stack.pop()
+            tree.position_begin = self.convert(tree.position_begin)
+            tree.position_end = self.convert(tree.position_end)
+            if isinstance(tree, ParseTreeNode):
+                stack.extend(tree.children)
+
+class NativeGrammar:
+    # A grammar loaded and applied by libQrawlr. It only supports what the
+    # C++ engine implements, e.g. no expected matchers, limits or streaming.
+    def __init__(self, handle: ctypes.c_void_p) -> None:
+        self.__library = _get_library()
+        self.__handle = handle
+
+    @staticmethod
+    def load_from_file(path: str) -> "NativeGrammar":
+        library = _get_library()
+        handle = ctypes.c_void_p()
+        error = ctypes.c_void_p()
+        if library.qrawlr_grammar_load_from_file(path.encode("utf-8"), ctypes.byref(handle), ctypes.byref(error)) != 0:
+            _raise_error(library, error)
+        return NativeGrammar(handle)
+
+    @staticmethod
+    def load_from_text(text: str, filename: str = "<text>") -> "NativeGrammar":
+        library = _get_library()
+        handle = ctypes.c_void_p()
+        error = ctypes.c_void_p()
+        encoded = text.encode("utf-8")
+        if library.qrawlr_grammar_load_from_text(encoded, len(encoded), filename.encode("utf-8"), ctypes.byref(handle), ctypes.byref(error)) != 0:
+            _raise_error(library, error)
+        return NativeGrammar(handle)
+
+    def close(self) -> None:
+        if self.__handle is not None:
+            self.__library.qrawlr_grammar_free(self.__handle)
+            self.__handle = None
+
+    def __enter__(self) -> "NativeGrammar":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def apply_to(self, text: str, rule: str, filename: str) -> ParseResult:
+        data, farthest = self.__apply(text, rule, filename)
+
+        tree = None if data is None else GrammarSerializer.loads(data)
+        if not text.isascii():
+            offsets = _CharacterOffsets(text)
+            farthest = offsets.convert(farthest)
+            if tree is not None:
+                offsets.convert_tree(tree)
+
+        return ParseResult(tree, farthest)
+
+    def apply_to_serialized(self, text: str, rule: str, filename: str) -> tuple[bytes, Position]:
+        # The tree in the format of GrammarSerializer, None if the rule did not match
+        if not text.isascii():
+            result = self.apply_to(text, rule, filename)
+            return None if result.tree is None else GrammarSerializer.dumps(result.tree), result.farthest_match_position
+
+        return self.__apply(text, rule, filename)
+
+    def __apply(self, text: str, rule: str, filename: str) -> tuple[bytes, Position]:
+        if self.__handle is None:
+            raise GrammarException("Native grammar was closed")
+
+        encoded = text.encode("utf-8")
+        tree = ctypes.c_void_p()
+        tree_size = ctypes.c_size_t()
+        farthest = (ctypes.c_int * 3)()
+        error = ctypes.c_void_p()
+
+        status = self.__library.qrawlr_grammar_apply_to(
+            self.__handle, encoded, len(encoded), rule.encode("utf-8"), (filename or "").encode("utf-8"),
+            ctypes.byref(tree), ctypes.byref(tree_size), farthest, ctypes.byref(error))
+        if status != 0:
+            _raise_error(self.__library, error)
+
+        data = None
+        if tree.value:
+            data = ctypes.string_at(tree.value, tree_size.value)
+            self.__library.qrawlr_free(tree)
+
+        return data, Position(farthest[0], farthest[1], farthest[2])
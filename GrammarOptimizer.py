@@ -0,0 +1,119 @@
+import copy
+import json
+
+from Grammar import Grammar
+from GrammarRule import ParseData, Matcher, MatcherList, MatcherMatchAny
+from GrammarException import GrammarException
+
+# Choices are identified by the name of their rule and the indices of the
+# sub-matchers leading to them, so statistics can be stored and applied to
+# another instance of the same grammar.
+ChoiceKey = tuple[str, tuple[int, ...]]
+
+def _find_choices(grammar: Grammar) -> dict[MatcherList, ChoiceKey]:
+    choices = {}
+    for name, rule in grammar.rules.items():
+        pending: list[tuple[Matcher, tuple[int, ...]]] = [ (rule, ()) ]
+        while len(pending) > 0:
+            matcher, path = pending.pop()
+            if isinstance(matcher, MatcherMatchAny):
+                choices[matcher] = (name, path)
+            for index, sub_matcher in enumerate(matcher._get_sub_matchers()):
+                pending.append((sub_matcher, path + (index,)))
+    return choices
+
+def _get_choice(rules: dict, key: ChoiceKey) -> MatcherMatchAny:
+    name, path = key
+    matcher = rules.get(name)
+    for index in path:
+        if matcher is None:
+            break
+        sub_matchers = matcher._get_sub_matchers()
+        matcher = sub_matchers[index] if index < len(sub_matchers) else None
+    return matcher if isinstance(matcher, MatcherMatchAny) else None
+
+def _are_exclusive(prefix_a: list[list[tuple[str, str]]], prefix_b: list[list[tuple[str, str]]]) -> bool:
+    # Two options can never both match at the same index if they differ in
+    # one of the characters both of their prefixes cover
+    if prefix_a is None or prefix_b is None:
+        return False
+    for ranges_a, ranges_b in zip(prefix_a, prefix_b):
+        if not any(first_a <= last_b and first_b <= last_a for first_a, last_a in ranges_a for first_b, last_b in ranges_b):
+            return True
+    return False
+
+class OptionStatistics:
+    # How often each option of each choice of a grammar matched, summed up
+    # over all texts that were recorded
+    def __init__(self) -> None:
+        self.hits: dict[ChoiceKey, list[int]] = {}
+
+    def record(self, grammar: Grammar, text: str, rule: str, filename: str) -> None:
+        if rule not in grammar.rules:
+            raise GrammarException(f"Unknown rule '{rule}'")
+
+        parseData = ParseData(text, filename, grammar.rules)
+        parseData.option_hits = {}
+        grammar.rules[rule].match(parseData, 0)
+
+        choices = _find_choices(grammar)
+        for matcher, option_hits in parseData.option_hits.items():
+            key = choices[matcher]
+            hits = self.hits.setdefault(key, [ 0 ] * len(option_hits))
+            for index, count in enumerate(option_hits):
+                hits[index] += count
+
+    def record_file(self, grammar: Grammar, path: str, rule: str) -> None:
+        with open(path, "r") as f:
+            self.record(grammar, f.read(), rule, path)
+
+    def save(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump([ { "rule": name, "path": list(matcher_path), "hits": hits } for (name, matcher_path), hits in self.hits.items() ], f)
+
+    @staticmethod
+    def load(path: str) -> "OptionStatistics":
+        statistics = OptionStatistics()
+        with open(path, "r") as f:
+            for item in json.load(f):
+                statistics.hits[(item["rule"], tuple(item["path"]))] = list(item["hits"])
+        return statistics
+
+def get_option_order(prefixes: list[list[list[tuple[str, str]]]], hits: list[int]) -> list[int]:
+    # The options that were hit most often come first. An option is only
+    # moved in front of another one if they are exclusive, so the first
+    # option that matches is still the same for every text.
+    remaining = list(range(len(prefixes)))
+    order = []
+    while len(remaining) > 0:
+        candidates = []
+        for position, index in enumerate(remaining):
+            if all(_are_exclusive(prefixes[earlier], prefixes[index]) for earlier in remaining[:position]):
+                candidates.append(index)
+        best = max(candidates, key=lambda index: (hits[index], -index))
+        order.append(best)
+        remaining.remove(best)
+    return order
+
+def reorder_options(grammar: Grammar, statistics: OptionStatistics) -> Grammar:
+    # A new grammar in which the options of each choice are tried in the
+    # order given by 'statistics'. Trees stay the same for every text. As
+    # fewer options may be tried, the farthest match and what is expected
+    # there can differ for texts that cannot be parsed completely.
+    rules = copy.deepcopy(dict(grammar.rules))
+
+    # Paths refer to the original order, so all choices are looked up first
+    reorders = []
+    for key, hits in statistics.hits.items():
+        choice = _get_choice(grammar.rules, key)
+        if choice is None or len(choice.options) != len(hits):
+            raise GrammarException(f"Statistics for rule '{key[0]}' do not belong to this grammar")
+
+        order = get_option_order(choice._get_option_prefixes(grammar.rules), hits)
+        if order != list(range(len(order))):
+            reorders.append((_get_choice(rules, key), order))
+
+    for target, order in reorders:
+        target.options = tuple(target.options[index] for index in order)
+
+    return Grammar(rules)
@@ -0,0 +1,183 @@
+import re
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import GrammarSerializer
+from Grammar import Grammar, ParseResult, DEFAULT_SYNC_PATTERN
+from GrammarTools import Position
+from GrammarException import GrammarException
+from GrammarParseTree import ParseTree, ParseTreeNode
+
+# Texts shorter than this are not worth the overhead of worker processes
+DEFAULT_MIN_CHUNK_SIZE = 64 * 1024
+
+# Chunks per worker, more chunks even out differences in how fast they parse
+CHUNKS_PER_WORKER = 4
+
+# Sync points around a seam that both chunks next to it parse. The first and
+# last item of a chunk can be parsed differently than in the middle of the
+# text, e.g. if comments in front of the first item are part of it.
+SEAM_OVERLAP = 3
+
+# Set once per worker process, so the grammar is only sent once
+_worker_grammar: Grammar = None
+
+class TextChunk:
+    def __init__(self, begin: int, window_begin: int, keep_begin: int, keep_end: int, window_end: int, end: int) -> None:
+        # The chunk is parsed from 'begin' to 'end' and contributes the top
+        # level items beginning in [keep_begin, keep_end). The items beginning
+        # in [window_begin, keep_begin) and [keep_end, window_end) are also
+        # parsed by the chunks next to it, both have to agree on them.
+        self.begin = begin
+        self.window_begin = window_begin
+        self.keep_begin = keep_begin
+        self.keep_end = keep_end
+        self.window_end = window_end
+        self.end = end
+
+def _init_worker(grammar: Grammar) -> None:
+    global _worker_grammar
+    _worker_grammar = grammar
+
+def _straddles(tree: ParseTree, index: int) -> bool:
+    return tree.position_begin.index < index < tree.position_end.index
+
+def _parse_chunk(text: str, rule: str, filename: str, chunk: TextChunk) -> tuple[bytes, tuple, tuple, list[str]]:
+    # Returns the serialized tree with the items of the chunk's windows (None
+    # if the chunk could not be parsed completely or an item crosses a seam),
+    # the farthest match and the expected position with what was expected
+    # there. Positions are relative to the chunk, 'text' is only the chunk.
+    try:
+        result = _worker_grammar.apply_to(text, rule, filename)
+    except (GrammarException, RecursionError):
+        return None, None, None, []
+
+    tree = result.tree
+    if not isinstance(tree, ParseTreeNode) or tree.position_end.index < len(text):
+        return None, None, None, []
+
+    keep_begin = chunk.keep_begin - chunk.begin
+    keep_end = chunk.keep_end - chunk.begin
+    if any(_straddles(child, keep_begin) or _straddles(child, keep_end) for child in tree.children):
+        return None, None, None, []
+
+    window_begin = chunk.window_begin - chunk.begin
+    window_end = chunk.window_end - chunk.begin
+    tree.children = [child for child in tree.children if window_begin <= child.position_begin.index < window_end]
+
+    farthest = result.farthest_match_position
+    expected = result.expected_position
+    return (
+        GrammarSerializer.dumps(tree),
+        (farthest.index, farthest.line, farthest.column),
+        None if expected is None else (expected.index, expected.line, expected.column),
+        result.expected,
+    )
+
+def _window_key(children: list[ParseTree], begin: int, end: int) -> bytes:
+    node = ParseTreeNode(Position(0, 0, 0))
+    node.children = [child for child in children if begin <= child.position_begin.index < end]
+    return GrammarSerializer.dumps(node)
+
+def find_chunks(text: str, chunk_count: int, sync_pattern: str = DEFAULT_SYNC_PATTERN, min_chunk_size: int = DEFAULT_MIN_CHUNK_SIZE) -> list[TextChunk]:
+    # Splits 'text' into chunks of about the same size at matches of
+    # 'sync_pattern' that start a line. The items right next to a seam are
+    # used to check that both chunks agree.
+    sync = re.compile(sync_pattern, re.MULTILINE)
+    chunk_size = max(min_chunk_size, len(text) // max(chunk_count, 1))
+
+    def find_sync(index: int) -> int:
+        while index < len(text):
+            match = sync.search(text, index)
+            if match is None:
+                break
+            if match.start() > 0 and text[match.start() - 1] == "\n":
+                return match.start()
+            index = match.start() + 1
+        return len(text)
+
+    chunks = []
+    begin, window_begin, keep_begin = 0, 0, 0
+    index = chunk_size
+    while True:
+        # Sync points in a row, the seam is the one in the middle
+        points = [ find_sync(index) ]
+        for _ in range(2 * SEAM_OVERLAP):
+            points.append(find_sync(points[-1] + 1))
+        seam = points[SEAM_OVERLAP]
+        if len(text) - seam < min_chunk_size // 2 or points[-1] >= len(text):
+            break
+
+        # Newlines in front of a sync point separate two items, the item
+        # in front of 'end' is only parsed to be dropped and needs none of them
+        end = points[-1]
+        while end > points[-2] and text[end - 1] == "\n":
+            end -= 1
+
+        chunks.append(TextChunk(begin, window_begin, keep_begin, seam, points[SEAM_OVERLAP + 1], end))
+        begin, window_begin, keep_begin = points[0], points[SEAM_OVERLAP - 1], seam
+        index = max(keep_begin + chunk_size, points[-1])
+
+    chunks.append(TextChunk(begin, window_begin, keep_begin, len(text), len(text), len(text)))
+
+    return chunks
+
+def apply_parallel(grammar: Grammar, text: str, rule: str, filename: str, sync_pattern: str = DEFAULT_SYNC_PATTERN, workers: int = None, min_chunk_size: int = DEFAULT_MIN_CHUNK_SIZE) -> ParseResult:
+    # Parses the chunks of one large text in worker processes and joins their
+    # items below a single node named 'rule'. Meant for rules that repeat top
+    # level items separated by newlines, like 'GlobalCode' in qinp or 'Code'
+    # in qism. Each chunk is parsed with empty stacks, so 'sync_pattern' must
+    # only match where nothing is pushed. If a chunk does not parse completely
+    # or two chunks disagree at their seam, the whole text is parsed
+    # sequentially instead.
+    if rule not in grammar.rules:
+        raise GrammarException(f"Unknown rule '{rule}'")
+
+    workers = workers if workers is not None else os.cpu_count() or 1
+    chunks = find_chunks(text, workers * CHUNKS_PER_WORKER, sync_pattern, min_chunk_size)
+    if workers < 2 or len(chunks) < 2:
+        return grammar.apply_to(text, rule, filename)
+
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=_init_worker, initargs=(grammar,)) as executor:
+            futures = [executor.submit(_parse_chunk, text[chunk.begin:chunk.end], rule, filename, chunk) for chunk in chunks]
+            results = [future.result() for future in futures]
+    except BrokenProcessPool:
+        return grammar.apply_to(text, rule, filename)
+
+    if any(data is None for data, _, _, _ in results):
+        return grammar.apply_to(text, rule, filename)
+
+    # Chunks begin at the start of a line, so only index and line move
+    trees: list[ParseTreeNode] = []
+    bases: list[Position] = []
+    line = 1
+    line_begin = 0
+    for chunk, (data, _, _, _) in zip(chunks, results):
+        line += text.count("\n", line_begin, chunk.begin)
+        line_begin = chunk.begin
+        bases.append(Position(chunk.begin, line - 1, 0))
+        trees.append(GrammarSerializer.loads(data, base=bases[-1]))
+
+    for i in range(1, len(chunks)):
+        begin, end = chunks[i].window_begin, chunks[i - 1].window_end
+        if _window_key(trees[i - 1].children, begin, end) != _window_key(trees[i].children, begin, end):
+            return grammar.apply_to(text, rule, filename)
+
+    root = ParseTreeNode(Position(0, 1, 1))
+    root.name = rule
+    for chunk, tree in zip(chunks, trees):
+        for child in tree.children:
+            if chunk.keep_begin <= child.position_begin.index < chunk.keep_end:
+                root.add_child(child)
+    root.position_end = trees[-1].position_end
+
+    # Only the last chunk can tell what was expected at the end of the text
+    _, farthest, expected_position, expected = results[-1]
+    base = bases[-1]
+    farthest_match_position = Position(base.index + farthest[0], base.line + farthest[1], farthest[2])
+    if expected_position is not None:
+        expected_position = Position(base.index + expected_position[0], base.line + expected_position[1], expected_position[2])
+
+    return ParseResult(root, farthest_match_position, None, expected_position, expected)
@@ -1,11 +1,48 @@
+import re
 import graphviz
-import itertools
 from abc import ABC, abstractmethod
 from GrammarTools import Position, escape_string
 
-class ParseTree(ABC):
-    __id_iter = itertools.count()
+DOT_WRITE_CHUNK_SIZE = 4096
+
+# Quotes in labels that are not escaped yet, same as graphviz does it
+DOT_UNESCAPED_QUOTE = re.compile(r'(?<!\\)((?:\\\\)*)"')
+
+class ParseEventHandler:
+    def enter(self, name: str, position_begin: Position) -> None:
+        pass
+
+    def leaf(self, value: str, position_begin: Position, position_end: Position) -> None:
+        pass
+
+    def exit(self, name: str, position_end: Position) -> None:
+        pass
 
+class ParseTreeBuilder(ParseEventHandler):
+    # Builds the tree described by a stream of events
+    def __init__(self) -> None:
+        self.tree: ParseTreeNode = None
+        self.__nodes: list[ParseTreeNode] = []
+
+    def enter(self, name: str, position_begin: Position) -> None:
+        node = ParseTreeNode(position_begin)
+        node.name = name
+        if len(self.__nodes) > 0:
+            self.__nodes[-1].children.append(node)
+        else:
+            self.tree = node
+        self.__nodes.append(node)
+
+    def leaf(self, value: str, position_begin: Position, position_end: Position) -> None:
+        self.__nodes[-1].add_child(ParseTreeExactMatch(value, position_begin, position_end))
+
+    def exit(self, name: str, position_end: Position) -> None:
+        node = self.__nodes.pop()
+        node.position_end = position_end
+        if len(self.__nodes) > 0 and self.__nodes[-1].position_end.index < position_end.index:
+            self.__nodes[-1].position_end = position_end
+
+class ParseTree(ABC):
     def __init__(self, position_begin: Position, position_end: Position = None) -> None:
         # TODO: Remove these checks
         if not isinstance(position_begin, Position):
@@ -13,16 +50,60 @@ class ParseTree(ABC):
         if not isinstance(position_end, Position) and position_end is not None:
             raise ValueError
         
-        self.id = next(ParseTree.__id_iter)
         self.position_begin = position_begin
         self.position_end = position_begin if position_end is None else position_end
 
+    @property
+    def id(self) -> int:
+        # Unique as long as the tree is alive. There is no counter shared
+        # between parses, so trees can be built by several threads at once.
+        return id(self)
+
     def to_digraph(self, verbose: bool = True) -> graphviz.Digraph:
         dot = graphviz.Digraph()
         dot.graph_attr["rankdir"] = "LR"
         self._to_digraph(dot, verbose)
         return dot
 
+    def write_dot(self, file, verbose: bool = True, max_depth: int = None, collapse_rules: set[str] = None, select_rule: str = None) -> None:
+        # Writes the same graph as to_digraph without building it in memory.
+        # Nodes deeper than max_depth and children of nodes named in
+        # collapse_rules are left out. With select_rule, only the subtrees
+        # rooted at the outermost nodes with that name are written.
+        collapse_rules = set() if collapse_rules is None else collapse_rules
+
+        lines = [ "digraph {\n", "\tgraph [rankdir=LR]\n" ]
+
+        # Entries are either (tree, depth) or (parent, child) for edges,
+        # pushed so that they are popped in the order _to_digraph visits them.
+        stack: list[tuple] = [ (self, 0) ] if select_rule is None else [ (self, None) ]
+        while len(stack) > 0:
+            first, second = stack.pop()
+
+            if isinstance(first, ParseTree) and isinstance(second, ParseTree):
+                lines.append(f"\t{first.id} -> {second.id}\n")
+            elif second is None:
+                # Still looking for a selected subtree
+                if isinstance(first, ParseTreeNode) and first.name == select_rule:
+                    stack.append((first, 0))
+                elif isinstance(first, ParseTreeNode):
+                    stack.extend((child, None) for child in reversed(first.children))
+            else:
+                label = DOT_UNESCAPED_QUOTE.sub(r'\1\\"', first._get_dot_label(verbose))
+                lines.append(f"\t{first.id} [label=\"{label}\" shape={first._get_dot_shape()}]\n")
+
+                if isinstance(first, ParseTreeNode) and first.name not in collapse_rules and (max_depth is None or second < max_depth):
+                    for child in reversed(first.children):
+                        stack.append((first, child))
+                        stack.append((child, second + 1))
+
+            if len(lines) >= DOT_WRITE_CHUNK_SIZE:
+                file.write("".join(lines))
+                lines = []
+
+        lines.append("}\n")
+        file.write("".join(lines))
+
     def _add_optional_verbose_info(self, text: str, verbose: bool) -> str:
         if verbose:
             text += f"\\n{self.position_begin.line}:{self.position_begin.column}"
@@ -34,6 +115,18 @@ class ParseTree(ABC):
     def _to_digraph(self, dot: graphviz.Digraph, verbose) -> str:
         raise NotImplementedError("ParseTree.__to_digraph() must be implemented by subclasses")
 
+    @abstractmethod
+    def _get_dot_label(self, verbose: bool) -> str:
+        raise NotImplementedError("ParseTree._get_dot_label() must be implemented by subclasses")
+
+    @abstractmethod
+    def _get_dot_shape(self) -> str:
+        raise NotImplementedError("ParseTree._get_dot_shape() must be implemented by subclasses")
+
+    @abstractmethod
+    def _emit_events(self, handler: ParseEventHandler) -> None:
+        raise NotImplementedError("ParseTree._emit_events() must be implemented by subclasses")
+
 class ParseTreeNode(ParseTree):
     def __init__(self, position_begin: Position) -> None:
         super().__init__(position_begin)
@@ -43,7 +136,12 @@ class ParseTreeNode(ParseTree):
     def add_child(self, child: "ParseTree", omit_match: bool = False) -> None:
         if not omit_match:
             if isinstance(child, ParseTreeNode) and child.name is None:
-                self.children.extend(child.children)
+                # Unnamed children are never reused once merged into their
+                # parent, so an empty parent can take over their list.
+                if len(self.children) == 0:
+                    self.children = child.children
+                else:
+                    self.children.extend(child.children)
             else:
                 self.children.append(child)
 
@@ -51,26 +149,70 @@ class ParseTreeNode(ParseTree):
             self.position_end = child.position_end
 
     def _to_digraph(self, dot: graphviz.Digraph, verbose) -> str:
-        text = f"{self.name}"
-        text = self._add_optional_verbose_info(text, verbose)
-        dot.node(str(self.id), text, shape="ellipse")
+        dot.node(str(self.id), self._get_dot_label(verbose), shape=self._get_dot_shape())
 
         for child in self.children:
             child._to_digraph(dot, verbose)
             dot.edge(str(self.id), str(child.id))
 
+    def _get_dot_label(self, verbose: bool) -> str:
+        return self._add_optional_verbose_info(f"{self.name}", verbose)
+
+    def _get_dot_shape(self) -> str:
+        return "ellipse"
+
+    def _emit_events(self, handler: ParseEventHandler) -> None:
+        if self.name is not None:
+            handler.enter(self.name, self.position_begin)
+        for child in self.children:
+            child._emit_events(handler)
+        if self.name is not None:
+            handler.exit(self.name, self.position_end)
+
     def __str__(self) -> str:
         return "".join([str(c) for c in self.children])
 
+class ParseTreeLazyNode(ParseTreeNode):
+    # Placeholder for the node of a lazy rule. Only its extent is known
+    # until 'children' is first accessed, which calls 'parse' to get them.
+    def __init__(self, position_begin: Position, position_end: Position, parse: callable) -> None:
+        super().__init__(position_begin)
+        self.position_end = position_end
+        self.__parse = parse
+
+    @property
+    def is_parsed(self) -> bool:
+        return self.__parse is None
+
+    @property
+    def children(self) -> list[ParseTree]:
+        if self.__parse is not None:
+            parse = self.__parse
+            self.__children = parse()
+            self.__parse = None
+        return self.__children
+
+    @children.setter
+    def children(self, children: list[ParseTree]) -> None:
+        self.__children = children
+        self.__parse = None
+
 class ParseTreeExactMatch(ParseTree):
     def __init__(self, value: str, position_begin: Position, position_end: Position) -> None:
         super().__init__(position_begin, position_end)
         self.value = value
 
     def _to_digraph(self, dot: graphviz.Digraph, verbose) -> str:
-        text = f"\"{escape_string(self.value)}\""
-        text = self._add_optional_verbose_info(text, verbose)
-        dot.node(str(self.id), text, shape="plaintext")
+        dot.node(str(self.id), self._get_dot_label(verbose), shape=self._get_dot_shape())
+
+    def _get_dot_label(self, verbose: bool) -> str:
+        return self._add_optional_verbose_info(f"\"{escape_string(self.value)}\"", verbose)
+
+    def _get_dot_shape(self) -> str:
+        return "plaintext"
+
+    def _emit_events(self, handler: ParseEventHandler) -> None:
+        handler.leaf(self.value, self.position_begin, self.position_end)
 
     def __str__(self) -> str:
         return f"{self.value}"
\ No newline at end of file
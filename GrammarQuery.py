@@ -0,0 +1,280 @@
+import re
+
+from GrammarTools import escape_string
+from GrammarException import GrammarException
+from GrammarParseTree import ParseTree, ParseTreeNode, ParseTreeExactMatch
+
+# Selector syntax:
+#   Name        node with that name
+#   *           any node or string
+#   "value"     string with that value (escape sequences like in grammars)
+#   A B         B somewhere below A
+#   A > B       B directly below A
+#   A, B        A or B
+SELECTOR_TOKEN = re.compile(r'\s*(?:(?P<name>[A-Za-z_][A-Za-z0-9_]*)|(?P<string>"(?:\\.|[^"\\])*")|(?P<symbol>[*>,]))')
+
+COMBINATOR_DESCENDANT = " "
+COMBINATOR_CHILD = ">"
+
+SELECTOR_CACHE_SIZE = 256
+
+UNESCAPE_SEQUENCES = { "a": "\a", "b": "\b", "e": "\x1b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v", "\\": "\\", "'": "'", "\"": "\"" }
+
+class SelectorStep:
+    def __init__(self, combinator: str, name: str = None, value: str = None) -> None:
+        # 'combinator' relates this step to the previous one (None for the first step)
+        self.combinator = combinator
+        self.name = name
+        self.value = value
+
+    def matches(self, tree: ParseTree) -> bool:
+        if self.name is not None:
+            return isinstance(tree, ParseTreeNode) and tree.name == self.name
+        if self.value is not None:
+            return isinstance(tree, ParseTreeExactMatch) and tree.value == self.value
+        return True
+
+    def __str__(self) -> str:
+        if self.name is not None:
+            return self.name
+        if self.value is not None:
+            return f"\"{escape_string(self.value)}\""
+        return "*"
+
+class Selector:
+    def __init__(self, alternatives: list[list[SelectorStep]]) -> None:
+        self.alternatives = alternatives
+
+    def select(self, index: "ParseTreeIndex") -> list[ParseTree]:
+        if len(self.alternatives) == 1:
+            return self.__select_alternative(index, self.alternatives[0])
+
+        found = {}
+        for steps in self.alternatives:
+            for tree in self.__select_alternative(index, steps):
+                found[tree.id] = tree
+        return sorted(found.values(), key=index.get_order)
+
+    def __select_alternative(self, index: "ParseTreeIndex", steps: list[SelectorStep]) -> list[ParseTree]:
+        # The last step is the most selective one to look up, the steps before
+        # it are verified by walking up the parent links of each candidate.
+        last = steps[-1]
+        if last.name is not None:
+            candidates = index.find_all(last.name)
+        elif last.value is not None:
+            candidates = index.find_strings(last.value)
+        else:
+            candidates = index.get_all()
+
+        return [tree for tree in candidates if self.__matches_ancestors(index, tree, steps, len(steps) - 1)]
+
+    def __matches_ancestors(self, index: "ParseTreeIndex", tree: ParseTree, steps: list[SelectorStep], step_index: int) -> bool:
+        if step_index == 0:
+            return True
+
+        step = steps[step_index]
+        previous = steps[step_index - 1]
+
+        parent = index.get_parent(tree)
+        if step.combinator == COMBINATOR_CHILD:
+            return parent is not None and previous.matches(parent) and self.__matches_ancestors(index, parent, steps, step_index - 1)
+
+        while parent is not None:
+            if previous.matches(parent) and self.__matches_ancestors(index, parent, steps, step_index - 1):
+                return True
+            parent = index.get_parent(parent)
+
+        return False
+
+    def __str__(self) -> str:
+        alternatives = []
+        for steps in self.alternatives:
+            text = str(steps[0])
+            for step in steps[1:]:
+                text += f" > {step}" if step.combinator == COMBINATOR_CHILD else f" {step}"
+            alternatives.append(text)
+        return ", ".join(alternatives)
+
+class SelectorCompiler:
+    def __init__(self) -> None:
+        self.__cache: dict[str, Selector] = {}
+
+    def compile(self, text: str) -> Selector:
+        selector = self.__cache.get(text)
+        if selector is None:
+            if len(self.__cache) >= SELECTOR_CACHE_SIZE:
+                self.__cache.clear()
+            selector = self.__compile(text)
+            self.__cache[text] = selector
+        return selector
+
+    def __compile(self, text: str) -> Selector:
+        alternatives = []
+        steps = []
+        combinator = None
+
+        position = 0
+        text = text.rstrip()
+        while position < len(text):
+            match = SELECTOR_TOKEN.match(text, position)
+            if match is None:
+                raise GrammarException(f"Invalid selector '{text}' at offset {position}")
+            position = match.end()
+
+            symbol = match.group("symbol")
+            if symbol == ",":
+                if len(steps) == 0 or combinator is not None:
+                    raise GrammarException(f"Expected selector before ',' in '{text}'")
+                alternatives.append(steps)
+                steps = []
+            elif symbol == ">":
+                if len(steps) == 0 or combinator is not None:
+                    raise GrammarException(f"Expected selector before '>' in '{text}'")
+                combinator = COMBINATOR_CHILD
+            else:
+                if len(steps) > 0 and combinator is None:
+                    combinator = COMBINATOR_DESCENDANT
+                if symbol == "*":
+                    steps.append(SelectorStep(combinator))
+                elif match.group("name") is not None:
+                    steps.append(SelectorStep(combinator, name=match.group("name")))
+                else:
+                    steps.append(SelectorStep(combinator, value=self.__unescape(match.group("string")[1:-1])))
+                combinator = None
+
+        if len(steps) == 0 or combinator is not None:
+            raise GrammarException(f"Incomplete selector '{text}'")
+        alternatives.append(steps)
+
+        return Selector(alternatives)
+
+    def __unescape(self, text: str) -> str:
+        result = ""
+        i = 0
+        while i < len(text):
+            if text[i] != "\\":
+                result += text[i]
+                i += 1
+            elif text[i + 1] == "x":
+                result += chr(int(text[i + 2:i + 4], 16))
+                i += 4
+            elif text[i + 1] in UNESCAPE_SEQUENCES:
+                result += UNESCAPE_SEQUENCES[text[i + 1]]
+                i += 2
+            else:
+                raise GrammarException(f"Unknown escape sequence '\\{text[i + 1]}' in selector")
+        return result
+
+class ParseTreeIndex:
+    __compiler = SelectorCompiler()
+
+    def __init__(self, tree: ParseTree) -> None:
+        self.root = tree
+
+        # All trees in document order. Everything else refers to this order.
+        self.__trees: list[ParseTree] = []
+        self.__order: dict[int, int] = {}
+        self.__parents: list[int] = []
+        self.__depths: list[int] = []
+        self.__subtree_ends: list[int] = []
+        self.__by_name: dict[str, list[ParseTree]] = {}
+        self.__by_value: dict[str, list[ParseTree]] = {}
+
+        self.__build()
+
+    def __build(self) -> None:
+        # Iterative, parse trees can be much deeper than the recursion limit
+        stack: list[tuple[ParseTree, int, int]] = [ (self.root, -1, 0) ]
+        pending_ends: list[int] = []
+        while len(stack) > 0:
+            tree, parent, depth = stack.pop()
+
+            # Every subtree that does not contain this tree is complete now
+            while len(pending_ends) > depth:
+                self.__subtree_ends[pending_ends.pop()] = len(self.__trees)
+
+            order = len(self.__trees)
+            self.__trees.append(tree)
+            self.__order[tree.id] = order
+            self.__parents.append(parent)
+            self.__depths.append(depth)
+            self.__subtree_ends.append(order + 1)
+
+            if isinstance(tree, ParseTreeNode):
+                if tree.name is not None:
+                    self.__by_name.setdefault(tree.name, []).append(tree)
+                pending_ends.append(order)
+                for child in reversed(tree.children):
+                    stack.append((child, order, depth + 1))
+            else:
+                self.__by_value.setdefault(tree.value, []).append(tree)
+
+        for order in pending_ends:
+            self.__subtree_ends[order] = len(self.__trees)
+
+    def select(self, selector: str) -> list[ParseTree]:
+        return ParseTreeIndex.__compiler.compile(selector).select(self)
+
+    def select_one(self, selector: str) -> ParseTree:
+        found = self.select(selector)
+        return found[0] if len(found) > 0 else None
+
+    def find_all(self, name: str) -> list[ParseTree]:
+        return self.__by_name.get(name, [])
+
+    def find_strings(self, value: str) -> list[ParseTree]:
+        return self.__by_value.get(value, [])
+
+    def get_all(self) -> list[ParseTree]:
+        return self.__trees
+
+    def get_order(self, tree: ParseTree) -> int:
+        return self.__order[tree.id]
+
+    def get_parent(self, tree: ParseTree) -> ParseTreeNode:
+        parent = self.__parents[self.__order[tree.id]]
+        return None if parent < 0 else self.__trees[parent]
+
+    def get_depth(self, tree: ParseTree) -> int:
+        return self.__depths[self.__order[tree.id]]
+
+    def get_ancestors(self, tree: ParseTree) -> list[ParseTreeNode]:
+        ancestors = []
+        parent = self.get_parent(tree)
+        while parent is not None:
+            ancestors.append(parent)
+            parent = self.get_parent(parent)
+        return ancestors
+
+    def get_previous_sibling(self, tree: ParseTree) -> ParseTree:
+        order = self.__order[tree.id]
+        parent = self.__parents[order]
+        if parent < 0:
+            return None
+
+        # Siblings follow each other directly, apart from their subtrees
+        sibling_order = parent + 1
+        previous = None
+        while sibling_order < order:
+            previous = self.__trees[sibling_order]
+            sibling_order = self.__subtree_ends[sibling_order]
+        return previous
+
+    def get_next_sibling(self, tree: ParseTree) -> ParseTree:
+        order = self.__order[tree.id]
+        parent = self.__parents[order]
+        if parent < 0:
+            return None
+
+        sibling_order = self.__subtree_ends[order]
+        if sibling_order < self.__subtree_ends[parent]:
+            return self.__trees[sibling_order]
+        return None
+
+    def is_ancestor(self, ancestor: ParseTree, tree: ParseTree) -> bool:
+        order = self.__order[ancestor.id]
+        return order < self.__order[tree.id] < self.__subtree_ends[order]
+
+    def get_descendants(self, tree: ParseTree) -> list[ParseTree]:
+        order = self.__order[tree.id]
+        return self.__trees[order + 1:self.__subtree_ends[order]]
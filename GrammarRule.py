@@ -1,9 +1,12 @@
+import re
 import copy
+import time
 import bisect
+import itertools
 from abc import ABC, abstractmethod
 
 from GrammarParseTree import *
-from GrammarException import GrammarException
+from GrammarException import GrammarException, ParseLimitExceeded
 
 QUANTIFIER_ZERO_OR_ONE = "?"
 QUANTIFIER_ZERO_OR_MORE = "*"
@@ -20,22 +23,145 @@ ACTION_ARG_TYPE_STRING = 0
 ACTION_ARG_TYPE_MATCH = 1
 ACTION_ARG_TYPE_IDENTIFIER = 2
 
+INDENTATION_INDENT = "indent"
+INDENTATION_SAME = "same"
+INDENTATION_DEDENT = "dedent"
+INDENTATION_KINDS = [ INDENTATION_INDENT, INDENTATION_SAME, INDENTATION_DEDENT ]
+
+# Leading characters of a line that count as its indentation, a
+# backslash-newline continues it on the next line
+INDENTATION_PATTERN = re.compile(r"^(?:[ \t]|\\\n)*", re.MULTILINE)
+
+ASSOCIATIVITY_LEFT = "left"
+ASSOCIATIVITY_RIGHT = "right"
+ASSOCIATIVITIES = [ ASSOCIATIVITY_LEFT, ASSOCIATIVITY_RIGHT ]
+
+# Matchers remembered as expected at the farthest failure, more are dropped
+MAX_EXPECTED_MATCHERS = 16
+
+# Names of the groups that emulate atomic groups in token patterns
+_ATOMIC_GROUP_IDS = itertools.count()
+
+def _to_atomic_regex(pattern: str) -> str:
+    # Behaves like '(?>pattern)', which needs Python 3.11. A look-ahead is
+    # never backtracked into, the back-reference then takes what it matched.
+    name = f"_a{next(_ATOMIC_GROUP_IDS)}"
+    return f"(?=(?P<{name}>{pattern}))(?P={name})"
+
+# Steps between two checks of the deadline and the cancellation token
+BUDGET_CHECK_INTERVAL = 4096
+BUDGET_UNLIMITED = float("inf")
+
+# Characters looked at to tell the options of a choice apart
+MAX_PREFIX_LENGTH = 8
+
 TRIGGER_ON_MATCH = "onMatch"
 TRIGGER_ON_FAIL = "onFail"
-ACTION_TRIGGERS = [ TRIGGER_ON_MATCH, TRIGGER_ON_FAIL ]
+# Only used by precedence matchers, when an operator is not followed by an operand
+TRIGGER_ON_MISSING_OPERAND = "onMissingOperand"
+ACTION_TRIGGERS = [ TRIGGER_ON_MATCH, TRIGGER_ON_FAIL, TRIGGER_ON_MISSING_OPERAND ]
+
+class LeftRecursionHead:
+    def __init__(self, index: int) -> None:
+        self.detected = False
+        self.growing = False
+        self.seed_tree: ParseTree = None
+        self.seed_index = index
+        self.seed_length = 0
+        self.recursive_options: set[int] = set()
+        self.base_option = -1
+
+class ChoicePoint:
+    def __init__(self, has_alternatives: bool, can_cut: bool = True) -> None:
+        self.has_alternatives = has_alternatives
+        self.can_cut = can_cut
+        self.cut = False
+
+class CancellationToken:
+    # Can be cancelled from any thread, the parse notices it at its next budget check
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+class ParseBudget:
+    def __init__(self, max_steps: int = None, deadline: float = None, cancellation: CancellationToken = None) -> None:
+        # 'deadline' is a point in time as returned by time.monotonic()
+        self.max_steps = max_steps
+        self.deadline = deadline
+        self.cancellation = cancellation
+
+class ParseProfile:
+    def __init__(self, steps: int, elapsed: float, rule_calls: dict[str, int]) -> None:
+        self.steps = steps
+        self.elapsed = elapsed
+        self.rule_calls = rule_calls
+
+    def get_hottest_rules(self, count: int = 10) -> list[tuple[str, int]]:
+        return sorted(self.rule_calls.items(), key=lambda item: -item[1])[:count]
 
 class ParseData:
-    def __init__(self, text: str, filename: str, rules: dict["Rule"]) -> None:
+    def __init__(self, text: str, filename: str, rules: dict["Rule"], newline_cache: list[int] = None) -> None:
         self.__text = text
         self.__filename = filename
         self.__rules = rules
         self.__stacks = {}
         self.__stack_histories = {}
+        self.__stack_history_offsets = {}
+
+        # Indentation levels form a tree of (indentation, parent) nodes that is
+        # only ever appended to. The current level is a node id, so a checkpoint
+        # and its restore are a single integer. Node 0 is column one.
+        self.__indentation_strings = [ "" ]
+        self.__indentation_parents = [ -1 ]
+        self.indentation = 0
+        self.__line_indentations: dict[int, int] = None
+
+        self.__left_recursion_heads: dict[tuple[str, int], LeftRecursionHead] = {}
+
+        # End of each token rule per index it was tried at, -1 if it did not match
+        self.__token_ends: dict[str, dict[int, int]] = {}
+        # End of the skip pattern per index, a grammar has at most one
+        self.__skip_ends: dict[int, int] = {}
+        self.__choice_points: list[ChoicePoint] = []
+        self.__event_handler: ParseEventHandler = None
+        self.__stream_containers: list[ParseTreeNode] = []
+        self.stream_scope = False
         self.farthest_match_index = -1
+        self.committed_index = 0
+
+        # Terminals and rules that failed at 'expected_index', the farthest
+        # index any of them failed at. Callers only call expect() if they are
+        # not behind it.
+        self.expected_index = -1
+        self.expected_matchers: list["Matcher"] = []
+
+        # Every Matcher.match call is a step. Budgets are only looked at once
+        # 'steps' reaches 'next_budget_check', which never happens without one.
+        self.steps = 0
+        self.next_budget_check = BUDGET_UNLIMITED
+        self.rule_calls: dict[str, int] = None
+        # How often each option of a choice matched, only counted if set
+        self.option_hits: dict["MatcherList", list[int]] = None
+        self.__budget: ParseBudget = None
+        self.__start_time = 0.0
 
         self.__length = len(text)
 
-        self.__gen_newline_cache()
+        # Lazy rules only scan for their extent, see 'Rule.lazy'
+        self.lazy = False
+        # Names of the rules whose nodes are kept, None keeps all of them
+        self.projection: frozenset[str] = None
+
+        # Shared leaf values and positions, None unless interning is enabled
+        self.__interned_strings: dict[str, str] = None
+        self.__interned_positions: dict[int, Position] = None
+
+        if newline_cache is None:
+            self.__gen_newline_cache()
+        else:
+            self.__newline_cache = newline_cache
 
     def has_rule(self, name: str) -> bool:
         return name in self.__rules
@@ -50,6 +176,7 @@ class ParseData:
         if name not in self.__stacks:
             self.__stacks[name] = []
             self.__stack_histories[name] = []
+            self.__stack_history_offsets[name] = 0
 
         return self.__stacks[name]
 
@@ -57,20 +184,181 @@ class ParseData:
         if name not in self.__stacks:
             self.__stacks[name] = []
             self.__stack_histories[name] = []
+            self.__stack_history_offsets[name] = 0
 
         return self.__stack_histories[name]
 
+    def get_indentation(self) -> str:
+        return self.__indentation_strings[self.indentation]
+
+    def push_indentation(self, indentation: str) -> None:
+        self.__indentation_strings.append(indentation)
+        self.__indentation_parents.append(self.indentation)
+        self.indentation = len(self.__indentation_strings) - 1
+
+    def pop_indentation(self) -> bool:
+        if self.indentation == 0:
+            return False
+        self.indentation = self.__indentation_parents[self.indentation]
+        return True
+
+    def get_line_indentation(self, index: int) -> int:
+        # Length of the indentation at 'index', looked up in a table of all
+        # line starts that is built on first use
+        if self.__line_indentations is None:
+            self.__line_indentations = { match.start(): match.end() - match.start() for match in INDENTATION_PATTERN.finditer(self.__text) }
+
+        width = self.__line_indentations.get(index)
+        if width is None:
+            width = INDENTATION_PATTERN.match(self.__text, index).end() - index
+        return width
+
+    def get_left_recursion_head(self, rule_name: str, index: int) -> LeftRecursionHead:
+        return self.__left_recursion_heads.get((rule_name, index))
+
+    def begin_left_recursion_head(self, rule_name: str, index: int) -> LeftRecursionHead:
+        head = LeftRecursionHead(index)
+        self.__left_recursion_heads[(rule_name, index)] = head
+        return head
+
+    def end_left_recursion_head(self, rule_name: str, index: int) -> None:
+        del self.__left_recursion_heads[(rule_name, index)]
+
+    def push_choice_point(self, has_alternatives: bool, can_cut: bool = True) -> ChoicePoint:
+        choice_point = ChoicePoint(has_alternatives, can_cut)
+        self.__choice_points.append(choice_point)
+        return choice_point
+
+    def pop_choice_point(self) -> None:
+        self.__choice_points.pop()
+
+    def cut(self, index: int) -> None:
+        if len(self.__choice_points) > 0 and self.__choice_points[-1].can_cut:
+            self.__choice_points[-1].cut = True
+
+        # Only when no enclosing choice can backtrack anymore, everything
+        # before the cut is final and its bookkeeping can be dropped.
+        for choice_point in self.__choice_points:
+            if choice_point.has_alternatives and not choice_point.cut:
+                return
+
+        self.__commit(index)
+
+    def __commit(self, index: int) -> None:
+        if self.committed_index < index:
+            self.committed_index = index
+
+        for name, history in self.__stack_histories.items():
+            self.__stack_history_offsets[name] += len(history)
+            history.clear()
+
+        # Nothing is matched in front of the committed index anymore, so
+        # memoized ends there would only grow with the length of the text.
+        # Left recursion heads need no eviction, they only live while their
+        # rule is matched.
+        for name, ends in self.__token_ends.items():
+            self.__token_ends[name] = { start: end for start, end in ends.items() if start >= self.committed_index }
+        self.__skip_ends = { start: end for start, end in self.__skip_ends.items() if start >= self.committed_index }
+
+        if self.__event_handler is not None:
+            self.__flush_stream()
+
+    def set_event_handler(self, handler: ParseEventHandler) -> None:
+        self.__event_handler = handler
+        self.stream_scope = handler is not None
+
+    def push_stream_container(self, node: ParseTreeNode) -> None:
+        self.__stream_containers.append(node)
+
+    def pop_stream_container(self) -> None:
+        self.__stream_containers.pop()
+
+    def __flush_stream(self) -> None:
+        # Children of the open containers are complete and, after a commit,
+        # final. The containers are nested in text order, so emitting them
+        # from the outermost to the innermost keeps the events in order.
+        for node in self.__stream_containers:
+            for child in node.children:
+                child._emit_events(self.__event_handler)
+            node.children = []
+
+    def expect(self, index: int, matcher: "Matcher", mark: int = None) -> None:
+        if index > self.expected_index:
+            self.expected_index = index
+            self.expected_matchers.clear()
+        elif mark is not None:
+            # Whatever failed inside a rule is summed up by the rule's name
+            del self.expected_matchers[mark:]
+
+        if len(self.expected_matchers) < MAX_EXPECTED_MATCHERS and matcher not in self.expected_matchers:
+            self.expected_matchers.append(matcher)
+
+    def get_expected(self) -> list[str]:
+        # Different matchers can look the same, e.g. two "(" in different rules
+        return list(dict.fromkeys(matcher._to_string() for matcher in self.expected_matchers))
+
+    def set_budget(self, budget: ParseBudget) -> None:
+        self.__budget = budget
+        self.__start_time = time.monotonic()
+        self.rule_calls = {}
+        self.__schedule_budget_check()
+
+    def check_budget(self) -> None:
+        budget = self.__budget
+
+        if budget.max_steps is not None and self.steps > budget.max_steps:
+            self.__raise_limit_exceeded(f"Parse exceeded the limit of {budget.max_steps} steps")
+        if budget.cancellation is not None and budget.cancellation.cancelled:
+            self.__raise_limit_exceeded("Parse was cancelled")
+        if budget.deadline is not None and time.monotonic() >= budget.deadline:
+            self.__raise_limit_exceeded("Parse exceeded its deadline")
+
+        self.__schedule_budget_check()
+
+    def count_option_hit(self, matcher: "MatcherList", option_index: int) -> None:
+        hits = self.option_hits.get(matcher)
+        if hits is None:
+            hits = [ 0 ] * len(matcher.options)
+            self.option_hits[matcher] = hits
+        hits[option_index] += 1
+
+    def get_profile(self) -> ParseProfile:
+        return ParseProfile(self.steps, time.monotonic() - self.__start_time, dict(self.rule_calls or {}))
+
+    def __schedule_budget_check(self) -> None:
+        budget = self.__budget
+
+        next_check = BUDGET_UNLIMITED
+        if budget.deadline is not None or budget.cancellation is not None:
+            next_check = self.steps + BUDGET_CHECK_INTERVAL
+        if budget.max_steps is not None:
+            next_check = min(next_check, budget.max_steps + 1)
+
+        self.next_budget_check = next_check
+
+    def __raise_limit_exceeded(self, message: str) -> None:
+        raise ParseLimitExceeded(message, self.__filename, self.get_position(max(self.farthest_match_index, 0)), self.get_profile())
+
     def eof(self, index: int) -> bool:
         return index >= self.__length
 
-    def get_checkpoint(self) -> dict[str, int]:
-        return dict(map(lambda name : (name, len(self.__stack_histories[name])), self.__stack_histories.keys()))
+    def get_checkpoint(self) -> tuple[int, dict[str, int]]:
+        if len(self.__stack_histories) == 0:
+            return self.indentation, None
+        return self.indentation, dict(map(lambda name : (name, self.__stack_history_offsets[name] + len(self.__stack_histories[name])), self.__stack_histories.keys()))
     
-    def restore_checkpoint(self, checkpoint: dict[str, int]) -> None:
-        for name, index in checkpoint.items():
+    def restore_checkpoint(self, checkpoint: tuple[int, dict[str, int]]) -> None:
+        self.indentation, stack_checkpoint = checkpoint
+        if stack_checkpoint is None:
+            return
+
+        for name, index in stack_checkpoint.items():
             stack = self.__stacks[name]
             history = self.__stack_histories[name]
-            while len(history) > index:
+            # Committed history is gone. Restoring past it only happens while
+            # a committed parse is failing as a whole.
+            index -= self.__stack_history_offsets[name]
+            while len(history) > max(index, 0):
                 operator, value = history.pop()
                 if operator == "push":
                     stack.pop()
@@ -80,15 +368,135 @@ class ParseData:
                     raise GrammarException(f"Unknown action operator '{operator}'")
 
     def get_position(self, index: int) -> Position:
+        positions = self.__interned_positions
+        if positions is not None:
+            position = positions.get(index)
+            if position is not None:
+                return position
+
         line = bisect.bisect_left(self.__newline_cache, index)
         column = index - self.__newline_cache[line - 1]
-        return Position(index, line, column)
+        position = Position(index, line, column)
+
+        if positions is not None:
+            positions[index] = position
+        return position
+
+    def set_interning(self, interning: bool) -> None:
+        # Leaves with the same value share one string and trees at the same
+        # index one Position. Saves memory for texts that repeat identifiers
+        # and keywords a lot, equal values are also compared by identity
+        # first. Positions are never modified once created.
+        self.__interned_strings = {} if interning else None
+        self.__interned_positions = {} if interning else None
+
+    def is_interning(self) -> bool:
+        return self.__interned_strings is not None
+
+    def intern(self, value: str) -> str:
+        strings = self.__interned_strings
+        if strings is None:
+            return value
+        return strings.setdefault(value, value)
     
     def get_position_string(self, index: int) -> str:
         pos = self.get_position(index)
         return f"{self.__filename}:{pos.line}:{pos.column}"
     
+    def reset_state(self) -> None:
+        # Forgets all matches in progress and the content of the stacks, e.g.
+        # to start over at a later index after a failed or aborted match.
+        for name in self.__stacks:
+            self.__stacks[name].clear()
+            self.__stack_history_offsets[name] += len(self.__stack_histories[name])
+            self.__stack_histories[name].clear()
+        self.indentation = 0
+
+        self.__left_recursion_heads.clear()
+        self.__choice_points.clear()
+        self.__stream_containers.clear()
+        self.stream_scope = self.__event_handler is not None
+
+    def get_state(self) -> tuple[dict[str, tuple[str]], tuple[str]]:
+        # The content of the stacks and the open indentation levels
+        stacks = { name: tuple(stack) for name, stack in self.__stacks.items() if len(stack) > 0 }
+        indentations = []
+        level = self.indentation
+        while level > 0:
+            indentations.append(self.__indentation_strings[level])
+            level = self.__indentation_parents[level]
+        return stacks, tuple(reversed(indentations))
+
+    def get_deferred_parse_data(self) -> callable:
+        # Creates a ParseData for the same text that starts in the current
+        # state. This one, with everything it memoized, is not kept alive.
+        text, filename, rules, newline_cache = self.__text, self.__filename, self.__rules, self.__newline_cache
+        projection = self.projection
+        interning = self.is_interning()
+        stacks, indentations = self.get_state()
+
+        def create() -> ParseData:
+            parseData = ParseData(text, filename, rules, newline_cache)
+            for name, stack in stacks.items():
+                parseData.get_stack(name).extend(stack)
+            for indentation in indentations:
+                parseData.push_indentation(indentation)
+            parseData.lazy = True
+            parseData.projection = projection
+            parseData.set_interning(interning)
+            return parseData
+        return create
+
+    def name_node(self, tree: ParseTreeNode, name: str) -> ParseTreeNode:
+        # Nodes of rules that are not projected away get their name. Others
+        # are replaced by an unnamed node that their parent merges. Their
+        # children were projected already, so their kept descendants are
+        # their named children. Without any, only a leaf of the text is left.
+        # The tree may be a left recursion seed and is not modified then.
+        if self.projection is None or name in self.projection:
+            tree.name = name
+            return tree
+
+        node = ParseTreeNode(tree.position_begin)
+        node.position_end = tree.position_end
+
+        kept = [child for child in tree.children if isinstance(child, ParseTreeNode)]
+        if len(kept) > 0:
+            node.children = kept
+        else:
+            value = "".join([child.value for child in tree.children])
+            if len(value) > 0:
+                node.children = [ ParseTreeExactMatch(self.intern(value), tree.position_begin, tree.position_end) ]
+
+        return node
+
+    def scan_indented_block(self, index: int) -> int:
+        # End of the rest of the line at 'index' and the lines after it that
+        # are indented deeper than the current level, that is, with its
+        # indentation and more. Blank lines in between belong to the block,
+        # blank lines at its end do not.
+        indentation = self.get_indentation()
+        end = self.__text.find("\n", index)
+        if end < 0:
+            return self.__length
+
+        line = end + 1
+        while line < self.__length:
+            line_end = self.__text.find("\n", line)
+            if line_end < 0:
+                line_end = self.__length
+            line_width = self.get_line_indentation(line)
+            if line + line_width < line_end:
+                if line_width <= len(indentation) or not self.__text.startswith(indentation, line):
+                    break
+                end = line_end
+            line = line_end + 1
+
+        return end
+
     def stacks_are_empty(self) -> bool:
+        if self.indentation != 0:
+            return False
         for stack in self.__stacks.values():
             if len(stack) > 0:
                 return False
@@ -111,6 +519,32 @@ class ParseData:
     def __getitem__(self, key) -> str:
         return self.__text[key]
 
+    def match_token(self, name: str, pattern: re.Pattern, index: int) -> int:
+        # Only depends on the text, so every token is scanned at most once
+        # per index however often the parser backtracks over it
+        ends = self.__token_ends.get(name)
+        if ends is None:
+            ends = self.__token_ends[name] = {}
+
+        end = ends.get(index)
+        if end is None:
+            match = pattern.match(self.__text, index)
+            end = -1 if match is None else match.end()
+            ends[index] = end
+        return end
+
+    def skip(self, pattern: re.Pattern, index: int) -> int:
+        # Skipped text between the parts of a skipping rule, see 'Rule.skipping'.
+        # It counts as matched, like the explicit matcher it replaces would.
+        end = self.__skip_ends.get(index)
+        if end is None:
+            match = pattern.match(self.__text, index)
+            end = index if match is None else match.end()
+            self.__skip_ends[index] = end
+        if self.farthest_match_index < end:
+            self.farthest_match_index = end
+        return end
+
 class MatcherInitializers:
     def __init__(self, inverted: bool = False, count_min: int = 1, count_max: int = 1, look_ahead: bool = False, omit_match: bool = False, match_repl: tuple[int, str] = None, actions: dict[str, list[tuple[str, list[tuple[int, None]]]]] = {}) -> None:
         self.inverted      = inverted
@@ -122,6 +556,13 @@ class MatcherInitializers:
         self.actions       = actions
 
 class Matcher(ABC):
+    # Matchers are frozen once a grammar links them, see '_link'
+    __slots__ = ("inverted", "count_min", "count_max", "look_ahead", "omit_match", "match_repl", "actions", "_on_match", "_on_fail", "_replace_match", "_skip_pattern", "_cuts", "_linked")
+
+    # Slots set by '_link', they are not pickled and are set again when the
+    # grammar of an unpickled matcher links it
+    _link_slots = ("_on_match", "_on_fail", "_replace_match", "_skip_pattern", "_cuts", "_linked")
+
     def __init__(self, initializers: MatcherInitializers = MatcherInitializers()) -> None:
         self.inverted      = initializers.inverted
         self.count_min     = initializers.count_min
@@ -131,20 +572,80 @@ class Matcher(ABC):
         self.match_repl    = initializers.match_repl
         self.actions       = copy.deepcopy(initializers.actions)
 
+        # Set by a skipping rule for the matchers of its body
+        self._skip_pattern: re.Pattern = None
+        # Set by the grammar if it contains a cut. Only then choices have to
+        # be tracked, so grammars without cuts match without them.
+        self._cuts = False
+
+        # Compiled again by the grammar once actions are final and rules are known
+        self._compile_actions()
+
+    def __setattr__(self, name: str, value) -> None:
+        if getattr(self, "_linked", False):
+            raise GrammarException(f"Cannot modify '{name}' of matcher '{self}', it belongs to a grammar")
+        super().__setattr__(name, value)
+
+    def __getstate__(self) -> dict:
+        state = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if name.startswith("__"):
+                    name = f"_{cls.__name__}{name}"
+                if name not in self._link_slots and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        self._skip_pattern = None
+        self._cuts = False
+        self._compile_actions()
+
     def match(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
+        parseData.steps += 1
+        if parseData.steps >= parseData.next_budget_check:
+            parseData.check_budget()
+
         old_index = index
         match_count = 0
         checkpoint = parseData.get_checkpoint()
 
+        committed = False
+
         tree = ParseTreeNode(parseData.get_position(index))
+
+        stream_scope = parseData.stream_scope
+        if stream_scope:
+            self._enter_stream_scope(parseData, tree)
+
+        skip_pattern = self._skip_pattern
         while True:
-            sub_tree, sub_index = self._match_specific(parseData, index)
-            sub_tree, sub_index = self._apply_optional_invert(parseData, index, sub_index, sub_tree)
+            # A repetition beyond the minimum count and an inverted match may
+            # fail without failing the matcher, which makes them choice points.
+            choice_point = None
+            if self._cuts and (match_count >= self.count_min or self.inverted):
+                choice_point = parseData.push_choice_point(True, not self.inverted)
+
+            # Text is skipped between repetitions, but only kept skipped if
+            # the repetition after it matches something
+            begin_index = index
+            if skip_pattern is not None and index > old_index:
+                begin_index = parseData.skip(skip_pattern, index)
+
+            sub_tree, sub_index = self._match_specific(parseData, begin_index)
 
-            index = sub_index
+            if choice_point is not None:
+                parseData.pop_choice_point()
+
+            sub_tree, sub_index = self._apply_optional_invert(parseData, begin_index, sub_index, sub_tree)
 
             if sub_tree is None:
+                committed = choice_point is not None and choice_point.cut
                 break
+            if sub_index > begin_index:
+                index = sub_index
             match_count += 1
 
             tree.add_child(sub_tree, self.omit_match)
@@ -152,25 +653,52 @@ class Matcher(ABC):
             if match_count == self.count_max:
                 break
         
-        if match_count < self.count_min:
+        if match_count < self.count_min or committed:
             # TODO: Maybe 'index' should be 'old_index'?
-            self._run_actions_for_trigger(TRIGGER_ON_FAIL, None, parseData, old_index)
+            if self._on_fail is not None:
+                for action in self._on_fail:
+                    action(None, parseData, old_index, old_index)
             parseData.restore_checkpoint(checkpoint)
+            if stream_scope:
+                self._leave_stream_scope(parseData)
             return None, old_index
 
         # TODO: Maybe 'index' should be 'index + length'?
         if parseData.farthest_match_index < index:
             parseData.farthest_match_index = index
 
+        end_index = index
         if self.look_ahead:
             index = old_index
 
         # TODO: Maybe 'index' should be 'old_index'?
-        self._run_actions_for_trigger(TRIGGER_ON_MATCH, tree, parseData, old_index)
+        if self._on_match is not None:
+            for action in self._on_match:
+                action(tree, parseData, old_index, end_index)
+
+        if self._replace_match is not None:
+            tree = self._replace_match(tree, parseData, index)
 
-        tree = self._apply_match_replacement(tree, parseData, index)
+        if stream_scope:
+            self._leave_stream_scope(parseData)
 
         return tree, index
+
+    def _streams_children(self) -> bool:
+        # Matchers that drop, replace or inspect their match need it in one piece.
+        return not (self.inverted or self.omit_match or self.match_repl is not None or len(self.actions) > 0)
+
+    def _enter_stream_scope(self, parseData: ParseData, tree: ParseTreeNode) -> None:
+        if self._streams_children():
+            parseData.push_stream_container(tree)
+        else:
+            parseData.stream_scope = False
+
+    def _leave_stream_scope(self, parseData: ParseData) -> None:
+        if self._streams_children():
+            parseData.pop_stream_container()
+        else:
+            parseData.stream_scope = True
     
     def _initializers_to_python_arg_str(self) -> str:
         args = []
@@ -276,23 +804,87 @@ class Matcher(ABC):
         
         return None, index_old
 
-    def _run_actions_for_trigger(self, trigger_name: str, tree: ParseTreeNode, parseData: ParseData, index: int) -> None:
-        trigger = self.actions.get(trigger_name, [])
-        for (action_name, args) in trigger:
-            args = list(map(lambda arg : arg if arg[0] != ACTION_ARG_TYPE_MATCH else (ACTION_ARG_TYPE_STRING, str(tree)), args))
-            
-            if action_name == "push":
-                self._run_action_push(tree, args, parseData, index)
-            elif action_name == "pop":
-                self._run_action_pop(tree, args, parseData, index)
-            elif action_name == "message":
-                self._run_action_message(tree, args, parseData, index)
-            elif action_name == "fail":
-                self._run_action_fail(tree, args, parseData, index)
-            else:
-                raise GrammarException(f"Unknown action '{action_name}'")
+    def _link(self, rules: dict) -> None:
+        # Called by the grammar once all rules are known. Binds everything
+        # that only depends on the grammar and freezes the matcher.
+        if self._linked:
+            raise GrammarException(f"Matcher '{self}' already belongs to a grammar")
+        for matcher in self._get_sub_matchers():
+            matcher._link(rules)
+        self._compile_actions(rules)
+        self._link_specific(rules)
+        self._linked = True
+
+    def _link_specific(self, rules: dict) -> None:
+        pass
+
+    def _get_sub_matchers(self, rules: dict = None) -> list["Matcher"]:
+        # Matchers this one calls. Rules are only followed if 'rules' is given.
+        return []
+
+    def _compile_actions(self, rules: dict = None) -> None:
+        # Actions are bound to callables taking (tree, parseData, index, end)
+        # once, so a match only calls them. Matchers without actions for a
+        # trigger have None there and skip it.
+        programs = {}
+        for trigger_name, action_list in self.actions.items():
+            if len(action_list) > 0:
+                programs[trigger_name] = [self._compile_action(action_name, args, rules) for action_name, args in action_list]
+
+        self._on_match = programs.get(TRIGGER_ON_MATCH)
+        self._on_fail = programs.get(TRIGGER_ON_FAIL)
+        self._replace_match = self._compile_match_replacement()
+        self._linked = False
+
+    def _compile_action(self, action_name: str, args: list[tuple[int, None]], rules: dict) -> callable:
+        if action_name == "push":
+            return self._compile_action_push(args, rules)
+        elif action_name == "pop":
+            return self._compile_action_pop(args)
+        elif action_name == "message":
+            return self._compile_action_message(args, rules)
+        elif action_name == "fail":
+            return self._compile_action_fail(args, rules)
+        else:
+            raise GrammarException(f"Unknown action '{action_name}'")
+
+    def _compile_action_arg(self, arg: tuple[int, None], rules: dict) -> callable:
+        type_id, value = arg
+
+        if type_id == ACTION_ARG_TYPE_STRING:
+            return lambda tree, parseData, index, end: value
+        elif type_id != ACTION_ARG_TYPE_MATCH:
+            raise GrammarException(f"Unknown action argument type '{type_id}'")
+
+        # The text of the tree is the matched text, unless something inside
+        # drops or replaces part of it
+        if rules is not None and self._match_text_is_span(rules):
+            return lambda tree, parseData, index, end: parseData[index:end]
+        return lambda tree, parseData, index, end: str(tree)
+
+    def _match_text_is_span(self, rules: dict) -> bool:
+        # Skipped text is part of the span but not of the tree. Skipping rules
+        # that are not linked yet have no skip pattern, so their flag is checked.
+        if self.omit_match or self._skip_pattern is not None:
+            return False
+
+        visited = set()
+        pending = self._get_sub_matchers(rules)
+        while len(pending) > 0:
+            matcher = pending.pop()
+            if id(matcher) in visited:
+                continue
+            visited.add(id(matcher))
+
+            if matcher.omit_match or matcher.look_ahead or matcher.match_repl is not None or matcher._skip_pattern is not None:
+                return False
+            if isinstance(matcher, Rule) and matcher.skipping:
+                return False
+            pending.extend(matcher._get_sub_matchers(rules))
 
-    def _run_action_push(self, tree: ParseTreeNode, args: list[tuple[int, None]], parseData: ParseData, index: int) -> None:
+        return True
+
+    def _compile_action_push(self, args: list[tuple[int, None]], rules: dict) -> callable:
         if len(args) != 2:
             raise GrammarException("Wrong number of arguments for action 'push'")
         
@@ -304,20 +896,18 @@ class Matcher(ABC):
         
         stack_name = arg_stack[1]
 
-        if arg_item[0] == ACTION_ARG_TYPE_STRING:
-            value = arg_item[1]
-        elif arg_item[0] == ACTION_ARG_TYPE_IDENTIFIER:
+        if arg_item[0] == ACTION_ARG_TYPE_IDENTIFIER:
             raise GrammarException("Identifier not allowed for action argument 'item'")
-        else:
-            raise GrammarException("Unknown action argument type for 'item'")
-        
-        stack = parseData.get_stack(stack_name)
-        history = parseData.get_stack_history(stack_name)
+        get_value = self._compile_action_arg(arg_item, rules)
 
-        stack.append(value)
-        history.append(("push", value))
+        def push(tree: ParseTreeNode, parseData: ParseData, index: int, end: int) -> None:
+            value = get_value(tree, parseData, index, end)
+            parseData.get_stack(stack_name).append(value)
+            parseData.get_stack_history(stack_name).append(("push", value))
 
-    def _run_action_pop(self, tree: ParseTreeNode, args: list[tuple[int, None]], parseData: ParseData, index: int) -> None:
+        return push
+
+    def _compile_action_pop(self, args: list[tuple[int, None]]) -> callable:
         if len(args) != 1:
             raise GrammarException("Wrong number of arguments for action 'pop'")
         
@@ -328,68 +918,114 @@ class Matcher(ABC):
         
         stack_name = arg_stack[1]
 
-        stack = parseData.get_stack(stack_name)
-        history = parseData.get_stack_history(stack_name)
-
-        if len(stack) == 0:
-            raise GrammarException(f"Cannot pop from empty stack '{stack_name}'")
+        def pop(tree: ParseTreeNode, parseData: ParseData, index: int, end: int) -> None:
+            stack = parseData.get_stack(stack_name)
+            if len(stack) == 0:
+                raise GrammarException(f"Cannot pop from empty stack '{stack_name}'")
+            parseData.get_stack_history(stack_name).append(("pop", stack.pop()))
 
-        value = stack.pop()
-        history.append(("pop", value))
+        return pop
 
-    def _run_action_message(self, tree: ParseTreeNode, args: list[tuple[int, None]], parseData: ParseData, index: int) -> None:
+    def _compile_action_message(self, args: list[tuple[int, None]], rules: dict) -> callable:
         if len(args) != 1:
             raise GrammarException("Wrong number of arguments for action 'message'")
         
-        arg_message = args[0]
-
-        if arg_message[0] != ACTION_ARG_TYPE_STRING:
+        if args[0][0] == ACTION_ARG_TYPE_IDENTIFIER:
             raise GrammarException("Expected string for action argument 'message'")
-        
-        message = arg_message[1]
+        get_message = self._compile_action_arg(args[0], rules)
 
-        print(f"MSG: {parseData.get_position_string(index)}: {message}")
+        def message(tree: ParseTreeNode, parseData: ParseData, index: int, end: int) -> None:
+            print(f"MSG: {parseData.get_position_string(index)}: {get_message(tree, parseData, index, end)}")
 
-    def _run_action_fail(self, tree: ParseTreeNode, args: list[tuple[int, None]], parseData: ParseData, index: int) -> None:
+        return message
+
+    def _compile_action_fail(self, args: list[tuple[int, None]], rules: dict) -> callable:
         if len(args) != 1:
             raise GrammarException("Wrong number of arguments for action 'fail'")
         
-        arg_message = args[0]
-
-        if arg_message[0] != ACTION_ARG_TYPE_STRING:
+        if args[0][0] == ACTION_ARG_TYPE_IDENTIFIER:
             raise GrammarException("Expected string for action argument 'message'")
-        
-        message = arg_message[1]
+        get_message = self._compile_action_arg(args[0], rules)
 
-        raise GrammarException(f"FAIL: {parseData.get_position_string(index)}: {message}")
+        def fail(tree: ParseTreeNode, parseData: ParseData, index: int, end: int) -> None:
+            raise GrammarException(f"FAIL: {parseData.get_position_string(index)}: {get_message(tree, parseData, index, end)}")
 
-    def _apply_match_replacement(self, tree: ParseTree, parseData: ParseData, index: int) -> ParseTree:
-        if self.match_repl is not None:
-            repl_type, repl = self.match_repl
+        return fail
 
-            if repl_type == MATCH_REPL_STRING:
-                tree = ParseTreeExactMatch(repl, parseData.get_position(index))
+    def _compile_match_replacement(self) -> callable:
+        # Bound to a callable taking (tree, parseData, index), None without a replacement
+        if self.match_repl is None:
+            return None
 
-            elif repl_type == MATCH_REPL_STACK:
-                stack_name, stack_index = repl.split(".")
-                stack_index = int(stack_index)
-                
+        repl_type, repl = self.match_repl
+
+        if repl_type == MATCH_REPL_STRING:
+            def replace_with_string(tree: ParseTree, parseData: ParseData, index: int) -> ParseTree:
+                position = parseData.get_position(index)
+                return ParseTreeExactMatch(repl, position, position)
+            return replace_with_string
+
+        elif repl_type == MATCH_REPL_STACK:
+            stack_name, stack_index = repl.split(".")
+            stack_index = int(stack_index)
+
+            def replace_with_stack_item(tree: ParseTree, parseData: ParseData, index: int) -> ParseTree:
                 stack = parseData.get_stack(stack_name)
-                
-                if stack_index < len(stack):
-                    value = stack[-stack_index-1]
-                else:
-                    value = ""
+                value = stack[-stack_index-1] if stack_index < len(stack) else ""
+                position = parseData.get_position(index)
+                return ParseTreeExactMatch(value, position, position)
+            return replace_with_stack_item
+
+        elif repl_type == MATCH_REPL_IDENTIFIER:
+            def replace_name(tree: ParseTree, parseData: ParseData, index: int) -> ParseTree:
+                if not isinstance(tree, ParseTreeNode):
+                    tree.name = repl
+                    return tree
+                return parseData.name_node(tree, repl)
+            return replace_name
 
-                tree = ParseTreeExactMatch(value, parseData.get_position(index))
+        else:
+            raise GrammarException(f"Unknown match replacement type '{repl_type}'")
 
-            elif repl_type == MATCH_REPL_IDENTIFIER:
-                tree.name = repl
+    def _to_regex(self, rules: dict, visiting: set[str], keeps_tree: bool = True) -> str:
+        # A regular expression matching exactly the text this matcher matches,
+        # for token rules. PEG semantics are kept with atomic groups around
+        # choices and repetitions. 'keeps_tree' is False below an inversion,
+        # where only whether something matches is of interest.
+        if self.look_ahead or self.match_repl is not None or any(len(action_list) > 0 for action_list in self.actions.values()):
+            raise GrammarException(f"'{self}' has look-ahead, replacement or actions")
+        if self.omit_match and keeps_tree:
+            raise GrammarException(f"'{self}' omits part of the match")
 
-            else:
-                raise GrammarException(f"Unknown match replacement type '{repl_type}'")
-            
-        return tree
+        pattern = self._to_regex_specific(rules, visiting, keeps_tree and not self.inverted)
+
+        if self.inverted:
+            pattern = f"(?:(?!{pattern})(?s:.))"
+
+        if self.count_min == 1 and self.count_max == 1:
+            return pattern
+        count_max = "" if self.count_max < 0 else str(self.count_max)
+        return _to_atomic_regex(f"(?:{pattern}){{{self.count_min},{count_max}}}")
+
+    def _to_regex_specific(self, rules: dict, visiting: set[str], keeps_tree: bool) -> str:
+        raise GrammarException(f"'{self}' is not regular")
+
+    def _get_prefix(self, rules: dict, visiting: set[str]) -> tuple[list[list[tuple[str, str]]], bool]:
+        # The character ranges of the first characters every match of this
+        # matcher starts with, one list of (first, last) ranges per character,
+        # and whether every match is exactly that long. None if the matcher
+        # can match without consuming text or runs actions, as then options
+        # using it cannot be told apart by their text.
+        if self.inverted or self.look_ahead or self.count_min == 0 or any(len(action_list) > 0 for action_list in self.actions.values()):
+            return None
+
+        prefix = self._get_prefix_specific(rules, visiting)
+        if prefix is None or (self.count_min == 1 and self.count_max == 1):
+            return prefix
+        return prefix[0], False
+
+    def _get_prefix_specific(self, rules: dict, visiting: set[str]) -> tuple[list[list[tuple[str, str]]], bool]:
+        return None
 
     def _has_modifiers(self) -> bool:
         if self.inverted:
@@ -507,11 +1143,18 @@ class Matcher(ABC):
 
 # .
 class MatcherMatchAnyChar(Matcher):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
+    def _to_regex_specific(self, rules: dict, visiting: set[str], keeps_tree: bool) -> str:
+        return "(?s:.)"
+
     def _match_specific(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
         if parseData.eof(index):
+            if index >= parseData.expected_index and not self.inverted:
+                parseData.expect(index, self)
             return None, index
 
         next_index = index + 1
@@ -528,10 +1171,18 @@ class MatcherMatchAnyChar(Matcher):
         return f"std::make_shared<MatcherMatchAnyChar>({self._initializers_to_cpp_arg_str()})"
 
 class MatcherList(Matcher):
+    __slots__ = ("options",)
+
     def __init__(self, options: list[Matcher] = [], *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.options: list[Matcher] = list(options)
 
+    def _get_sub_matchers(self, rules: dict = None) -> list[Matcher]:
+        return list(self.options)
+
+    def _link_specific(self, rules: dict) -> None:
+        self.options = tuple(self.options)
+
     def _generate_python_code_option_list(self) -> str:
         optionStrs = []
         for option in self.options:
@@ -546,22 +1197,61 @@ class MatcherList(Matcher):
 
 # (...)
 class MatcherMatchAll(MatcherList):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
+    def _to_regex_specific(self, rules: dict, visiting: set[str], keeps_tree: bool) -> str:
+        return "(?:" + "".join(option._to_regex(rules, visiting, keeps_tree) for option in self.options) + ")"
+
+    def _get_prefix_specific(self, rules: dict, visiting: set[str]) -> tuple[list[list[tuple[str, str]]], bool]:
+        # Prefixes are joined as long as the parts before have a fixed
+        # length. Skipped text between the parts has none.
+        if len(self.options) == 0:
+            return None
+
+        prefix, fixed = [], True
+        for option in self.options:
+            option_prefix = option._get_prefix(rules, visiting)
+            if option_prefix is None:
+                return (prefix, False) if len(prefix) > 0 else None
+            prefix.extend(option_prefix[0][:MAX_PREFIX_LENGTH - len(prefix)])
+            fixed = option_prefix[1] and len(prefix) < MAX_PREFIX_LENGTH
+            if not fixed or self._skip_pattern is not None:
+                return prefix, fixed and option is self.options[-1]
+        return prefix, fixed
+
     def _match_specific(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
         old_index = index
-        children = []
+        node = ParseTreeNode(parseData.get_position(index))
+
+        stream_scope = parseData.stream_scope
+        if stream_scope:
+            parseData.push_stream_container(node)
+
+        skip_pattern = self._skip_pattern
         for option in self.options:
-            child, index = option.match(parseData, index)
+            # Same as between repetitions, see 'Matcher.match'
+            begin_index = index
+            if skip_pattern is not None and index > old_index:
+                begin_index = parseData.skip(skip_pattern, index)
+
+            child, end_index = option.match(parseData, begin_index)
             if child is None:
+                if stream_scope:
+                    parseData.pop_stream_container()
                 return None, old_index
-            children.append(child)
-
-        node = ParseTreeNode(parseData.get_position(index))
-        for child in children:
+            if end_index > begin_index:
+                index = end_index
             node.add_child(child)
 
+        if stream_scope:
+            parseData.pop_stream_container()
+
+        if node.position_end.index < index:
+            node.position_end = parseData.get_position(index)
+
         return node, index
     
     def _to_string(self) -> str:
@@ -579,14 +1269,56 @@ class MatcherMatchAll(MatcherList):
 
 # [...]
 class MatcherMatchAny(MatcherList):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
 
-    def _match_specific(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
+    def _to_regex_specific(self, rules: dict, visiting: set[str], keeps_tree: bool) -> str:
+        # Atomic, the first option that matches is never given up
+        return _to_atomic_regex("|".join(option._to_regex(rules, visiting, keeps_tree) for option in self.options))
+
+    def _get_prefix_specific(self, rules: dict, visiting: set[str]) -> tuple[list[list[tuple[str, str]]], bool]:
+        prefixes = [option._get_prefix(rules, visiting) for option in self.options]
+        if len(prefixes) == 0 or None in prefixes:
+            return None
+
+        length = min(len(prefix) for prefix, _ in prefixes)
+        prefix = [[char_range for option_prefix, _ in prefixes for char_range in option_prefix[i]] for i in range(length)]
+        fixed = all(option_fixed and len(option_prefix) == length for option_prefix, option_fixed in prefixes)
+        return prefix, fixed
+
+    def _get_option_prefixes(self, rules: dict) -> list[list[list[tuple[str, str]]]]:
+        # The prefix of every option, None where it is unknown
+        visiting = set() if not isinstance(self, Rule) else { self.name }
+        prefixes = []
         for option in self.options:
+            prefix = option._get_prefix(rules, visiting)
+            prefixes.append(None if prefix is None else prefix[0])
+        return prefixes
+
+    def _match_specific(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
+        if not self._cuts:
+            for option_index, option in enumerate(self.options):
+                node, new_index = option.match(parseData, index)
+                if node is not None:
+                    if parseData.option_hits is not None:
+                        parseData.count_option_hit(self, option_index)
+                    return node, new_index
+            return None, index
+
+        choice_point = parseData.push_choice_point(True)
+        for option_index, option in enumerate(self.options):
+            choice_point.has_alternatives = option_index < len(self.options) - 1
             node, new_index = option.match(parseData, index)
             if node is not None:
+                if parseData.option_hits is not None:
+                    parseData.count_option_hit(self, option_index)
+                parseData.pop_choice_point()
                 return node, new_index
+            if choice_point.cut:
+                break
+        parseData.pop_choice_point()
         return None, index
     
     def _to_string(self) -> str:
@@ -604,22 +1336,29 @@ class MatcherMatchAny(MatcherList):
 
 # 'xx'
 class MatcherMatchRange(Matcher):
+    __slots__ = ("first", "last")
+
     def __init__(self, first: str, last: str, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.first = first
         self.last = last
     
     def _match_specific(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
-        if parseData.eof(index):
-            return None, index
-        
-        if parseData[index] < self.first or parseData[index] > self.last:
+        if parseData.eof(index) or parseData[index] < self.first or parseData[index] > self.last:
+            if index >= parseData.expected_index and not self.inverted:
+                parseData.expect(index, self)
             return None, index
 
         next_index = index + 1
 
         return ParseTreeExactMatch(parseData[index], parseData.get_position(index), parseData.get_position(next_index)), next_index
     
+    def _to_regex_specific(self, rules: dict, visiting: set[str], keeps_tree: bool) -> str:
+        return f"[{re.escape(self.first)}-{re.escape(self.last)}]"
+
+    def _get_prefix_specific(self, rules: dict, visiting: set[str]) -> tuple[list[list[tuple[str, str]]], bool]:
+        return [[ (self.first, self.last) ]], True
+
     def _to_string(self) -> str:
         return f"'{self.first}{self.last}'"
 
@@ -631,18 +1370,32 @@ class MatcherMatchRange(Matcher):
 
 # "..."
 class MatcherMatchExact(Matcher):
+    __slots__ = ("value",)
+
     def __init__(self, value: str, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.value = value
         
     def _match_specific(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
         if not parseData.startswith(self.value, index):
+            if index >= parseData.expected_index and not self.inverted:
+                parseData.expect(index, self)
             return None, index
 
         next_index = index + len(self.value)
 
         return ParseTreeExactMatch(self.value, parseData.get_position(index), parseData.get_position(next_index)), next_index
     
+    def _to_regex_specific(self, rules: dict, visiting: set[str], keeps_tree: bool) -> str:
+        if len(self.value) == 0:
+            raise GrammarException("Empty strings match without text")
+        return re.escape(self.value)
+
+    def _get_prefix_specific(self, rules: dict, visiting: set[str]) -> tuple[list[list[tuple[str, str]]], bool]:
+        if len(self.value) == 0:
+            return None
+        return [[ (char, char) ] for char in self.value[:MAX_PREFIX_LENGTH]], len(self.value) <= MAX_PREFIX_LENGTH
+
     def _to_string(self) -> str:
         return f"\"{escape_string(self.value)}\""
     
@@ -653,24 +1406,87 @@ class MatcherMatchExact(Matcher):
         return f"std::make_shared<MatcherMatchExact>(\"{escape_string(self.value)}\", {self._initializers_to_cpp_arg_str()})"
 
 class MatcherMatchRule(Matcher):
+    __slots__ = ("rulename", "_rule", "_names_tree", "_collapses", "_expects")
+
+    _link_slots = Matcher._link_slots + ("_rule", "_names_tree", "_collapses", "_expects")
+
     def __init__(self, rulename: str, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.rulename = rulename
+        self._rule: Rule = None
+
+    def _get_sub_matchers(self, rules: dict = None) -> list[Matcher]:
+        if rules is None or self.rulename not in rules:
+            return []
+        return [ rules[self.rulename] ]
+
+    def _link_specific(self, rules: dict) -> None:
+        # Unknown rules stay unbound and fail when they are matched
+        rule = rules.get(self.rulename)
+        if rule is None:
+            return
+
+        self._rule = rule
+        self._names_tree = not rule.anonymous
+        self._collapses = rule.collapse
+        # Hidden rules are an implementation detail of the grammar and never expected by name
+        self._expects = not rule.anonymous and not self.inverted
+
+    def __setstate__(self, state: dict) -> None:
+        super().__setstate__(state)
+        self._rule = None
 
     def _match_specific(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
-        if not parseData.has_rule(self.rulename):
+        rule = self._rule
+        if rule is None:
             raise GrammarException(f"Rule '{self.rulename}' not found")
-        rule = parseData.get_rule(self.rulename)
+
+        # Expectations added from here on come from inside the rule
+        mark = len(parseData.expected_matchers) if index == parseData.expected_index else 0
+
         tree, index = rule.match(parseData, index)
 
+        # A failed rule leaves the index unchanged
+        if tree is None and index >= parseData.expected_index and self._expects:
+            parseData.expect(index, self, mark)
+
         if isinstance(tree, ParseTreeNode):
-            if not rule.anonymous:
-                tree.name = self.rulename
-            if rule.collapse and len(tree.children) == 1:
+            if self._collapses and len(tree.children) == 1:
                 tree.name = None
+            elif self._names_tree:
+                tree = parseData.name_node(tree, self.rulename)
 
         return tree, index
+
+    def _streams_children(self) -> bool:
+        # The rule's children end up in a node of their own
+        return False
     
+    def _to_regex_specific(self, rules: dict, visiting: set[str], keeps_tree: bool) -> str:
+        rule = rules.get(self.rulename)
+        if rule is None:
+            raise GrammarException(f"Rule '{self.rulename}' not found")
+        if keeps_tree and not rule.anonymous:
+            raise GrammarException(f"Rule '{self.rulename}' adds a node, only hidden rules can be used")
+        if self.rulename in visiting:
+            raise GrammarException(f"Rule '{self.rulename}' is recursive")
+
+        visiting.add(self.rulename)
+        pattern = rule._to_regex(rules, visiting, keeps_tree)
+        visiting.remove(self.rulename)
+        return pattern
+
+    def _get_prefix_specific(self, rules: dict, visiting: set[str]) -> tuple[list[list[tuple[str, str]]], bool]:
+        # Recursion and lazy rules, which match any block in lazy parses, are unknown
+        rule = rules.get(self.rulename)
+        if rule is None or rule.lazy or self.rulename in visiting:
+            return None
+
+        visiting.add(self.rulename)
+        prefix = rule._get_prefix(rules, visiting)
+        visiting.remove(self.rulename)
+        return prefix
+
     def _to_string(self) -> str:
         return self.rulename
     
@@ -681,6 +1497,8 @@ class MatcherMatchRule(Matcher):
         return f"std::make_shared<MatcherMatchRule>(\"{escape_string(self.rulename)}\", {self._initializers_to_cpp_arg_str()})"
 
 class MatcherMatchStack(Matcher):
+    __slots__ = ("stack_name", "index")
+
     def __init__(self, name: str, index: int, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.stack_name = name
@@ -698,6 +1516,8 @@ class MatcherMatchStack(Matcher):
             last_index = index + len(to_match)
             return ParseTreeExactMatch(to_match, parseData.get_position(index), parseData.get_position(last_index)), last_index
 
+        if index >= parseData.expected_index and not self.inverted:
+            parseData.expect(index, self)
         return None, index
     
     def _to_string(self) -> str:
@@ -709,19 +1529,463 @@ class MatcherMatchStack(Matcher):
     def _generate_cpp_code(self) -> str:
         return f"std::make_shared<MatcherMatchStack>(\"{escape_string(self.stack_name)}\", {self.index}, {self._initializers_to_cpp_arg_str()})"
 
+# :indent: :same: :dedent:
+class MatcherMatchIndentation(Matcher):
+    __slots__ = ("kind",)
+
+    def __init__(self, kind: str, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        if kind not in INDENTATION_KINDS:
+            raise GrammarException(f"Unknown indentation matcher '{kind}'")
+        self.kind = kind
+
+    def _match_specific(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
+        # 'indent' takes all indentation if it is the current level's followed
+        # by more and starts a new level, 'same' takes exactly the current
+        # level's indentation and 'dedent' returns to the enclosing level.
+        # Levels are compared as strings, so a tab is never a number of spaces.
+        indentation = parseData.get_indentation()
+
+        if self.kind == INDENTATION_DEDENT:
+            if not parseData.pop_indentation():
+                return None, index
+            return ParseTreeExactMatch("", parseData.get_position(index), parseData.get_position(index)), index
+
+        if not parseData.startswith(indentation, index):
+            width = -1
+        elif self.kind == INDENTATION_INDENT:
+            width = parseData.get_line_indentation(index)
+            if width > len(indentation):
+                parseData.push_indentation(parseData[index:index + width])
+            else:
+                width = -1
+        else:
+            width = len(indentation)
+
+        if width < 0:
+            if index >= parseData.expected_index and not self.inverted:
+                parseData.expect(index, self)
+            return None, index
+
+        next_index = index + width
+        return ParseTreeExactMatch(parseData.intern(parseData[index:next_index]), parseData.get_position(index), parseData.get_position(next_index)), next_index
+
+    def _to_string(self) -> str:
+        return f":{self.kind}:"
+
+    def _generate_python_code(self) -> str:
+        return f"MatcherMatchIndentation(\"{self.kind}\", {self._initializers_to_python_arg_str()})"
+
+    def _generate_cpp_code(self) -> str:
+        return f"std::make_shared<MatcherMatchIndentation>(\"{self.kind}\", {self._initializers_to_cpp_arg_str()})"
+
+# <...>
+class MatcherMatchPrecedence(Matcher):
+    __slots__ = ("operand", "operators", "__operators_by_precedence", "_on_missing_operand")
+
+    _link_slots = Matcher._link_slots + ("_on_missing_operand",)
+
+    def __init__(self, operand: Matcher, operators: list[tuple[int, str, str, Matcher]] = [], *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.operand = operand
+        self.operators: list[tuple[int, str, str, Matcher]] = list(operators)
+
+        # Operators are tried from the highest to the lowest precedence, the
+        # same order a chain of one rule per precedence level would use.
+        self.__operators_by_precedence = sorted(self.operators, key=lambda operator: -operator[0])
+
+    def _get_sub_matchers(self, rules: dict = None) -> list[Matcher]:
+        return [ self.operand ] + [ operator for _, _, _, operator in self.operators ]
+
+    def _compile_actions(self, rules: dict = None) -> None:
+        super()._compile_actions(rules)
+        actions = self.actions.get(TRIGGER_ON_MISSING_OPERAND, [])
+        self._on_missing_operand = [ self._compile_action(action_name, args, rules) for action_name, args in actions ] if len(actions) > 0 else None
+
+    def _link_specific(self, rules: dict) -> None:
+        self.operators = tuple(self.operators)
+        self.__operators_by_precedence = tuple(self.__operators_by_precedence)
+
+    def _get_prefix_specific(self, rules: dict, visiting: set[str]) -> tuple[list[list[tuple[str, str]]], bool]:
+        prefix = self.operand._get_prefix(rules, visiting)
+        return None if prefix is None else (prefix[0], False)
+
+    def _match_specific(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
+        tree, index = self.operand.match(parseData, index)
+        if tree is None:
+            return None, index
+
+        # Nodes still waiting for their last operand, as (precedence, name, children).
+        # Precedences strictly increase towards the end of the list.
+        open_nodes: list[tuple[int, str, list[ParseTree]]] = []
+
+        skip_pattern = self._skip_pattern
+        while True:
+            checkpoint = parseData.get_checkpoint()
+            missing_operand = -1
+            # Ending the chain is always possible, so cuts cannot leave the operator.
+            if self._cuts:
+                parseData.push_choice_point(True, False)
+            operator_begin = index if skip_pattern is None else parseData.skip(skip_pattern, index)
+            for precedence, associativity, name, operator in self.__operators_by_precedence:
+                operator_tree, operator_index = operator.match(parseData, operator_begin)
+                if operator_tree is None:
+                    continue
+
+                operand_begin = operator_index if skip_pattern is None else parseData.skip(skip_pattern, operator_index)
+                operand_tree, operand_index = self.operand.match(parseData, operand_begin)
+                if operand_tree is None:
+                    if missing_operand < 0:
+                        missing_operand = operand_begin
+                    parseData.restore_checkpoint(checkpoint)
+                    continue
+
+                break
+            else:
+                if self._cuts:
+                    parseData.pop_choice_point()
+                # Only reported if no other operator continues the chain
+                if missing_operand >= 0 and self._on_missing_operand is not None:
+                    for action in self._on_missing_operand:
+                        action(None, parseData, missing_operand, missing_operand)
+                break
+            if self._cuts:
+                parseData.pop_choice_point()
+
+            while len(open_nodes) > 0 and open_nodes[-1][0] > precedence:
+                tree = self.__close_node(parseData, open_nodes.pop(), tree)
+
+            if len(open_nodes) > 0 and open_nodes[-1][0] == precedence and associativity == ASSOCIATIVITY_LEFT:
+                open_nodes[-1][2].extend([tree, operator_tree])
+            else:
+                open_nodes.append((precedence, name, [tree, operator_tree]))
+
+            tree = operand_tree
+            index = operand_index
+
+        while len(open_nodes) > 0:
+            tree = self.__close_node(parseData, open_nodes.pop(), tree)
+
+        return tree, index
+
+    def _streams_children(self) -> bool:
+        # Operands are regrouped into new nodes once the chain is complete
+        return False
+
+    def __close_node(self, parseData: ParseData, open_node: tuple[int, str, list[ParseTree]], last_operand: ParseTree) -> ParseTreeNode:
+        _, name, children = open_node
+
+        node = ParseTreeNode(children[0].position_begin)
+        for child in children:
+            node.add_child(child)
+        node.add_child(last_operand)
+
+        return parseData.name_node(node, name)
+
+    def _to_string(self) -> str:
+        operators = []
+        for precedence, associativity, name, operator in self.operators:
+            operators.append(f"{precedence} {associativity} {name}: {operator}")
+        return f"<{self.operand} {' '.join(operators)}>"
+
+    def _generate_python_code(self) -> str:
+        operators = []
+        for precedence, associativity, name, operator in self.operators:
+            operators.append(f"({precedence}, \"{escape_string(associativity)}\", \"{escape_string(name)}\", {operator._generate_python_code()})")
+        return f"MatcherMatchPrecedence({self.operand._generate_python_code()}, [{', '.join(operators)}], {self._initializers_to_python_arg_str()})"
+
+    def _generate_cpp_code(self) -> str:
+        operators = []
+        for precedence, associativity, name, operator in self.operators:
+            if associativity == ASSOCIATIVITY_LEFT:
+                associativity_str = "Left"
+            elif associativity == ASSOCIATIVITY_RIGHT:
+                associativity_str = "Right"
+            else:
+                raise GrammarException(f"Unknown associativity '{associativity}'")
+            operators.append(f"MatcherMatchPrecedence::Operator{{ {precedence}, MatcherMatchPrecedence::Associativity::{associativity_str}, \"{escape_string(name)}\", {operator._generate_cpp_code()} }}")
+        return f"std::make_shared<MatcherMatchPrecedence>({self.operand._generate_cpp_code()}, std::vector<MatcherMatchPrecedence::Operator>({{ {', '.join(operators)} }}), {self._initializers_to_cpp_arg_str()})"
+
+# ^
+class MatcherCut(Matcher):
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+    def _match_specific(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
+        parseData.cut(index)
+        return ParseTreeNode(parseData.get_position(index)), index
+
+    def _to_string(self) -> str:
+        return "^"
+
+    def _generate_python_code(self) -> str:
+        return f"MatcherCut({self._initializers_to_python_arg_str()})"
+
+    def _generate_cpp_code(self) -> str:
+        return f"std::make_shared<MatcherCut>({self._initializers_to_cpp_arg_str()})"
+
 class Rule(MatcherMatchAny):
-    def __init__(self, name=None, anonymous=False, fuse_children=False, collapse=False, *args, **kwargs) -> None:
+    __slots__ = ("name", "anonymous", "fuse_children", "collapse", "token", "skip", "skipping", "lazy", "comment", "_token_pattern", "_comment_pattern")
+
+    _link_slots = Matcher._link_slots + ("_token_pattern", "_comment_pattern")
+
+    def __init__(self, name=None, anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.name = name
         self.anonymous = anonymous
         self.fuse_children = fuse_children
         self.collapse = collapse
+        self.token = token
+        # The text matched by the grammar's 'skip' rule is skipped between
+        # the parts of 'skipping' rules, e.g. whitespace between tokens.
+        # Rules they refer to only skip if they are skipping themselves.
+        self.skip = skip
+        self.skipping = skipping
+        # In lazy parses, the rule only scans for the indented block at its
+        # start and its node is parsed once its children are accessed
+        self.lazy = lazy
+        # Comments after the last item of a lazy rule are left to the
+        # enclosing rules, so lazy blocks ending in one are parsed right away
+        self.comment = comment
+        self._token_pattern: re.Pattern = None
+        self._comment_pattern: re.Pattern = None
+
+    def __setstate__(self, state: dict) -> None:
+        super().__setstate__(state)
+        self._token_pattern = None
+        self._comment_pattern = None
+
+    def _link(self, rules: dict) -> None:
+        # The body is frozen once linked, so the skip pattern is set first
+        if self.skipping and not self._linked:
+            skip_pattern = self.__compile_skip_pattern(rules)
+            matchers = [ self ]
+            while len(matchers) > 0:
+                matcher = matchers.pop()
+                matcher._skip_pattern = skip_pattern
+                matchers.extend(matcher._get_sub_matchers())
+        super()._link(rules)
+
+    def __compile_skip_pattern(self, rules: dict) -> re.Pattern:
+        skip_rules = [ rule for rule in rules.values() if rule.skip ]
+        if len(skip_rules) != 1:
+            raise GrammarException(f"Rule '{self.name}' is skipping, but the grammar has {len(skip_rules)} skip rules instead of one")
+
+        # Only the end of the skipped text matters, not its tree
+        skip_rule = skip_rules[0]
+        try:
+            return re.compile(skip_rule._to_regex(rules, { skip_rule.name }, False))
+        except (GrammarException, re.error) as e:
+            raise GrammarException(f"Rule '{skip_rule.name}' cannot be skipped: {e}")
+
+    def __compile_comment_pattern(self, rules: dict) -> re.Pattern:
+        # Matches a comment and spaces at the end of a block
+        patterns = []
+        for rule in rules.values():
+            if rule.comment:
+                try:
+                    patterns.append(rule._to_regex(rules, { rule.name }, False))
+                except (GrammarException, re.error) as e:
+                    raise GrammarException(f"Rule '{rule.name}' cannot be a comment: {e}")
+        return re.compile("(?:" + "|".join(patterns + [ "" ]) + ")[ \\t]*\\Z")
+
+    def _link_specific(self, rules: dict) -> None:
+        super()._link_specific(rules)
+
+        if self.lazy and (self.anonymous or self.fuse_children or self.collapse or self.token):
+            raise GrammarException(f"Rule '{self.name}' cannot be lazy, it needs a node of its own that stays as it is")
+        if self.lazy:
+            self._comment_pattern = self.__compile_comment_pattern(rules)
+
+        # Tokens are matched by a single regular expression. Their tree is
+        # the same as if the rule was fused: a node with a leaf of the text.
+        if self.token:
+            try:
+                self._token_pattern = re.compile(self._to_regex(rules, { self.name }))
+            except (GrammarException, re.error) as e:
+                raise GrammarException(f"Rule '{self.name}' cannot be a token: {e}")
+
+    def _to_regex_specific(self, rules: dict, visiting: set[str], keeps_tree: bool) -> str:
+        # A single pattern cannot skip between the parts it matches
+        if self.skipping:
+            raise GrammarException(f"Rule '{self.name}' is skipping")
+        return super()._to_regex_specific(rules, visiting, keeps_tree)
 
     def match(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
+        # A rule entered again at the same index can only be left recursion.
+        # The inner invocation returns the current seed (initially a failure)
+        # and the outer invocation grows it until it stops getting longer.
+        if parseData.rule_calls is not None:
+            parseData.rule_calls[self.name] = parseData.rule_calls.get(self.name, 0) + 1
+
+        if self._token_pattern is not None:
+            return self.__match_token(parseData, index)
+
+        # Lazy nodes that are projected away would be parsed right away
+        if self.lazy and parseData.lazy and (parseData.projection is None or self.name in parseData.projection):
+            return self.__match_lazy(parseData, index)
+
+        return self.__match_rule(parseData, index)
+
+    def __match_rule(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
+        head = parseData.get_left_recursion_head(self.name, index)
+        if head is not None:
+            head.detected = True
+            if head.seed_tree is not None:
+                # Undo anything a previous (failed) use appended to the seed
+                del head.seed_tree.children[head.seed_length:]
+            return head.seed_tree, head.seed_index
+
+        head = parseData.begin_left_recursion_head(self.name, index)
+        tree, new_index = self.__match_once(parseData, index)
+        if head.detected:
+            tree, new_index = self.__grow_seed(head, tree, new_index, parseData, index)
+        parseData.end_left_recursion_head(self.name, index)
+
+        return tree, new_index
+
+    def _match_specific(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
+        head = parseData.get_left_recursion_head(self.name, index)
+        choice_point = parseData.push_choice_point(True) if self._cuts else None
+
+        if head.growing:
+            # Options that did not recurse cannot produce a longer match, so
+            # only the left recursive ones are retried. Reaching the option
+            # the seed originated from ends the growth.
+            for option_index, option in enumerate(self.options):
+                if option_index in head.recursive_options:
+                    node, new_index = option.match(parseData, index)
+                    if node is not None:
+                        if choice_point is not None:
+                            parseData.pop_choice_point()
+                        return node, new_index
+                    if choice_point is not None and choice_point.cut:
+                        break
+                elif option_index == head.base_option:
+                    break
+            if choice_point is not None:
+                parseData.pop_choice_point()
+            return None, index
+
+        for option_index, option in enumerate(self.options):
+            if choice_point is not None:
+                choice_point.has_alternatives = option_index < len(self.options) - 1
+
+            detected = head.detected
+            head.detected = False
+            node, new_index = option.match(parseData, index)
+            if head.detected:
+                head.recursive_options.add(option_index)
+            head.detected = head.detected or detected
+
+            if node is not None:
+                if parseData.option_hits is not None:
+                    parseData.count_option_hit(self, option_index)
+                head.base_option = option_index
+                if choice_point is not None:
+                    parseData.pop_choice_point()
+                return node, new_index
+            if choice_point is not None and choice_point.cut:
+                break
+        if choice_point is not None:
+            parseData.pop_choice_point()
+        return None, index
+
+    def _streams_children(self) -> bool:
+        return not self.fuse_children and not self.token and super()._streams_children()
+
+    def __match_token(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
+        parseData.steps += 1
+        if parseData.steps >= parseData.next_budget_check:
+            parseData.check_budget()
+
+        end = parseData.match_token(self.name, self._token_pattern, index)
+        if end < 0:
+            return None, index
+
+        node = ParseTreeNode(parseData.get_position(index))
+        if end > index:
+            node.add_child(ParseTreeExactMatch(parseData.intern(parseData[index:end]), node.position_begin, parseData.get_position(end)))
+
+        if parseData.farthest_match_index < end:
+            parseData.farthest_match_index = end
+
+        return node, end
+
+    def __match_lazy(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
+        # Always matches, whether the block really is what the rule matches
+        # is only found out when it is parsed
+        parseData.steps += 1
+        if parseData.steps >= parseData.next_budget_check:
+            parseData.check_budget()
+
+        end = parseData.scan_indented_block(index)
+        create_parse_data = parseData.get_deferred_parse_data()
+
+        # The enclosing rules take spaces and comments after the last item,
+        # so a block that may end in them is parsed to find where the rule ends
+        if self._comment_pattern.search(parseData[index:end]).start() < end - index:
+            tree, new_index = self.__match_rule(create_parse_data(), index)
+            if tree is not None and new_index < end:
+                end = new_index
+
+        def parse() -> list[ParseTree]:
+            return self.__parse_lazy(create_parse_data(), index, end)
+
+        if parseData.farthest_match_index < end:
+            parseData.farthest_match_index = end
+
+        return ParseTreeLazyNode(parseData.get_position(index), parseData.get_position(end), parse), end
+
+    def __parse_lazy(self, parseData: ParseData, index: int, end: int) -> list[ParseTree]:
+        # The parent already continued after the block, so text at its end
+        # that the rule does not match would be missing from the tree
+        state = parseData.get_state()
+        tree, new_index = self.__match_rule(parseData, index)
+
+        if tree is None:
+            raise GrammarException(f"{parseData.get_position_string(max(parseData.farthest_match_index, index))}: Lazy rule '{self.name}' does not match its block")
+        if new_index > end:
+            raise GrammarException(f"{parseData.get_position_string(end)}: Lazy rule '{self.name}' matches beyond its block")
+        if new_index < end:
+            raise GrammarException(f"{parseData.get_position_string(max(parseData.farthest_match_index, new_index))}: Lazy rule '{self.name}' does not match its whole block")
+        if parseData.get_state() != state:
+            raise GrammarException(f"{parseData.get_position_string(new_index)}: Lazy rule '{self.name}' changes the stacks or the indentation")
+
+        if isinstance(tree, ParseTreeNode):
+            return tree.children
+        return [ tree ]
+
+    def __match_once(self, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
         tree, index = super().match(parseData, index)
-        if self.fuse_children:
-            self.__fuse_children(tree)
+        if self.fuse_children or self.token:
+            self.__fuse_children(parseData, tree)
         return tree, index
+
+    def __grow_seed(self, head: LeftRecursionHead, tree: ParseTree, new_index: int, parseData: ParseData, index: int) -> tuple[ParseTree, int]:
+        head.growing = True
+        while tree is not None:
+            head.seed_tree = tree
+            head.seed_index = new_index
+            head.seed_length = len(tree.children)
+
+            # The current seed stays a valid result, whatever the growth does.
+            checkpoint = parseData.get_checkpoint()
+            if self._cuts:
+                parseData.push_choice_point(True, False)
+            grown_tree, grown_index = self.__match_once(parseData, index)
+            if self._cuts:
+                parseData.pop_choice_point()
+            if grown_tree is None or grown_index <= new_index:
+                parseData.restore_checkpoint(checkpoint)
+                del tree.children[head.seed_length:]
+                break
+
+            tree, new_index = grown_tree, grown_index
+
+        return tree, new_index
     
     def _generate_python_code(self) -> str:
         args = []
@@ -729,6 +1993,11 @@ class Rule(MatcherMatchAny):
         args.append(f"anonymous={self.anonymous}")
         args.append(f"fuse_children={self.fuse_children}")
         args.append(f"collapse={self.collapse}")
+        args.append(f"token={self.token}")
+        args.append(f"skip={self.skip}")
+        args.append(f"skipping={self.skipping}")
+        args.append(f"lazy={self.lazy}")
+        args.append(f"comment={self.comment}")
         args.append(f"options={self._generate_python_code_option_list()}")
         return f"Rule({', '.join(args)}, {self._initializers_to_python_arg_str()})"
 
@@ -743,29 +2012,52 @@ class Rule(MatcherMatchAny):
             flags |= (1 << 1)
         if self.collapse:
             flags |= (1 << 2)
+        if self.token:
+            flags |= (1 << 3)
+        if self.skip:
+            flags |= (1 << 4)
+        if self.skipping:
+            flags |= (1 << 5)
+        if self.lazy:
+            flags |= (1 << 6)
+        if self.comment:
+            flags |= (1 << 7)
         return f"Flags<Rule::Flags>::from_raw({flags})"
 
-    def __fuse_children(self, tree: ParseTree) -> None:
+    def __fuse_children(self, parseData: ParseData, tree: ParseTree) -> None:
         if tree is None:
             return
         if not isinstance(tree, ParseTreeNode):
             return
         
-        i = 0
-        leafID = -1
-        while i < len(tree.children):
-            if isinstance(tree.children[i], ParseTreeExactMatch):
-                if leafID < 0:
-                    leafID = i
-                else:
-                    tree.children[leafID].value += tree.children[i].value
-                    if tree.children[leafID].position_end.index < tree.children[i].position_end.index:
-                        tree.children[leafID].position_end = tree.children[i].position_end
-                    tree.children.pop(i)
-                    i -= 1
-            else:
-                leafID = -1
-            i += 1
+        # Leaves may be shared with a left recursion seed, so runs of leaves
+        # are fused into new leaves instead of being modified in place.
+        children = []
+        leaves = []
+        for child in tree.children:
+            if isinstance(child, ParseTreeExactMatch):
+                leaves.append(child)
+                continue
+            self.__fuse_leaves(parseData, leaves, children)
+            leaves = []
+            children.append(child)
+        self.__fuse_leaves(parseData, leaves, children)
+
+        tree.children = children
+
+    def __fuse_leaves(self, parseData: ParseData, leaves: list[ParseTreeExactMatch], children: list[ParseTree]) -> None:
+        if len(leaves) == 0:
+            return
+        if len(leaves) == 1:
+            children.append(leaves[0])
+            return
+
+        position_end = leaves[0].position_end
+        for leaf in leaves:
+            if position_end.index < leaf.position_end.index:
+                position_end = leaf.position_end
+
+        children.append(ParseTreeExactMatch(parseData.intern("".join([leaf.value for leaf in leaves])), leaves[0].position_begin, position_end))
 
     def __str__(self) -> str:
         modifiers = []
@@ -775,6 +2067,16 @@ class Rule(MatcherMatchAny):
             modifiers.append("fuse")
         if self.collapse:
             modifiers.append("collapse")
+        if self.token:
+            modifiers.append("token")
+        if self.skip:
+            modifiers.append("skip")
+        if self.skipping:
+            modifiers.append("skipping")
+        if self.lazy:
+            modifiers.append("lazy")
+        if self.comment:
+            modifiers.append("comment")
         
         name = self.name
         if len(modifiers) > 0:
@@ -0,0 +1,371 @@
+import json
+import mmap
+import hashlib
+
+from GrammarTools import Position
+from GrammarException import GrammarException
+from GrammarParseTree import ParseTree, ParseTreeNode, ParseTreeExactMatch
+
+# Layout (all integers are LEB128 varints, signed ones zigzag encoded):
+#   magic, version, flags, [sha256 of the source text]
+#   string count, (byte length, utf-8 bytes)*  -> rule names and leaf values
+#   root record
+# Record:
+#   tag = (string reference << 1) | kind
+#   begin = index and line relative to the parent's begin, absolute column
+#   end = index and line relative to the own begin, absolute column
+#   nodes only: child count, byte size of the children, children
+# The byte size allows readers to skip subtrees without decoding them.
+
+MAGIC = b"QPT"
+FORMAT_VERSION = 1
+
+FLAG_SOURCE_HASH = 1 << 0
+
+RECORD_NODE = 0
+RECORD_LEAF = 1
+
+SOURCE_HASH_SIZE = 32
+
+def hash_source(source: str) -> bytes:
+    return hashlib.sha256(source.encode("utf-8")).digest()
+
+class ParseTreeWriter:
+    def __init__(self) -> None:
+        self.__strings: dict[str, int] = {}
+
+    def write(self, tree: ParseTree, source: str = None) -> bytes:
+        self.__strings = {}
+        records = self.__encode_records(tree)
+
+        result = bytearray(MAGIC)
+        self.__write_varint(result, FORMAT_VERSION)
+        self.__write_varint(result, 0 if source is None else FLAG_SOURCE_HASH)
+        if source is not None:
+            result += hash_source(source)
+
+        self.__write_varint(result, len(self.__strings))
+        for string in self.__strings:
+            encoded = string.encode("utf-8")
+            self.__write_varint(result, len(encoded))
+            result += encoded
+
+        for header, child_count, children_size in records:
+            result += header
+            if child_count >= 0:
+                self.__write_varint(result, child_count)
+                self.__write_varint(result, children_size)
+
+        return bytes(result)
+
+    def __encode_records(self, tree: ParseTree) -> list[tuple[bytearray, int, int]]:
+        # Without recursion, so trees of any depth can be written. Records
+        # are encoded in document order first, then the byte sizes of the
+        # children are summed up from the back. Returns the encoded record
+        # without its child count and size, the child count (-1 for leaves)
+        # and the size of the children for every record in document order.
+        headers: list[bytearray] = []
+        parents: list[int] = []
+        child_counts: list[int] = []
+        stack = [ (tree, Position(0, 0, 0), -1) ]
+        while len(stack) > 0:
+            tree, parent_begin, parent = stack.pop()
+            headers.append(self.__encode_header(tree, parent_begin))
+            parents.append(parent)
+            if isinstance(tree, ParseTreeNode):
+                child_counts.append(len(tree.children))
+                index = len(headers) - 1
+                stack.extend((child, tree.position_begin, index) for child in reversed(tree.children))
+            else:
+                child_counts.append(-1)
+
+        children_sizes = [ 0 ] * len(headers)
+        for index in range(len(headers) - 1, -1, -1):
+            size = len(headers[index])
+            if child_counts[index] >= 0:
+                size += self.__get_varint_size(child_counts[index]) + self.__get_varint_size(children_sizes[index]) + children_sizes[index]
+            if parents[index] >= 0:
+                children_sizes[parents[index]] += size
+
+        return list(zip(headers, child_counts, children_sizes))
+
+    def __encode_header(self, tree: ParseTree, parent_begin: Position) -> bytearray:
+        result = bytearray()
+
+        if isinstance(tree, ParseTreeNode):
+            reference = 0 if tree.name is None else self.__get_string_index(tree.name) + 1
+            self.__write_varint(result, (reference << 1) | RECORD_NODE)
+        elif isinstance(tree, ParseTreeExactMatch):
+            self.__write_varint(result, (self.__get_string_index(tree.value) << 1) | RECORD_LEAF)
+        else:
+            raise GrammarException(f"Cannot serialize tree of type '{type(tree).__name__}'")
+
+        self.__write_position(result, tree.position_begin, parent_begin)
+        self.__write_varint(result, tree.position_end.index - tree.position_begin.index)
+        self.__write_varint(result, tree.position_end.line - tree.position_begin.line)
+        self.__write_varint(result, tree.position_end.column)
+
+        return result
+
+    def __write_position(self, result: bytearray, position: Position, base: Position) -> None:
+        self.__write_varint(result, self.__zigzag(position.index - base.index))
+        self.__write_varint(result, self.__zigzag(position.line - base.line))
+        self.__write_varint(result, position.column)
+
+    def __get_string_index(self, string: str) -> int:
+        index = self.__strings.get(string)
+        if index is None:
+            index = len(self.__strings)
+            self.__strings[string] = index
+        return index
+
+    def __zigzag(self, value: int) -> int:
+        return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+    def __get_varint_size(self, value: int) -> int:
+        return max(1, (value.bit_length() + 6) // 7)
+
+    def __write_varint(self, result: bytearray, value: int) -> None:
+        while value >= 0x80:
+            result.append((value & 0x7F) | 0x80)
+            value >>= 7
+        result.append(value)
+
+class ParseTreeRecord:
+    def __init__(self, reader: "ParseTreeReader", offset: int, parent_begin: Position) -> None:
+        self.__reader = reader
+
+        tag, offset = reader._read_varint(offset)
+        self.is_leaf = (tag & 1) == RECORD_LEAF
+        reference = tag >> 1
+
+        if self.is_leaf:
+            self.name = None
+            self.value = reader.strings[reference]
+        else:
+            self.name = None if reference == 0 else reader.strings[reference - 1]
+            self.value = None
+
+        self.position_begin, offset = reader._read_position(offset, parent_begin)
+        end_index, offset = reader._read_varint(offset)
+        end_line, offset = reader._read_varint(offset)
+        end_column, offset = reader._read_varint(offset)
+        self.position_end = Position(self.position_begin.index + end_index, self.position_begin.line + end_line, end_column)
+
+        self.child_count = 0
+        self.__children_offset = offset
+        self.end_offset = offset
+        if not self.is_leaf:
+            self.child_count, offset = reader._read_varint(offset)
+            children_size, offset = reader._read_varint(offset)
+            self.__children_offset = offset
+            self.end_offset = offset + children_size
+
+    def children(self):
+        offset = self.__children_offset
+        for _ in range(self.child_count):
+            child = ParseTreeRecord(self.__reader, offset, self.position_begin)
+            offset = child.end_offset
+            yield child
+
+    def to_tree(self) -> ParseTree:
+        root = self.__create_tree()
+        stack = [ (self, root) ]
+        while len(stack) > 0:
+            record, node = stack.pop()
+            for child in record.children():
+                tree = child.__create_tree()
+                node.children.append(tree)
+                if not child.is_leaf:
+                    stack.append((child, tree))
+
+        return root
+
+    def __create_tree(self) -> ParseTree:
+        # Nodes are created without their children
+        if self.is_leaf:
+            return ParseTreeExactMatch(self.value, self.position_begin, self.position_end)
+
+        node = ParseTreeNode(self.position_begin)
+        node.name = self.name
+        node.position_end = self.position_end
+        return node
+
+class ParseTreeReader:
+    def __init__(self, data) -> None:
+        self.__mmap = None
+        self.__data = memoryview(data)
+
+        if bytes(self.__data[:len(MAGIC)]) != MAGIC:
+            raise GrammarException("Not a serialized parse tree")
+        offset = len(MAGIC)
+
+        version, offset = self._read_varint(offset)
+        if version != FORMAT_VERSION:
+            raise GrammarException(f"Unsupported parse tree format version {version}")
+
+        flags, offset = self._read_varint(offset)
+
+        self.source_hash = None
+        if flags & FLAG_SOURCE_HASH:
+            self.source_hash = bytes(self.__data[offset:offset + SOURCE_HASH_SIZE])
+            offset += SOURCE_HASH_SIZE
+
+        string_count, offset = self._read_varint(offset)
+        self.strings: list[str] = []
+        for _ in range(string_count):
+            length, offset = self._read_varint(offset)
+            self.strings.append(str(self.__data[offset:offset + length], "utf-8"))
+            offset += length
+
+        self.__root_offset = offset
+
+    @staticmethod
+    def open(path: str) -> "ParseTreeReader":
+        with open(path, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            reader = ParseTreeReader(mapping)
+        except GrammarException:
+            mapping.close()
+            raise
+
+        reader.__mmap = mapping
+        return reader
+
+    def close(self) -> None:
+        self.__data.release()
+        if self.__mmap is not None:
+            self.__mmap.close()
+            self.__mmap = None
+
+    def __enter__(self) -> "ParseTreeReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def matches_source(self, source: str) -> bool:
+        return self.source_hash is not None and self.source_hash == hash_source(source)
+
+    def root(self, base: Position = None) -> ParseTreeRecord:
+        # 'base' moves the whole tree, e.g. if it was parsed from a part of a
+        # larger text. Columns are stored as they are and stay unchanged.
+        return ParseTreeRecord(self, self.__root_offset, Position(0, 0, 0) if base is None else base)
+
+    def read_tree(self, base: Position = None) -> ParseTree:
+        return self.root(base).to_tree()
+
+    def _read_position(self, offset: int, base: Position) -> tuple[Position, int]:
+        index, offset = self._read_varint(offset)
+        line, offset = self._read_varint(offset)
+        column, offset = self._read_varint(offset)
+        return Position(base.index + self.__unzigzag(index), base.line + self.__unzigzag(line), column), offset
+
+    def _read_varint(self, offset: int) -> tuple[int, int]:
+        data = self.__data
+        value = 0
+        shift = 0
+        while True:
+            if offset >= len(data):
+                raise GrammarException("Unexpected end of serialized parse tree")
+            byte = data[offset]
+            offset += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value, offset
+            shift += 7
+
+    def __unzigzag(self, value: int) -> int:
+        return value >> 1 if (value & 1) == 0 else -((value + 1) >> 1)
+
+def dumps(tree: ParseTree, source: str = None) -> bytes:
+    return ParseTreeWriter().write(tree, source)
+
+def dump(tree: ParseTree, path: str, source: str = None) -> None:
+    with open(path, "wb") as f:
+        f.write(dumps(tree, source))
+
+def loads(data: bytes, source: str = None, base: Position = None) -> ParseTree:
+    reader = ParseTreeReader(data)
+    if source is not None and not reader.matches_source(source):
+        raise GrammarException("Serialized parse tree does not belong to the given source")
+    tree = reader.read_tree(base)
+    reader.close()
+    return tree
+
+def load(path: str, source: str = None) -> ParseTree:
+    with ParseTreeReader.open(path) as reader:
+        if source is not None and not reader.matches_source(source):
+            raise GrammarException("Serialized parse tree does not belong to the given source", path)
+        return reader.read_tree()
+
+def _create_json_object(tree: ParseTree) -> dict:
+    # Nodes get an empty list of children
+    result = {}
+    if isinstance(tree, ParseTreeNode):
+        result["name"] = tree.name
+    elif isinstance(tree, ParseTreeExactMatch):
+        result["value"] = tree.value
+    else:
+        raise GrammarException(f"Cannot serialize tree of type '{type(tree).__name__}'")
+
+    result["begin"] = [ tree.position_begin.index, tree.position_begin.line, tree.position_begin.column ]
+    result["end"] = [ tree.position_end.index, tree.position_end.line, tree.position_end.column ]
+
+    if isinstance(tree, ParseTreeNode):
+        result["children"] = []
+
+    return result
+
+def tree_to_json_object(tree: ParseTree) -> dict:
+    root = _create_json_object(tree)
+    stack = [ (tree, root) ]
+    while len(stack) > 0:
+        tree, result = stack.pop()
+        for child in tree.children:
+            child_result = _create_json_object(child)
+            result["children"].append(child_result)
+            if isinstance(child, ParseTreeNode):
+                stack.append((child, child_result))
+
+    return root
+
+def tree_to_json(tree: ParseTree, indent: int = None) -> str:
+    # The same text as json.dumps(tree_to_json_object(tree), indent=indent),
+    # which recurses and fails for deep trees
+    separator = ", " if indent is None else ","
+    def get_newline(depth: int) -> str:
+        return "" if indent is None else "\n" + " " * (indent * depth)
+
+    parts = []
+    stack: list = [ (tree, 0) ]
+    while len(stack) > 0:
+        entry = stack.pop()
+        if isinstance(entry, str):
+            parts.append(entry)
+            continue
+
+        item, depth = entry
+
+        result = _create_json_object(item)
+        children = result.pop("children", None)
+        fields = [ f"{json.dumps(key)}: {json.dumps(value, indent=indent).replace(chr(10), get_newline(depth + 1))}" for key, value in result.items() ]
+        if children is not None:
+            fields.append('"children": ')
+
+        parts.append("{" + get_newline(depth + 1))
+        parts.append((separator + get_newline(depth + 1)).join(fields))
+        if children is None:
+            parts.append(get_newline(depth) + "}")
+        elif len(item.children) == 0:
+            parts.append("[]" + get_newline(depth) + "}")
+        else:
+            # Pushed in reverse, popped in document order
+            stack.append(get_newline(depth + 1) + "]" + get_newline(depth) + "}")
+            for index in range(len(item.children) - 1, -1, -1):
+                stack.append((item.children[index], depth + 2))
+                stack.append(("[" if index == 0 else separator) + get_newline(depth + 2))
+
+    return "".join(parts)
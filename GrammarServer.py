@@ -0,0 +1,199 @@
+import sys
+import json
+import time
+import struct
+import asyncio
+import argparse
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+import GrammarSerializer
+from Grammar import Grammar
+from GrammarLoader import GrammarLoader
+from GrammarException import GrammarException, ParseLimitExceeded
+
+# Frame (requests and responses):
+#   header length, body length  -> two big-endian uint32
+#   header                      -> utf-8 JSON object
+#   body                        -> raw bytes
+# Request header: { "grammar", "rule", "filename" (optional), "format" ("binary" or "json", optional),
+#                   "max_steps" (optional), "timeout" (seconds, optional) }
+# Request body: the text to parse, utf-8 encoded
+# Response header: { "status", "farthest": [index, line, column], "message" (errors only) }
+# Response body: the serialized tree, empty on errors
+FRAME_PREFIX = struct.Struct(">II")
+
+MAX_HEADER_SIZE = 64 * 1024
+MAX_BODY_SIZE = 256 * 1024 * 1024
+
+STATUS_OK = "ok"            # Text was parsed completely
+STATUS_PARTIAL = "partial"  # Parsing stopped before the end of the text
+STATUS_ERROR = "error"      # No tree, see 'message'
+
+FORMAT_BINARY = "binary"
+FORMAT_JSON = "json"
+FORMATS = [ FORMAT_BINARY, FORMAT_JSON ]
+
+async def read_frame(reader: asyncio.StreamReader) -> tuple[dict, bytes]:
+    prefix = await reader.readexactly(FRAME_PREFIX.size)
+    header_size, body_size = FRAME_PREFIX.unpack(prefix)
+    if header_size > MAX_HEADER_SIZE or body_size > MAX_BODY_SIZE:
+        raise GrammarException(f"Frame too large ({header_size} + {body_size} bytes)")
+
+    header = json.loads(await reader.readexactly(header_size))
+    if not isinstance(header, dict):
+        raise GrammarException("Frame header is not an object")
+
+    return header, await reader.readexactly(body_size)
+
+async def write_frame(writer: asyncio.StreamWriter, header: dict, body: bytes = b"") -> None:
+    encoded = json.dumps(header).encode("utf-8")
+    writer.write(FRAME_PREFIX.pack(len(encoded), len(body)) + encoded + body)
+    await writer.drain()
+
+async def request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, grammar: str, rule: str, text: str, filename: str = None, format: str = FORMAT_BINARY) -> tuple[dict, bytes]:
+    await write_frame(writer, { "grammar": grammar, "rule": rule, "filename": filename, "format": format }, text.encode("utf-8"))
+    return await read_frame(reader)
+
+def parse_request(grammar: Grammar, rule: str, text: str, filename: str, format: str, max_steps: int = None, timeout: float = None) -> tuple[dict, bytes]:
+    # Runs in a worker, serializing is part of the work
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        result = grammar.apply_to(text, rule, filename, max_steps, deadline)
+    except ParseLimitExceeded as e:
+        position = e.farthest_match_position
+        return { "status": STATUS_ERROR, "farthest": [ position.index, position.line, position.column ], "message": str(e) }, b""
+    except (GrammarException, RecursionError) as e:
+        return { "status": STATUS_ERROR, "message": str(e) }, b""
+
+    position = result.farthest_match_position
+    farthest = [ position.index, position.line, position.column ]
+
+    tree = result.tree
+    if tree is None:
+        return { "status": STATUS_ERROR, "farthest": farthest, "message": "Could not parse text" }, b""
+
+    header = { "status": STATUS_OK if tree.position_end.index >= len(text) else STATUS_PARTIAL, "farthest": farthest }
+
+    if format == FORMAT_JSON:
+        return header, GrammarSerializer.tree_to_json(tree).encode("utf-8")
+    return header, GrammarSerializer.dumps(tree, text)
+
+class GrammarServer:
+    def __init__(self, grammars: dict[str, Grammar], max_workers: int = None, max_pending: int = None, executor: Executor = None) -> None:
+        # Grammars stay loaded for the lifetime of the server. They can be
+        # shared by all worker threads since parsing never modifies them.
+        self.grammars = dict(grammars)
+
+        self.__executor = executor if executor is not None else ThreadPoolExecutor(max_workers=max_workers)
+        self.__owns_executor = executor is None
+
+        # Parses that were accepted but have not finished yet. Once the limit
+        # is reached, connections are no longer read until a parse finishes.
+        self.__max_pending = max_pending if max_pending is not None else 2 * (max_workers or 4)
+        self.__pending: asyncio.Semaphore = None
+
+        self.__server: asyncio.AbstractServer = None
+
+    @staticmethod
+    def from_paths(paths: dict[str, str], *args, **kwargs) -> "GrammarServer":
+        return GrammarServer({ name: GrammarLoader(path=path).get_grammar() for name, path in paths.items() }, *args, **kwargs)
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.__pending = asyncio.Semaphore(self.__max_pending)
+        self.__server = await asyncio.start_server(self.__handle_connection, host, port)
+
+    async def start_unix(self, path: str) -> None:
+        self.__pending = asyncio.Semaphore(self.__max_pending)
+        self.__server = await asyncio.start_unix_server(self.__handle_connection, path)
+
+    def get_addresses(self) -> list:
+        return [ socket.getsockname() for socket in self.__server.sockets ]
+
+    async def serve_forever(self) -> None:
+        await self.__server.serve_forever()
+
+    async def close(self) -> None:
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+            self.__server = None
+        if self.__owns_executor:
+            self.__executor.shutdown(wait=True)
+
+    async def __handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    header, body = await read_frame(reader)
+                except asyncio.IncompleteReadError:
+                    break
+
+                # Acquiring before the next read is what applies backpressure
+                async with self.__pending:
+                    response_header, response_body = await self.__dispatch(header, body)
+
+                await write_frame(writer, response_header, response_body)
+        except (GrammarException, ValueError, ConnectionError) as e:
+            # Malformed frames cannot be answered reliably, drop the connection
+            print(f"ERROR: Closing connection: {e}", file=sys.stderr)
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def __dispatch(self, header: dict, body: bytes) -> tuple[dict, bytes]:
+        grammar = self.grammars.get(header.get("grammar"))
+        if grammar is None:
+            return { "status": STATUS_ERROR, "message": f"Unknown grammar '{header.get('grammar')}'" }, b""
+
+        format = header.get("format", FORMAT_BINARY)
+        if format not in FORMATS:
+            return { "status": STATUS_ERROR, "message": f"Unknown format '{format}'" }, b""
+
+        try:
+            text = body.decode("utf-8")
+        except UnicodeDecodeError as e:
+            return { "status": STATUS_ERROR, "message": f"Text is not valid utf-8: {e}" }, b""
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.__executor, parse_request, grammar, header.get("rule"), text, header.get("filename"), format, header.get("max_steps"), header.get("timeout"))
+
+async def main(args: list[str]) -> None:
+    parser = argparse.ArgumentParser(description="Serve parse requests for a set of grammars")
+    parser.add_argument("grammars", nargs="+", metavar="NAME=PATH", help="grammar to keep loaded")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a unix socket instead of tcp")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-pending", type=int, default=None)
+    options = parser.parse_args(args)
+
+    paths = {}
+    for item in options.grammars:
+        name, sep, path = item.partition("=")
+        if not sep:
+            parser.error(f"Expected NAME=PATH but got '{item}'")
+        paths[name] = path
+
+    server = GrammarServer.from_paths(paths, max_workers=options.workers, max_pending=options.max_pending)
+    if options.unix is not None:
+        await server.start_unix(options.unix)
+    else:
+        await server.start_tcp(options.host, options.port)
+
+    print(f"INFO: Serving {', '.join(paths)} on {', '.join(map(str, server.get_addresses()))}")
+
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main(sys.argv[1:]))
+    except GrammarException as e:
+        print(f"ERROR: {e}")
+    except KeyboardInterrupt:
+        pass
@@ -1,10 +1,28 @@
 import os
+import io
+import re
 import cProfile
 import time
+import threading
+import tempfile
+import pickle
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from Grammar import Grammar
-from GrammarException import GrammarException
+from GrammarException import GrammarException, ParseLimitExceeded
 from GrammarLoader import GrammarLoader
-from GrammarParseTree import ParseTree, ParseTreeNode, ParseTreeExactMatch
+from InternalGrammarLoader import load_internal_grammar
+from GrammarCache import ParseCache
+from GrammarVisitor import Transformer
+from GrammarQuery import ParseTreeIndex
+from GrammarParallel import apply_parallel
+from GrammarOptimizer import OptionStatistics, reorder_options
+import GrammarNative
+import GrammarSerializer
+import GrammarServer
+from GrammarRule import CancellationToken, MatcherMatchRule
+from GrammarTools import Position
+from GrammarParseTree import ParseTree, ParseTreeNode, ParseTreeExactMatch, ParseTreeBuilder
 
 def load_dynamic_grammar():
     raise GrammarException("load_dynamic_grammar should have been replaced by code generation")
@@ -22,7 +40,7 @@ def write_tree_graphviz(tree: ParseTree, filename: str, verbose: bool):
     print("  INFO: Writing tree to tree.gv... ", end="", flush=True)
     make_output_dir()
     with open(path_to_output_filename(filename, ".gv"), "w") as f:
-        f.write(tree.to_digraph(verbose).source)
+        tree.write_dot(f, verbose)
     print("DONE")
 
 def render_tree(tree: ParseTree, filename: str, verbose: bool):
@@ -31,51 +49,49 @@ def render_tree(tree: ParseTree, filename: str, verbose: bool):
     tree.to_digraph(verbose).render(format="pdf", outfile=path_to_output_filename(filename, ".pdf"), cleanup=True)
     print("DONE")
 
-def evaluate_expression(tree: ParseTree):
-    if isinstance(tree, ParseTreeNode):
-        if tree.name == "Expression":
-            return evaluate_expression(tree.children[0])
-        elif tree.name == "Sum":
-            if isinstance(tree.children[0], ParseTreeExactMatch):
-                sign = tree.children[0].value
-                first_sub_id = 1
-            else:
-                sign = "+"
-                first_sub_id = 0
-
-            result = evaluate_expression(tree.children[first_sub_id])
-            result = result if sign == "+" else -result
-
-            for i in range(first_sub_id+1, len(tree.children), 2):
-                part = evaluate_expression(tree.children[i+1])
-                if tree.children[i].value == "+":
-                    result += part
-                elif tree.children[i].value == "-":
-                    result -= part
-                else:
-                    raise GrammarException("Unknown operator", tree.children[i].value)
-            return result
-        elif tree.name == "Product":
-            result = evaluate_expression(tree.children[0])
-            for i in range(1, len(tree.children), 2):
-                part = evaluate_expression(tree.children[i+1])
-                if tree.children[i].value == "*":
-                    result *= part
-                elif tree.children[i].value == "/":
-                    result //= part
-                else:
-                    raise GrammarException("Unknown operator", tree.children[i].value)
-            return result
-        elif tree.name == "Atom":
-            return evaluate_expression(tree.children[0])
-        elif tree.name == "Number":
-            return evaluate_expression(tree.children[0])
+class ExpressionEvaluator(Transformer):
+    def on_Expression(self, node: ParseTreeNode, children: list):
+        return children[0]
+
+    def on_Sum(self, node: ParseTreeNode, children: list):
+        if isinstance(children[0], ParseTreeExactMatch):
+            sign = children[0].value
+            children = children[1:]
         else:
-            raise GrammarException("Unknown name", tree.name)
-    elif isinstance(tree, ParseTreeExactMatch):
-        return int(tree.value)
-    else:
-        raise GrammarException("Expected ParseTreeNode but got", type(tree))
+            sign = "+"
+
+        result = children[0] if sign == "+" else -children[0]
+
+        for i in range(1, len(children), 2):
+            if children[i].value == "+":
+                result += children[i+1]
+            elif children[i].value == "-":
+                result -= children[i+1]
+            else:
+                raise GrammarException("Unknown operator", children[i].value)
+        return result
+
+    def on_Product(self, node: ParseTreeNode, children: list):
+        result = children[0]
+        for i in range(1, len(children), 2):
+            if children[i].value == "*":
+                result *= children[i+1]
+            elif children[i].value == "/":
+                result //= children[i+1]
+            else:
+                raise GrammarException("Unknown operator", children[i].value)
+        return result
+
+    def on_Atom(self, node: ParseTreeNode, children: list):
+        if isinstance(children[0], ParseTreeExactMatch):
+            return int(children[0].value)
+        return children[0]
+
+    def transform_default(self, node: ParseTreeNode, children: list):
+        raise GrammarException("Unknown name", node.name)
+
+def evaluate_expression(tree: ParseTree):
+    return ExpressionEvaluator().transform(tree)
 
 def run_test(grammar_source: str|Grammar, entry_rule: str, text: str, filename: str = None, verbose: bool = True, do_write_tree: bool = False, do_render_tree: bool = True):
     if isinstance(grammar_source, str):
@@ -146,22 +162,31 @@ def test_qism():
     run_test("grammars/qism_grammar.qgr", "Code", text, filename, do_write_tree=True)
 
 QINP_DIR = "../QINP/stdlib"
+CACHE_DIR = os.path.join("output", "cache")
 
 def test_qinp(test_all = False):
     grammar = GrammarLoader(path = "grammars/qinp_grammar.qgr").get_grammar()
     begin = time.time()
     if test_all:
+        cache = ParseCache(grammar, "GlobalCode", CACHE_DIR)
         for root, dirs, files in os.walk(QINP_DIR):
             for name in files:
                 if name.endswith(".qnp"):
                     filename = os.path.join(root, name)
-                    with open(filename, "r") as f:
-                        text = f.read()
 
-                    result = run_test(grammar, "GlobalCode", text, filename, verbose=True, do_write_tree=False, do_render_tree=False)
+                    entry = cache.lookup(filename)
+                    if entry is None:
+                        with open(filename, "r") as f:
+                            text = f.read()
+
+                        result = run_test(grammar, "GlobalCode", text, filename, verbose=True, do_write_tree=False, do_render_tree=False)
+                        entry = cache.store(filename, text, result)
 
-                    if result.farthest_match_position.index < len(text):
+                    if not entry.fully_parsed:
+                        cache.save()
                         exit(1)
+
+        cache.save()
                     
     else:
         filename = "test_files/push_pop_test.qnp"
@@ -174,12 +199,887 @@ def test_qinp(test_all = False):
 
     print(f"  INFO: Testing took {end - begin} seconds")
 
+THREAD_TEST_CASES = [
+    ("grammars/algebra_grammar.qgr", "Expression", "test_files/algebra_expression.txt"),
+    ("grammars/qism_grammar.qgr", "Code", "test_files/bootloader.qsm"),
+    ("grammars/qinp_grammar.qgr", "GlobalCode", "test_files/push_pop_test.qnp"),
+]
+
+def test_threads(thread_count = 16, parses_per_case = 8):
+    # Every case is parsed once up front and then many times concurrently
+    # with the same Grammar object, all results have to be identical.
+    cases = []
+    for grammar_path, entry_rule, filename in THREAD_TEST_CASES:
+        grammar = GrammarLoader(path = grammar_path).get_grammar()
+        with open(filename, "r") as f:
+            text = f.read()
+        reference = GrammarSerializer.dumps(grammar.apply_to(text, entry_rule, filename).tree)
+        cases.append((grammar, entry_rule, text, filename, reference))
+
+    # Start all threads at once to maximize the overlap
+    barrier = threading.Barrier(thread_count)
+
+    def parse_all(thread_index: int) -> int:
+        barrier.wait()
+        mismatches = 0
+        for i in range(parses_per_case):
+            for grammar, entry_rule, text, filename, reference in cases[thread_index % len(cases):] + cases[:thread_index % len(cases)]:
+                tree = grammar.apply_to(text, entry_rule, filename).tree
+                if tree is None or GrammarSerializer.dumps(tree) != reference:
+                    mismatches += 1
+        return mismatches
+
+    print(f"INFO: Parsing {len(cases)} files {parses_per_case} times each in {thread_count} threads")
+
+    begin = time.time()
+    with ThreadPoolExecutor(max_workers = thread_count) as executor:
+        mismatches = sum(executor.map(parse_all, range(thread_count)))
+    end = time.time()
+
+    if mismatches > 0:
+        raise GrammarException(f"{mismatches} concurrent parses differ from the sequential result")
+
+    print(f"  INFO: All {thread_count * parses_per_case * len(cases)} parses match")
+    print(f"  INFO: Testing took {end - begin} seconds")
+
+def test_parallel(copies = 64, workers = 4):
+    # A large text made of copies of a test file has to give the same tree
+    # in parallel as sequentially
+    for grammar_path, entry_rule, filename in THREAD_TEST_CASES[1:]:
+        grammar = GrammarLoader(path = grammar_path).get_grammar()
+        with open(filename, "r") as f:
+            text = f.read().rstrip("\n") + "\n"
+        text *= copies
+
+        print(f"INFO: Parsing {copies} copies of '{filename}' ({len(text)} characters) with {workers} workers")
+
+        begin = time.time()
+        reference = grammar.apply_to(text, entry_rule, filename)
+        middle = time.time()
+        result = apply_parallel(grammar, text, entry_rule, filename, workers = workers, min_chunk_size = len(text) // (4 * workers))
+        end = time.time()
+
+        if GrammarSerializer.dumps(result.tree) != GrammarSerializer.dumps(reference.tree):
+            raise GrammarException(f"Parallel parse of '{filename}' differs from the sequential result")
+
+        print(f"  INFO: Sequential {middle - begin} seconds, parallel {end - middle} seconds")
+
+def test_native():
+    # The C++ engine has to give the same trees as the Python engine for
+    # all test files and for every bundled grammar parsed as a grammar
+    if not GrammarNative.is_available():
+        print("  INFO: Skipping, libQrawlr is not built")
+        return
+
+    cases = list(THREAD_TEST_CASES)
+    for filename in sorted(os.listdir("grammars")):
+        if filename.endswith(".qgr"):
+            cases.append(("grammars/qrawlr_grammar.qgr", "Grammar", os.path.join("grammars", filename)))
+
+    for grammar_path, entry_rule, filename in cases:
+        with open(filename, "r") as f:
+            text = f.read()
+
+        print(f"INFO: Comparing engines on '{filename}'")
+
+        begin = time.time()
+        reference = GrammarLoader(path = grammar_path).get_grammar().apply_to(text, entry_rule, filename)
+        middle = time.time()
+        with GrammarNative.NativeGrammar.load_from_file(grammar_path) as native:
+            result = native.apply_to(text, entry_rule, filename)
+        end = time.time()
+
+        if GrammarSerializer.dumps(result.tree) != GrammarSerializer.dumps(reference.tree):
+            raise GrammarException(f"Native parse of '{filename}' differs from the Python result")
+        if result.farthest_match_position.index != reference.farthest_match_position.index:
+            raise GrammarException(f"Native parse of '{filename}' got to a different farthest match")
+
+        print(f"  INFO: Python {middle - begin} seconds, native {end - middle} seconds")
+
+TOKEN_GRAMMAR = """Choice(token): [ "a" "ab" ]
+ChoiceFused(fuse): [ "a" "ab" ]
+
+Greedy(token): "a"* "a"
+GreedyFused(fuse): "a"* "a"
+
+Repeated(token): [ "ab" "a" ]+ "b"
+RepeatedFused(fuse): [ "ab" "a" ]+ "b"
+
+Quoted(token): "'" "'"!* "'"
+QuotedFused(fuse): "'" "'"!* "'"
+"""
+
+TOKEN_TEST_CASES = [
+    ("Choice", [ "a", "ab", "b" ]),
+    ("Greedy", [ "a", "aa", "aaa" ]),
+    ("Repeated", [ "ab", "abb", "aab", "abab" ]),
+    ("Quoted", [ "''", "'ab'c", "'ab" ]),
+]
+
+def test_tokens():
+    # A token rule has to match exactly what the same rule matches when it
+    # is only fused, with ordered choice and greedy repetition
+    print("INFO: Comparing token rules with fused rules")
+
+    tree = load_internal_grammar().apply_to(TOKEN_GRAMMAR, "Grammar", "<tokens>").tree
+    grammar = GrammarLoader(init_tree = tree).get_grammar()
+
+    def get_match(rule: str, text: str) -> tuple[int, str]:
+        result = grammar.apply_to(text, rule, "<text>")
+        if result.tree is None:
+            return None
+        return result.tree.position_end.index, "".join(leaf.value for leaf in result.tree.children)
+
+    for rule, texts in TOKEN_TEST_CASES:
+        for text in texts:
+            token_match = get_match(rule, text)
+            fused_match = get_match(rule + "Fused", text)
+            if token_match != fused_match:
+                raise GrammarException(f"Token '{rule}' matches {token_match} of '{text}' instead of {fused_match}")
+
+SKIP_STACK_GRAMMAR = """Whitespace(token skip):
+    " "+
+
+Letter:
+    'az'
+
+Pair(skipping):
+    (Letter Letter){ onMatch: push(_, letters) } "=" :letters.0:{ onMatch: pop(letters) }
+"""
+
+def test_skip_stack():
+    # Skipped text is not part of what a push inside a skipping rule stores
+    print("INFO: Matching a pushed item inside a skipping rule")
+
+    tree = load_internal_grammar().apply_to(SKIP_STACK_GRAMMAR, "Grammar", "<skip_stack>").tree
+    grammar = GrammarLoader(init_tree = tree).get_grammar()
+
+    text = "a b = ab"
+    result = grammar.apply_to(text, "Pair", "<text>")
+    if result.tree is None or result.tree.position_end.index < len(text):
+        raise GrammarException(f"Could not match the pushed item in '{text}'")
+
+def test_lazy():
+    # Lazy nodes have to give the same tree as an eager parse once they
+    # are parsed, serializing the tree parses all of them
+    for grammar_path, entry_rule, filename in THREAD_TEST_CASES:
+        with open(filename, "r") as f:
+            text = f.read()
+
+        print(f"INFO: Parsing '{filename}' lazily")
+
+        grammar = GrammarLoader(path = grammar_path).get_grammar()
+
+        begin = time.time()
+        reference = grammar.apply_to(text, entry_rule, filename)
+        middle = time.time()
+        result = grammar.apply_to(text, entry_rule, filename, lazy = True)
+        end = time.time()
+
+        if GrammarSerializer.dumps(result.tree) != GrammarSerializer.dumps(reference.tree):
+            raise GrammarException(f"Lazy parse of '{filename}' differs from the eager result")
+
+        print(f"  INFO: Eager {middle - begin} seconds, lazy {end - middle} seconds")
+
+LAZY_COMMENTS_TEXT = """fn<> first():
+\treturn   \\\\ last item
+\t\\\\ trailing
+
+\t\t\\\\ deeper
+\\\\ not indented
+fn<> second(): pass \\\\ same line
+\t\\\\ trailing
+"""
+
+def test_lazy_comments(grammar_path = "grammars/qinp_grammar.qgr"):
+    # Comments after the last item of a lazy block have to end up in the
+    # same place as in an eager parse
+    print("INFO: Parsing trailing comments of lazy rules")
+
+    grammar = GrammarLoader(path = grammar_path).get_grammar()
+    reference = grammar.apply_to(LAZY_COMMENTS_TEXT, "GlobalCode", "<lazy_comments>")
+    result = grammar.apply_to(LAZY_COMMENTS_TEXT, "GlobalCode", "<lazy_comments>", lazy = True)
+
+    if GrammarSerializer.dumps(result.tree) != GrammarSerializer.dumps(reference.tree):
+        raise GrammarException("Lazy parse of trailing comments differs from the eager result")
+
+def test_lazy_support(grammar_path = "grammars/qinp_grammar.qgr"):
+    # The 'lazy' and 'comment' modifiers may not change eager trees
+    print(f"INFO: Comparing eager trees of '{grammar_path}' with and without lazy rules")
+
+    with open(grammar_path, "r") as f:
+        grammar_text = f.read()
+    plain_text = grammar_text.replace("(lazy)", "").replace("(comment)", "")
+    if plain_text == grammar_text:
+        raise GrammarException(f"Grammar '{grammar_path}' has no lazy or comment rules")
+
+    grammar = GrammarLoader(path = grammar_path).get_grammar()
+    plain_grammar = GrammarLoader(init_tree = load_internal_grammar().apply_to(plain_text, "Grammar", grammar_path).tree).get_grammar()
+
+    with open(THREAD_TEST_CASES[2][2], "r") as f:
+        texts = [ f.read(), LAZY_COMMENTS_TEXT ]
+    for text in texts:
+        reference = plain_grammar.apply_to(text, "GlobalCode", "<text>")
+        result = grammar.apply_to(text, "GlobalCode", "<text>")
+        if GrammarSerializer.dumps(result.tree) != GrammarSerializer.dumps(reference.tree):
+            raise GrammarException(f"Lazy rules of '{grammar_path}' change eager trees")
+
+INDENTATION_TEST_CASES = [
+    # Text, end of the tree and farthest match, or the position of the error
+    ("fn<> f():\n\tb = 1\n    c = 2\n", (17, 21)),
+    ("fn<> f():\n\tif a:\n\t\tb = 1\n\t  c = 2\n", "4:2"),
+    ("fn<> f():\n\tb = 1\n\t\\\n\tc = 2\n", "3:2"),
+    ("fn<> f():\n\\\n\tb = 1\n\\\n\tc = 2\n", (28, 28)),
+]
+
+def test_indentation(grammar_path = "grammars/qinp_grammar.qgr"):
+    # Indentation levels are compared as strings, so tabs and spaces never
+    # stand in for each other, and a backslash-newline is part of them
+    print("INFO: Matching mixed indentation")
+
+    grammar = GrammarLoader(path = grammar_path).get_grammar()
+    for text, expected in INDENTATION_TEST_CASES:
+        try:
+            result = grammar.apply_to(text, "GlobalCode", "<indentation>")
+            got = (result.tree.position_end.index, result.farthest_match_position.index)
+        except GrammarException as e:
+            got = str(e)
+            if f"<indentation>:{expected}:" in got:
+                got = expected
+        if got != expected:
+            raise GrammarException(f"Indentation of {text!r} gave {got} instead of {expected}")
+
+CUT_GRAMMAR = """Item: [ ( "a" ^ "b" ) "ac" ]
+"""
+
+def test_cuts(grammar_path = "grammars/algebra_grammar.qgr"):
+    # A cut keeps the choice from trying its next option, and only grammars
+    # with cuts track their choices at all
+    print("INFO: Matching cuts")
+
+    for grammar_text, expected in [ (CUT_GRAMMAR, None), (CUT_GRAMMAR.replace("^ ", ""), "ac") ]:
+        tree = load_internal_grammar().apply_to(grammar_text, "Grammar", "<cuts>").tree
+        result = GrammarLoader(init_tree = tree).get_grammar().apply_to("ac", "Item", "<cuts>")
+        if (None if result.tree is None else str(result.tree)) != expected:
+            raise GrammarException(f"Grammar {grammar_text!r} matched {result.tree} instead of {expected}")
+
+    for path, cuts in [ (grammar_path, False), ("grammars/qinp_grammar.qgr", True) ]:
+        grammar = GrammarLoader(path = path).get_grammar()
+        if any(rule._cuts != cuts for rule in grammar.rules.values()):
+            raise GrammarException(f"Rules of '{path}' should {'' if cuts else 'not '}track choices")
+
+def test_projection(keep = { "FunctionDefinition", "Identifier" }):
+    # Only the root and nodes of kept rules may be left in the tree
+    grammar_path, entry_rule, filename = THREAD_TEST_CASES[2]
+    with open(filename, "r") as f:
+        text = f.read()
+
+    print(f"INFO: Projecting '{filename}' to {', '.join(sorted(keep))}")
+
+    grammar = GrammarLoader(path = grammar_path).get_grammar()
+    reference = grammar.apply_to(text, entry_rule, filename)
+    result = grammar.apply_to(text, entry_rule, filename, keep = keep)
+
+    if result.farthest_match_position.index != reference.farthest_match_position.index:
+        raise GrammarException(f"Projected parse of '{filename}' got to a different farthest match")
+
+    stack = list(result.tree.children)
+    while len(stack) > 0:
+        tree = stack.pop()
+        if isinstance(tree, ParseTreeNode):
+            if tree.name not in keep:
+                raise GrammarException(f"Projected tree of '{filename}' contains a node '{tree.name}'")
+            stack.extend(tree.children)
+
+def test_interning():
+    # Sharing strings and positions must not change the trees
+    for grammar_path, entry_rule, filename in THREAD_TEST_CASES:
+        with open(filename, "r") as f:
+            text = f.read()
+
+        print(f"INFO: Parsing '{filename}' with interning")
+
+        grammar = GrammarLoader(path = grammar_path).get_grammar()
+        reference = grammar.apply_to(text, entry_rule, filename)
+        result = grammar.apply_to(text, entry_rule, filename, intern = True)
+
+        if GrammarSerializer.dumps(result.tree) != GrammarSerializer.dumps(reference.tree):
+            raise GrammarException(f"Interned parse of '{filename}' differs from the plain result")
+
+def test_reordering():
+    # Reordered options must give the same trees as the grammar as written
+    for grammar_path, entry_rule, filename in THREAD_TEST_CASES:
+        with open(filename, "r") as f:
+            text = f.read()
+
+        print(f"INFO: Reordering options for '{filename}'")
+
+        grammar = GrammarLoader(path = grammar_path).get_grammar()
+        statistics = OptionStatistics()
+        statistics.record(grammar, text, entry_rule, filename)
+        optimized = reorder_options(grammar, statistics)
+
+        begin = time.time()
+        reference = grammar.apply_to(text, entry_rule, filename)
+        middle = time.time()
+        result = optimized.apply_to(text, entry_rule, filename)
+        end = time.time()
+
+        if GrammarSerializer.dumps(result.tree) != GrammarSerializer.dumps(reference.tree):
+            raise GrammarException(f"Reordered parse of '{filename}' differs from the original result")
+
+        print(f"  INFO: Original {middle - begin} seconds, reordered {end - middle} seconds")
+
+FAILED_STACK_GRAMMAR = """Letter:
+    'az'
+
+Assignment:
+    Letter{ onMatch: push(_, letters) } "="
+"""
+
+def test_failed_stacks():
+    # Stack items left by a parse are reported whether the parse succeeded or not
+    print("INFO: Checking the stacks after a failed parse")
+
+    tree = load_internal_grammar().apply_to(FAILED_STACK_GRAMMAR, "Grammar", "<failed_stack>").tree
+    grammar = GrammarLoader(init_tree = tree).get_grammar()
+
+    try:
+        grammar.apply_to("a!", "Assignment", "<text>")
+    except GrammarException:
+        return
+    raise GrammarException("Stacks left by a failed parse were not reported")
+
+def test_generated_code(grammar_path = "grammars/qinp_grammar.qgr"):
+    # The generated loader has to import every matcher type it uses
+    print(f"INFO: Executing the generated code of '{grammar_path}'")
+
+    grammar = GrammarLoader(path = grammar_path).get_grammar()
+    namespace = {}
+    exec(grammar.generate_python_code("load_generated_grammar"), namespace)
+    generated = namespace["load_generated_grammar"]()
+
+    if [str(rule) for rule in generated.rules.values()] != [str(rule) for rule in grammar.rules.values()]:
+        raise GrammarException(f"Generated code of '{grammar_path}' loads a different grammar")
+
+DEEP_TREE_GRAMMAR = """Sum:
+    Sum "+" "1"
+    "1"
+"""
+
+def test_deep_tree(depth = 3000):
+    # Left recursion grows trees deeper than the recursion limit, they still
+    # have to be serialized and loaded again
+    print(f"INFO: Serializing a tree of depth {depth}")
+
+    tree = load_internal_grammar().apply_to(DEEP_TREE_GRAMMAR, "Grammar", "<deep_tree>").tree
+    grammar = GrammarLoader(init_tree = tree).get_grammar()
+
+    text = "1" + "+1" * depth
+    result = grammar.apply_to(text, "Sum", "<text>")
+    if result.tree is None or result.tree.position_end.index < len(text):
+        raise GrammarException("Could not parse the deep tree")
+
+    data = GrammarSerializer.dumps(result.tree)
+    if GrammarSerializer.dumps(GrammarSerializer.loads(data)) != data:
+        raise GrammarException("Deep tree changed when it was loaded again")
+    # Python's own JSON parser recurses, so the JSON is only created
+    GrammarSerializer.tree_to_json(result.tree)
+    GrammarSerializer.tree_to_json_object(result.tree)
+
+PRECEDENCE_GRAMMAR = """Number: [ "1" "2" "3" ]
+
+Expression:
+    <
+        Number
+        1 left Sum: [ "+" "-" ]
+        2 left Product: "*"
+        3 right Power: "^"
+    >{ onMissingOperand: fail("Expected operand after operator") }
+"""
+
+PRECEDENCE_TEST_CASES = [
+    # Text and the nodes it is grouped into, or the position of the error
+    ("1+2*3", "Sum(1 + Product(2 * 3))"),
+    ("1-2+3", "Sum(1 - 2 + 3)"),
+    ("1^2^3", "Power(1 ^ Power(2 ^ 3))"),
+    ("1*2^3-1", "Sum(Product(1 * Power(2 ^ 3)) - 1)"),
+    ("1+", "1:3"),
+    ("1*2+", "1:5"),
+]
+
+def get_tree_shape(tree: ParseTree, leaves: set[str] = { "Number" }) -> str:
+    # Named nodes with their children. Unnamed nodes and the ones in 'leaves'
+    # only show their children.
+    if not isinstance(tree, ParseTreeNode):
+        return str(tree)
+    children = " ".join([get_tree_shape(child, leaves) for child in tree.children])
+    if tree.name is None or tree.name in leaves:
+        return children
+    return f"{tree.name}({children})"
+
+def test_precedence():
+    # Operators group by precedence and associativity, an operator without
+    # an operand after it is reported by 'onMissingOperand'
+    print("INFO: Grouping operators by precedence")
+
+    tree = load_internal_grammar().apply_to(PRECEDENCE_GRAMMAR, "Grammar", "<precedence>").tree
+    grammar = GrammarLoader(init_tree = tree).get_grammar()
+
+    for text, expected in PRECEDENCE_TEST_CASES:
+        try:
+            got = get_tree_shape(grammar.apply_to(text, "Expression", "<text>").tree.children[0])
+        except GrammarException as e:
+            got = str(e)
+            if f"<text>:{expected}: Expected operand after operator" in got:
+                got = expected
+        if got != expected:
+            raise GrammarException(f"Precedence of '{text}' gave {got} instead of {expected}")
+
+LEFT_RECURSION_GRAMMAR = """Number: [ "1" "2" "3" ]
+
+Sum:
+    SumChain
+
+SumChain(hidden):
+    SumChain "+" Number
+    Number
+
+Difference:
+    Difference "-" Number
+    Number
+
+Call:
+    Callee "()"
+    Number
+
+Callee(hidden):
+    Call
+"""
+
+LEFT_RECURSION_TEST_CASES = [
+    # Entry rule, text, the nodes it is grouped into and where the tree ends
+    ("Sum", "1+2+3", "Sum(1 + 2 + 3)", 5),
+    ("Sum", "1+2+", "Sum(1 + 2)", 3),
+    ("Difference", "1-2-3", "Difference(Difference(Difference(1) - 2) - 3)", 5),
+    ("Difference", "3", "Difference(3)", 1),
+    ("Call", "1()()", "Call(Call(Call(1) ()) ())", 5),
+]
+
+def test_left_recursion():
+    # Seeds grow to the left, hidden chains stay flat and recursion through
+    # other rules is found as well
+    print("INFO: Growing left recursive rules")
+
+    tree = load_internal_grammar().apply_to(LEFT_RECURSION_GRAMMAR, "Grammar", "<left_recursion>").tree
+    grammar = GrammarLoader(init_tree = tree).get_grammar()
+
+    for entry_rule, text, expected, end in LEFT_RECURSION_TEST_CASES:
+        result = grammar.apply_to(text, entry_rule, "<text>")
+        got = get_tree_shape(result.tree)
+        if got != expected or result.tree.position_end.index != end:
+            raise GrammarException(f"Left recursion of '{text}' gave {got} up to {result.tree.position_end.index} instead of {expected} up to {end}")
+
+class CancellingTreeBuilder(ParseTreeBuilder):
+    # Cancels the parse once the first leaf arrives
+    def __init__(self, cancellation: CancellationToken) -> None:
+        super().__init__()
+        self.cancellation = cancellation
+
+    def leaf(self, value: str, position_begin: Position, position_end: Position) -> None:
+        super().leaf(value, position_begin, position_end)
+        self.cancellation.cancel()
+
+def test_streaming():
+    # The events describe the same tree a parse returns, and with cuts they
+    # arrive while the text is still being parsed
+    for grammar_path, entry_rule, filename in THREAD_TEST_CASES:
+        with open(filename, "r") as f:
+            text = f.read()
+
+        print(f"INFO: Streaming '{filename}'")
+
+        grammar = GrammarLoader(path = grammar_path).get_grammar()
+        reference = grammar.apply_to(text, entry_rule, filename)
+        builder = ParseTreeBuilder()
+        result = grammar.stream_to(builder, text, entry_rule, filename)
+
+        if GrammarSerializer.dumps(builder.tree) != GrammarSerializer.dumps(reference.tree):
+            raise GrammarException(f"Streamed tree of '{filename}' differs from the parsed one")
+        if len(result.tree.children) > 0:
+            raise GrammarException(f"Streaming '{filename}' kept children in the returned tree")
+
+    # qinp has cuts, it is the last case
+    cancellation = CancellationToken()
+    try:
+        grammar.stream_to(CancellingTreeBuilder(cancellation), text, entry_rule, filename, cancellation = cancellation)
+    except ParseLimitExceeded:
+        return
+    raise GrammarException(f"Events of '{filename}' only arrived after parsing")
+
+def test_cache():
+    # Results are found again by a new cache on the same directory, until the
+    # text or the grammar changes
+    grammar_path, entry_rule, filename = THREAD_TEST_CASES[0]
+    print(f"INFO: Caching the parse of '{filename}'")
+
+    grammar = GrammarLoader(path = grammar_path).get_grammar()
+    with open(filename, "r") as f:
+        text = f.read()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, os.path.basename(filename))
+        with open(path, "w") as f:
+            f.write(text)
+
+        cache = ParseCache(grammar, entry_rule, directory)
+        if cache.lookup(path) is not None:
+            raise GrammarException("Empty parse cache found a result")
+        entry = cache.apply_to_file(path)
+        cache.save()
+
+        reference = grammar.apply_to(text, entry_rule, path)
+        cached = ParseCache(grammar, entry_rule, directory).lookup(path)
+        if cached is None or not cached.fully_parsed or GrammarSerializer.dumps(cached.load_tree()) != GrammarSerializer.dumps(reference.tree):
+            raise GrammarException("Parse cache did not return the stored result")
+        if cached.farthest_match_position.index != entry.farthest_match_position.index:
+            raise GrammarException("Parse cache changed the farthest match")
+
+        other_grammar = GrammarLoader(path = THREAD_TEST_CASES[1][0]).get_grammar()
+        if ParseCache(other_grammar, entry_rule, directory).lookup(path) is not None:
+            raise GrammarException("Parse cache returned the result of another grammar")
+
+        with open(path, "w") as f:
+            f.write(text + " ")
+        if ParseCache(grammar, entry_rule, directory).lookup(path) is not None:
+            raise GrammarException("Parse cache returned the result of a changed file")
+
+def get_dot_node_labels(tree: ParseTree, **kwargs) -> list[str]:
+    # Labels of the nodes 'write_dot' writes, in order
+    f = io.StringIO()
+    tree.write_dot(f, verbose = False, **kwargs)
+    return re.findall(r"^\t\d+ \[label=\"(.*)\" shape=", f.getvalue(), re.MULTILINE)
+
+def test_dot_writer():
+    # The streamed graph is the one graphviz builds, the filters leave out
+    # what they are asked to
+    for grammar_path, entry_rule, filename in THREAD_TEST_CASES:
+        with open(filename, "r") as f:
+            text = f.read()
+
+        print(f"INFO: Writing the graph of '{filename}'")
+
+        tree = GrammarLoader(path = grammar_path).get_grammar().apply_to(text, entry_rule, filename).tree
+        f = io.StringIO()
+        tree.write_dot(f)
+        if f.getvalue() != tree.to_digraph().source:
+            raise GrammarException(f"Written graph of '{filename}' differs from the graphviz source")
+
+    tree = GrammarLoader(path = THREAD_TEST_CASES[0][0]).get_grammar().apply_to("1+2*3", THREAD_TEST_CASES[0][1], "<text>").tree
+    if get_dot_node_labels(tree, max_depth = 0) != [ "Expression" ]:
+        raise GrammarException("Graph is deeper than its maximum depth")
+    if "Product" in get_dot_node_labels(tree, collapse_rules = { "Sum" }):
+        raise GrammarException("Graph has children of a collapsed rule")
+    selected = get_dot_node_labels(tree, select_rule = "Product")
+    if selected[0] != "Product" or "Sum" in selected:
+        raise GrammarException("Graph has nodes outside the selected rule")
+
+QUERY_TEST_CASES = [
+    # Selector and the text of every tree it selects, in document order
+    ("Product", [ "1", "2*3", "4" ]),
+    ("Sum > Product", [ "1", "2*3", "4" ]),
+    ("Product Atom", [ "1", "2", "3", "4" ]),
+    ("Expression > Atom", []),
+    ("Product > *", [ "1", "2", "*", "3", "4" ]),
+    ("\"-\", Product > \"*\"", [ "*", "-" ]),
+]
+
+def test_query():
+    # Selectors found through the index match the tree they were built on
+    grammar_path, entry_rule, _ = THREAD_TEST_CASES[0]
+    print("INFO: Querying an indexed tree")
+
+    tree = GrammarLoader(path = grammar_path).get_grammar().apply_to("1+2*3-4", entry_rule, "<text>").tree
+    index = ParseTreeIndex(tree)
+
+    for selector, expected in QUERY_TEST_CASES:
+        got = [ str(tree) for tree in index.select(selector) ]
+        if got != expected:
+            raise GrammarException(f"Selector '{selector}' selected {got} instead of {expected}")
+
+    operator = index.select_one("\"*\"")
+    if str(index.get_parent(operator)) != "2*3" or index.get_depth(operator) != 3:
+        raise GrammarException("Operator has the wrong parent or depth")
+    if str(index.get_previous_sibling(operator)) != "2" or str(index.get_next_sibling(operator)) != "3":
+        raise GrammarException("Operator has the wrong siblings")
+
+async def run_server_requests(server: GrammarServer.GrammarServer, cases: list[tuple[str, str, str, str]]) -> list[tuple[dict, bytes]]:
+    await server.start_tcp()
+    try:
+        host, port = server.get_addresses()[0][:2]
+        reader, writer = await asyncio.open_connection(host, port)
+        responses = [ await GrammarServer.request(reader, writer, name, rule, text, format = format) for name, rule, text, format in cases ]
+        # The server ends the connection once it read everything, so it is
+        # not cancelled by closing the server
+        writer.write_eof()
+        await reader.read()
+        writer.close()
+        await writer.wait_closed()
+        return responses
+    finally:
+        await server.close()
+
+def test_server():
+    # Requests on one connection are answered in order, with the same tree
+    # a parse in this process returns
+    grammar_path, entry_rule, filename = THREAD_TEST_CASES[0]
+    print(f"INFO: Serving '{grammar_path}'")
+
+    grammar = GrammarLoader(path = grammar_path).get_grammar()
+    with open(filename, "r") as f:
+        text = f.read()
+
+    cases = [
+        ("algebra", entry_rule, text, GrammarServer.FORMAT_BINARY),
+        ("algebra", entry_rule, text, GrammarServer.FORMAT_JSON),
+        ("algebra", entry_rule, "1+2)", GrammarServer.FORMAT_BINARY),
+        ("unknown", entry_rule, text, GrammarServer.FORMAT_BINARY),
+    ]
+    responses = asyncio.run(run_server_requests(GrammarServer.GrammarServer({ "algebra": grammar }, max_workers = 2), cases))
+
+    tree = grammar.apply_to(text, entry_rule, None).tree
+    expected = [
+        (GrammarServer.STATUS_OK, GrammarSerializer.dumps(tree, text)),
+        (GrammarServer.STATUS_OK, GrammarSerializer.tree_to_json(tree).encode("utf-8")),
+        (GrammarServer.STATUS_PARTIAL, None),
+        (GrammarServer.STATUS_ERROR, b""),
+    ]
+    for (header, body), (status, expected_body) in zip(responses, expected):
+        if header["status"] != status or (expected_body is not None and body != expected_body):
+            raise GrammarException(f"Server answered {header} instead of status '{status}'")
+
+def test_budgets(max_steps = 1000):
+    # Each limit stops the parse with a profile of the work done, a limit
+    # that is not reached changes nothing
+    grammar_path, entry_rule, filename = THREAD_TEST_CASES[2]
+    print(f"INFO: Limiting the parse of '{filename}'")
+
+    grammar = GrammarLoader(path = grammar_path).get_grammar()
+    with open(filename, "r") as f:
+        text = f.read()
+
+    cancellation = CancellationToken()
+    cancellation.cancel()
+    limits = [
+        ({ "max_steps": max_steps }, "steps"),
+        ({ "deadline": time.monotonic() }, "deadline"),
+        ({ "cancellation": cancellation }, "cancelled"),
+    ]
+    for limit, message in limits:
+        try:
+            grammar.apply_to(text, entry_rule, filename, **limit)
+        except ParseLimitExceeded as e:
+            if message not in str(e) or e.profile.steps <= 0 or e.farthest_match_position is None:
+                raise GrammarException(f"Limit {limit} was reported as '{e}'")
+            if "max_steps" in limit and e.profile.steps != max_steps + 1:
+                raise GrammarException(f"Parse stopped after {e.profile.steps} steps instead of {max_steps + 1}")
+            continue
+        raise GrammarException(f"Limit {limit} did not stop the parse")
+
+    reference = grammar.apply_to(text, entry_rule, filename)
+    result = grammar.apply_to(text, entry_rule, filename, max_steps = 10**9, deadline = time.monotonic() + 3600, cancellation = CancellationToken())
+    if GrammarSerializer.dumps(result.tree) != GrammarSerializer.dumps(reference.tree):
+        raise GrammarException("Limits that were not reached changed the parse")
+
+RECOVERY_TEXT = """fn<> a():
+\tx = 1
+
+fn<> b():
+\tx = a +
+
+fn<> c():
+\ty = 2 2
+
+fn<> d():
+\tz = 3
+"""
+
+def test_recovery():
+    # Texts without errors give the same tree as 'apply_to', errors are
+    # skipped up to the next line that starts a new item
+    for grammar_path, entry_rule, filename in THREAD_TEST_CASES:
+        with open(filename, "r") as f:
+            text = f.read()
+
+        print(f"INFO: Recovering while parsing '{filename}'")
+
+        grammar = GrammarLoader(path = grammar_path).get_grammar()
+        reference = grammar.apply_to(text, entry_rule, filename)
+        result = grammar.apply_with_recovery(text, entry_rule, filename)
+        if len(result.errors) > 0 or GrammarSerializer.dumps(result.tree) != GrammarSerializer.dumps(reference.tree):
+            raise GrammarException(f"Recovering parse of '{filename}' differs from the parsed one")
+
+    result = grammar.apply_with_recovery(RECOVERY_TEXT, entry_rule, "<recovery>")
+    items = [ (child.name, str(child)) for child in result.tree.children ]
+    expected = [
+        ("StatementFunctionDeclDef", "ax=1"),
+        ("Error", "\n\nfn<> b():\n\tx = a +\n\n"),
+        ("StatementFunctionDeclDef", "cy=2"),
+        ("Error", " 2\n\n"),
+        ("StatementFunctionDeclDef", "dz=3"),
+    ]
+    if items != expected:
+        raise GrammarException(f"Recovering parse kept {items} instead of {expected}")
+    if [ error.message for error in result.errors ] != [ "FAIL: <recovery>:5:9: Expected expression after operator", None ]:
+        raise GrammarException(f"Recovering parse reported {[ error.message for error in result.errors ]}")
+
+EXPECTED_GRAMMAR = """Digit: '09'
+
+Let(hidden): "let"
+
+Statement:
+    ( Let " " Name "=" Digit )
+    ( "print " Digit )
+
+Name(fuse): 'az'+
+
+Letter: [ "a" "b" "c" "d" "e" "f" "g" "h" "i" "j" "k" "l" "m" "n" "o" "p" "q" "r" "s" "t" ]
+"""
+
+EXPECTED_TEST_CASES = [
+    # Entry rule, text, where the farthest failure is and what was expected there
+    ("Statement", "let x=", 6, [ "Digit" ]),
+    ("Statement", "let x=a", 6, [ "Digit" ]),
+    ("Statement", "let 1", 4, [ "Name" ]),
+    ("Statement", "prin", 0, [ "\"let\"", "\"print \"" ]),
+    ("Letter", "0", 0, [ f"\"{letter}\"" for letter in "abcdefghijklmnop" ]),
+]
+
+def test_expected():
+    # Rules sum up what failed inside them, hidden rules are never listed
+    # and the list is cut off after MAX_EXPECTED_MATCHERS entries
+    print("INFO: Collecting expected input")
+
+    tree = load_internal_grammar().apply_to(EXPECTED_GRAMMAR, "Grammar", "<expected>").tree
+    grammar = GrammarLoader(init_tree = tree).get_grammar()
+
+    for entry_rule, text, index, expected in EXPECTED_TEST_CASES:
+        result = grammar.apply_to(text, entry_rule, "<text>")
+        if result.expected_position.index != index or result.expected != expected:
+            raise GrammarException(f"Parsing '{text}' expected {result.expected} at {result.expected_position.index} instead of {expected} at {index}")
+
+ACTION_GRAMMAR = """Tag(fuse): 'az'+
+
+Text(fuse): "<"!*
+
+Element:
+    ( "<" Tag{ onMatch: push(_, tags) } ">" Text "</" :tags.0: ">"_{ onMatch: pop(tags) } )
+
+Boolean:
+    "yes"->"true"
+    "no"->"false"
+    "maybe"_->Unknown
+
+Swapped:
+    ( 'az'{ onMatch: push(_, letters) } 'az'{ onMatch: push(_, letters) } "."_->:letters.0: "."_->:letters.1: ""_{ onMatch: [ pop(letters), pop(letters) ] } )
+
+Checked:
+    ( "(" 'az' ")"{ onFail: fail("Expected ')'") } )
+"""
+
+ACTION_TEST_CASES = [
+    # Entry rule, text and the resulting tree, or the message of the error
+    ("Element", "<ab>hi</ab>", "Element(< Tag(ab) > Text(hi) </ ab)"),
+    ("Boolean", "yes", "Boolean(true)"),
+    ("Boolean", "maybe", "Boolean(Unknown())"),
+    ("Swapped", "xy..", "Swapped(x y y x)"),
+    ("Checked", "(a", "FAIL: <text>:1:3: Expected ')'"),
+]
+
+def test_actions():
+    # Actions and replacements compiled when the grammar is created, also
+    # after the grammar was sent to another process
+    print("INFO: Running compiled actions")
+
+    tree = load_internal_grammar().apply_to(ACTION_GRAMMAR, "Grammar", "<actions>").tree
+    grammar = GrammarLoader(init_tree = tree).get_grammar()
+
+    for current in [ grammar, pickle.loads(pickle.dumps(grammar)) ]:
+        for entry_rule, text, expected in ACTION_TEST_CASES:
+            try:
+                got = get_tree_shape(current.apply_to(text, entry_rule, "<text>").tree, set())
+            except GrammarException as e:
+                got = str(e)
+            if got != expected:
+                raise GrammarException(f"Actions on '{text}' gave {got} instead of {expected}")
+
+def test_linking(grammar_path = "grammars/qinp_grammar.qgr"):
+    # Rule references are bound to the rules of their grammar, which can
+    # neither be changed nor be used by another grammar afterwards
+    print(f"INFO: Linking '{grammar_path}'")
+
+    grammar = GrammarLoader(path = grammar_path).get_grammar()
+
+    matchers = list(grammar.rules.values())
+    while len(matchers) > 0:
+        matcher = matchers.pop()
+        if isinstance(matcher, MatcherMatchRule) and matcher._rule is not grammar.rules[matcher.rulename]:
+            raise GrammarException(f"Reference to '{matcher.rulename}' is not bound to the rule")
+        matchers.extend(matcher._get_sub_matchers())
+
+    rule = grammar.rules["GlobalCode"]
+    changes = [
+        lambda: setattr(rule, "token", True),
+        lambda: setattr(rule.options[0], "inverted", True),
+        lambda: Grammar(dict(grammar.rules)),
+    ]
+    for change in changes:
+        try:
+            change()
+        except GrammarException:
+            continue
+        raise GrammarException("Linked rules could be changed")
+
+    try:
+        grammar.rules["GlobalCode"] = rule
+    except TypeError:
+        return
+    raise GrammarException("Rules of a grammar could be replaced")
+
 if __name__ == "__main__":
     try:
         #test_qism()
         #cProfile.run("test_qinp(True)", sort="tottime")
         #test_qinp(False)
         #test_algebra()
+        #test_threads()
+        #test_parallel()
+        #test_native()
+        #test_tokens()
+        #test_skip_stack()
+        #test_lazy()
+        #test_lazy_comments()
+        #test_lazy_support()
+        #test_indentation()
+        #test_cuts()
+        #test_projection()
+        #test_interning()
+        #test_reordering()
+        #test_failed_stacks()
+        #test_generated_code()
+        #test_deep_tree()
+        #test_precedence()
+        #test_left_recursion()
+        #test_streaming()
+        #test_cache()
+        #test_dot_writer()
+        #test_query()
+        #test_server()
+        #test_budgets()
+        #test_recovery()
+        #test_expected()
+        #test_actions()
+        #test_linking()
         test_grammar(False)
     except GrammarException as e:
         print(f"  ERROR: {e}")
\ No newline at end of file
@@ -0,0 +1,119 @@
+from Grammar import Grammar
+from GrammarTools import Position
+from GrammarException import GrammarException
+from GrammarParseTree import ParseTree, ParseTreeNode, ParseTreeExactMatch, ParseEventHandler
+
+# Handlers are methods named HANDLER_PREFIX + rule name, e.g. 'on_Sum'.
+# They are looked up once per instance, dispatching a node is a single
+# dictionary lookup afterwards.
+HANDLER_PREFIX = "on_"
+
+def collect_handlers(instance) -> dict[str, callable]:
+    handlers = {}
+    for attribute in dir(type(instance)):
+        if attribute.startswith(HANDLER_PREFIX) and callable(getattr(type(instance), attribute)):
+            handlers[attribute[len(HANDLER_PREFIX):]] = getattr(instance, attribute)
+    return handlers
+
+class Visitor:
+    def __init__(self) -> None:
+        self.__handlers = collect_handlers(self)
+
+    def visit(self, tree: ParseTree) -> None:
+        # Calls the handler of every named node before the ones of its
+        # children, in document order. Unnamed nodes only pass on their children.
+        handlers = self.__handlers
+        stack = [ tree ]
+        while len(stack) > 0:
+            tree = stack.pop()
+            if isinstance(tree, ParseTreeNode):
+                if tree.name is not None:
+                    handlers.get(tree.name, self.visit_default)(tree)
+                stack.extend(reversed(tree.children))
+            else:
+                self.visit_leaf(tree)
+
+    def visit_default(self, node: ParseTreeNode) -> None:
+        pass
+
+    def visit_leaf(self, leaf: ParseTreeExactMatch) -> None:
+        pass
+
+class Transformer(ParseEventHandler):
+    # Transforms trees bottom-up. Handlers receive the node and the already
+    # transformed values of its children, their return value replaces the
+    # node. Unnamed nodes are dissolved, their children's values are passed
+    # to the enclosing named node instead.
+    def __init__(self) -> None:
+        self.__handlers = collect_handlers(self)
+
+        # Stream state, one (node, values) frame per entered rule
+        self.__frames: list[tuple[ParseTreeNode, list]] = []
+        self.__result = None
+
+    def transform(self, tree: ParseTree):
+        if not isinstance(tree, ParseTreeNode):
+            return self.transform_leaf(tree)
+
+        handlers = self.__handlers
+        frames = [ (tree, iter(tree.children), []) ]
+        while True:
+            node, children, values = frames[-1]
+
+            child = next(children, None)
+            if child is None:
+                frames.pop()
+                if len(frames) > 0 and node.name is None:
+                    frames[-1][2].extend(values)
+                    continue
+
+                result = handlers.get(node.name, self.transform_default)(node, values)
+                if len(frames) == 0:
+                    return result
+                frames[-1][2].append(result)
+            elif isinstance(child, ParseTreeNode):
+                frames.append((child, iter(child.children), []))
+            else:
+                values.append(self.transform_leaf(child))
+
+    def parse(self, grammar: Grammar, text: str, rule: str, filename: str):
+        # Fused with parsing: every part of the text that a cut commits is
+        # transformed right away. The nodes given to handlers carry name and
+        # positions, but no children.
+        self.__frames = []
+        self.__result = None
+
+        grammar.stream_to(self, text, rule, filename)
+
+        if len(self.__frames) > 0:
+            raise GrammarException("Incomplete event stream")
+
+        return self.__result
+
+    def transform_default(self, node: ParseTreeNode, children: list):
+        result = ParseTreeNode(node.position_begin)
+        result.name = node.name
+        result.position_end = node.position_end
+        result.children = children
+        return result
+
+    def transform_leaf(self, leaf: ParseTreeExactMatch):
+        return leaf
+
+    def enter(self, name: str, position_begin: Position) -> None:
+        node = ParseTreeNode(position_begin)
+        node.name = name
+        self.__frames.append((node, []))
+
+    def leaf(self, value: str, position_begin: Position, position_end: Position) -> None:
+        self.__frames[-1][1].append(self.transform_leaf(ParseTreeExactMatch(value, position_begin, position_end)))
+
+    def exit(self, name: str, position_end: Position) -> None:
+        node, values = self.__frames.pop()
+        node.position_end = position_end
+
+        result = self.__handlers.get(name, self.transform_default)(node, values)
+        if len(self.__frames) > 0:
+            self.__frames[-1][1].append(result)
+        else:
+            self.__result = result
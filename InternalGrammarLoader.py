@@ -4,52 +4,58 @@ from GrammarRule import Rule, MatcherMatchAnyChar
 from GrammarRule import MatcherMatchAll, MatcherMatchAny
 from GrammarRule import MatcherMatchRange, MatcherMatchExact
 from GrammarRule import MatcherMatchRule, MatcherMatchStack
+from GrammarRule import MatcherMatchIndentation, MatcherMatchPrecedence, MatcherCut
 
 def load_internal_grammar() -> Grammar:
     rules: dict[str, Rule] = {}
-    rules['Grammar'] = Rule(name="Grammar", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchRule("GrammarLine", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("Newline", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("GrammarLine", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['GrammarLine'] = Rule(name="GrammarLine", anonymous=True, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchRule("RuleDefinition", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Comment", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("Comment", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Newline", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=True, omit_match=True, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['RuleDefinition'] = Rule(name="RuleDefinition", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchRule("RuleHeader", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("Newline", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("RuleBody", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected rule body")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['RuleHeader'] = Rule(name="RuleHeader", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchRule("Identifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("RuleModifierList", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchExact(":", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ':'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['RuleBody'] = Rule(name="RuleBody", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchRule("RuleOptionDefinition", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("Newline", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("RuleOptionDefinition", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['RuleModifierList'] = Rule(name="RuleModifierList", anonymous=True, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("(", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("RuleModifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected at least one rule modifier")])]})), MatcherMatchAll([MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("RuleModifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchExact(")", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ')'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['RuleModifier'] = Rule(name="RuleModifier", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchExact("hidden", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("fuse", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("collapse", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['RuleOptionDefinition'] = Rule(name="RuleOptionDefinition", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchRule("FullMatcher", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("FullMatcher", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['FullMatcher'] = Rule(name="FullMatcher", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchRule("Matcher", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherModifiers", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherActions", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['Matcher'] = Rule(name="Matcher", anonymous=True, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchRule("MatchAnyChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatchAll", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatchAny", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatchRange", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatchExact", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatchRule", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatchStack", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatchAnyChar'] = Rule(name="MatchAnyChar", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchExact(".", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatchExact'] = Rule(name="MatchExact", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchRule("String", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatchRule'] = Rule(name="MatchRule", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchRule("Identifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatchAll'] = Rule(name="MatchAll", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("(", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("FullMatcher", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("FullMatcher", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact(")", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ')'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatchAny'] = Rule(name="MatchAny", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("[", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("FullMatcher", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("FullMatcher", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("]", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ']'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatchRange'] = Rule(name="MatchRange", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("'", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("MatchRangeChar", initializers=MatcherInitializers(inverted=False, count_min=2, count_max=2, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected exactly two characters")])]})), MatcherMatchExact("'", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected '''")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatchStack'] = Rule(name="MatchStack", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact(":", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Identifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected stack name")])]})), MatcherMatchExact(".", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected '.'")])]})), MatcherMatchRule("Integer", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected stack index")])]})), MatcherMatchExact(":", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ':'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatcherModifiers'] = Rule(name="MatcherModifiers", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchRule("MatcherModifierInvert", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherModifierQuantifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherModifierLookAhead", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherModifierOmitMatch", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherModifierReplaceMatch", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatcherModifierQuantifier'] = Rule(name="MatcherModifierQuantifier", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchExact("?", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("*", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("+", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=(0, 'QuantifierSymbolic'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("#", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Integer", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("-", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Integer", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected quantifier range maximum value")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=(0, 'QuantifierRange'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("#", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Integer", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=(0, 'QuantifierExact'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("#>", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Integer", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected lower bound value")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=(0, 'QuantifierLowerBound'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("#<", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Integer", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected upper bound value")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=(0, 'QuantifierUpperBound'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatcherModifierReplaceMatch'] = Rule(name="MatcherModifierReplaceMatch", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchExact("->", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchAny([MatcherMatchRule("Identifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("String", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatchStack", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected identifier, string or stack reference")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatcherModifierInvert'] = Rule(name="MatcherModifierInvert", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchExact("!", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatcherModifierLookAhead'] = Rule(name="MatcherModifierLookAhead", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchExact("~", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatcherModifierOmitMatch'] = Rule(name="MatcherModifierOmitMatch", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchExact("_", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatcherActions'] = Rule(name="MatcherActions", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("{", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatcherTrigger", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact(",", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherTrigger", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("}", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected '}'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatcherTrigger'] = Rule(name="MatcherTrigger", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchRule("Identifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact(":", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ':'")])]})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherActionList", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected matcher action list")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatcherActionList'] = Rule(name="MatcherActionList", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("[", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatcherAction", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact(",", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherAction", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected matcher action after ','")])]}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("]", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ']'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatcherAction", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected matcher action")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatcherAction'] = Rule(name="MatcherAction", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchRule("Identifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherActionArgumentList", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatcherActionArgumentList'] = Rule(name="MatcherActionArgumentList", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("(", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatcherActionArgument", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact(",", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherActionArgument", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected matcher action argument after ','")])]}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact(")", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ')'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatcherActionArgument'] = Rule(name="MatcherActionArgument", anonymous=True, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchRule("Identifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("String", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("_", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=(0, 'MatchedText'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['Identifier'] = Rule(name="Identifier", anonymous=False, fuse_children=True, collapse=False, options=[MatcherMatchAll([MatcherMatchRule("AlphaChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("AlnumChar", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['Comment'] = Rule(name="Comment", anonymous=False, fuse_children=True, collapse=False, options=[MatcherMatchAll([MatcherMatchExact("\\\\", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("Newline", initializers=MatcherInitializers(inverted=True, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['Integer'] = Rule(name="Integer", anonymous=False, fuse_children=True, collapse=False, options=[MatcherMatchAll([MatcherMatchExact("0x", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("HexChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected hexadecimal integer literal")])]})), MatcherMatchExact("", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=(0, 'FormatHex'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("0b", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("BinChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected binary integer literal")])]})), MatcherMatchExact("", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=(0, 'FormatBin'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("0", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("OctChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=(0, 'FormatOct'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("DecChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=(0, 'FormatDec'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['String'] = Rule(name="String", anonymous=False, fuse_children=True, collapse=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("\"", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("StringChar", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("\"", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected '")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['EscapeSequence'] = Rule(name="EscapeSequence", anonymous=False, fuse_children=True, collapse=False, options=[MatcherMatchAll([MatcherMatchExact("\\", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchAny([MatcherMatchExact("a", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("b", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("e", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("f", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("n", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("r", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("t", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("v", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("\\", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("'", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("\"", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("\\", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchExact("x", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("HexChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("HexChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected hexadecimal escape sequence")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['MatchRangeChar'] = Rule(name="MatchRangeChar", anonymous=False, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchRule("EscapeSequence", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAnyChar(initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['StringChar'] = Rule(name="StringChar", anonymous=True, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchRule("EscapeSequence", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("\"", initializers=MatcherInitializers(inverted=True, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['AlphaChar'] = Rule(name="AlphaChar", anonymous=True, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchRange("a", "z", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRange("A", "Z", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['HexChar'] = Rule(name="HexChar", anonymous=True, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchRange("0", "9", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRange("a", "f", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRange("A", "F", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['BinChar'] = Rule(name="BinChar", anonymous=True, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchRange("0", "1", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['OctChar'] = Rule(name="OctChar", anonymous=True, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchRange("0", "7", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['DecChar'] = Rule(name="DecChar", anonymous=True, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchRange("0", "9", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['AlnumChar'] = Rule(name="AlnumChar", anonymous=True, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchRule("AlphaChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("DecChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['Newline'] = Rule(name="Newline", anonymous=True, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchExact("\n", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['Whitespace'] = Rule(name="Whitespace", anonymous=False, fuse_children=True, collapse=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchExact(" ", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("\t", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
-    rules['WoNwoC'] = Rule(name="WoNwoC", anonymous=True, fuse_children=False, collapse=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Newline", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Comment", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['Grammar'] = Rule(name="Grammar", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchRule("GrammarLine", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("Newline", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("GrammarLine", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['GrammarLine'] = Rule(name="GrammarLine", anonymous=True, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchRule("RuleDefinition", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Comment", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("Comment", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Newline", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=True, omit_match=True, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['RuleDefinition'] = Rule(name="RuleDefinition", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchRule("RuleHeader", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("Newline", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("RuleBody", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected rule body")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['RuleHeader'] = Rule(name="RuleHeader", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchRule("Identifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("RuleModifierList", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchExact(":", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ':'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['RuleBody'] = Rule(name="RuleBody", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchRule("RuleOptionDefinition", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("Newline", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("RuleOptionDefinition", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['RuleModifierList'] = Rule(name="RuleModifierList", anonymous=True, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("(", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("RuleModifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected at least one rule modifier")])]})), MatcherMatchAll([MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("RuleModifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchExact(")", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ')'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['RuleModifier'] = Rule(name="RuleModifier", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchExact("hidden", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("fuse", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("collapse", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("token", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("skipping", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("skip", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("lazy", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("comment", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['RuleOptionDefinition'] = Rule(name="RuleOptionDefinition", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchRule("FullMatcher", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("FullMatcher", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['FullMatcher'] = Rule(name="FullMatcher", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchRule("Matcher", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherModifiers", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherActions", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['Matcher'] = Rule(name="Matcher", anonymous=True, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchRule("MatchAnyChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatchAll", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatchAny", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatchRange", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatchExact", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatchRule", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatchIndentation", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatchStack", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatchPrecedence", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatchCut", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatchAnyChar'] = Rule(name="MatchAnyChar", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchExact(".", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatchCut'] = Rule(name="MatchCut", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchExact("^", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatchExact'] = Rule(name="MatchExact", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchRule("String", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatchRule'] = Rule(name="MatchRule", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchRule("Identifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatchAll'] = Rule(name="MatchAll", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("(", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("FullMatcher", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("FullMatcher", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact(")", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ')'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatchAny'] = Rule(name="MatchAny", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("[", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("FullMatcher", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("FullMatcher", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("]", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ']'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatchRange'] = Rule(name="MatchRange", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("'", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("MatchRangeChar", initializers=MatcherInitializers(inverted=False, count_min=2, count_max=2, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected exactly two characters")])]})), MatcherMatchExact("'", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected '''")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatchStack'] = Rule(name="MatchStack", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact(":", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Identifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected stack name")])]})), MatcherMatchExact(".", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected '.'")])]})), MatcherMatchRule("Integer", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected stack index")])]})), MatcherMatchExact(":", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ':'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatchIndentation'] = Rule(name="MatchIndentation", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact(":", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchAny([MatcherMatchExact("indent", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("same", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("dedent", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact(":", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatchPrecedence'] = Rule(name="MatchPrecedence", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("<", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("FullMatcher", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected operand matcher")])]})), MatcherMatchAll([MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("PrecedenceOperator", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected at least one precedence operator")])]})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact(">", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected '>'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['PrecedenceOperator'] = Rule(name="PrecedenceOperator", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchRule("Integer", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("PrecedenceAssociativity", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected associativity")])]})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Identifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected operator node name")])]})), MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchExact(":", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ':'")])]})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("FullMatcher", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected operator matcher")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['PrecedenceAssociativity'] = Rule(name="PrecedenceAssociativity", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchExact("left", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("right", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatcherModifiers'] = Rule(name="MatcherModifiers", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchRule("MatcherModifierInvert", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherModifierQuantifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherModifierLookAhead", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherModifierOmitMatch", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherModifierReplaceMatch", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatcherModifierQuantifier'] = Rule(name="MatcherModifierQuantifier", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchExact("?", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("*", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("+", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=(0, 'QuantifierSymbolic'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("#", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Integer", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("-", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Integer", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected quantifier range maximum value")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=(0, 'QuantifierRange'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("#", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Integer", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=(0, 'QuantifierExact'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("#>", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Integer", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected lower bound value")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=(0, 'QuantifierLowerBound'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("#<", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Integer", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected upper bound value")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=(0, 'QuantifierUpperBound'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatcherModifierReplaceMatch'] = Rule(name="MatcherModifierReplaceMatch", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchExact("->", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchAny([MatcherMatchRule("Identifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("String", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatchStack", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected identifier, string or stack reference")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatcherModifierInvert'] = Rule(name="MatcherModifierInvert", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchExact("!", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatcherModifierLookAhead'] = Rule(name="MatcherModifierLookAhead", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchExact("~", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatcherModifierOmitMatch'] = Rule(name="MatcherModifierOmitMatch", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchExact("_", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatcherActions'] = Rule(name="MatcherActions", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("{", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatcherTrigger", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact(",", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherTrigger", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("}", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected '}'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatcherTrigger'] = Rule(name="MatcherTrigger", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchRule("Identifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact(":", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ':'")])]})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherActionList", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected matcher action list")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatcherActionList'] = Rule(name="MatcherActionList", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("[", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatcherAction", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact(",", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherAction", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected matcher action after ','")])]}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("]", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ']'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatcherAction", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected matcher action")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatcherAction'] = Rule(name="MatcherAction", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchRule("Identifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherActionArgumentList", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatcherActionArgumentList'] = Rule(name="MatcherActionArgumentList", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("(", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("MatcherActionArgument", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact(",", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("MatcherActionArgument", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected matcher action argument after ','")])]}))], initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("WoNwoC", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact(")", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected ')'")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatcherActionArgument'] = Rule(name="MatcherActionArgument", anonymous=True, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchRule("Identifier", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("String", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("_", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=(0, 'MatchedText'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['Identifier'] = Rule(name="Identifier", anonymous=False, fuse_children=False, collapse=False, token=True, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchRule("AlphaChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("AlnumChar", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['Comment'] = Rule(name="Comment", anonymous=False, fuse_children=False, collapse=False, token=True, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchExact("\\\\", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("Newline", initializers=MatcherInitializers(inverted=True, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['Integer'] = Rule(name="Integer", anonymous=False, fuse_children=True, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchExact("0x", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("HexChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected hexadecimal integer literal")])]})), MatcherMatchExact("", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=(0, 'FormatHex'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("0b", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("BinChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected binary integer literal")])]})), MatcherMatchExact("", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=(0, 'FormatBin'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("0", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("OctChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=(0, 'FormatOct'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("DecChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=(0, 'FormatDec'), actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['String'] = Rule(name="String", anonymous=False, fuse_children=True, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAll([MatcherMatchExact("\"", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("StringChar", initializers=MatcherInitializers(inverted=False, count_min=0, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("\"", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={"onFail": [("fail", [(0, "Expected '")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['EscapeSequence'] = Rule(name="EscapeSequence", anonymous=False, fuse_children=True, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchExact("\\", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchAny([MatcherMatchExact("a", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("b", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("e", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("f", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("n", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("r", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("t", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("v", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("\\", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("'", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("\"", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchExact("\\", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchExact("x", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAll([MatcherMatchRule("HexChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("HexChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={"onFail": [("fail", [(0, "Expected hexadecimal escape sequence")])]}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['MatchRangeChar'] = Rule(name="MatchRangeChar", anonymous=False, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchRule("EscapeSequence", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchAnyChar(initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['StringChar'] = Rule(name="StringChar", anonymous=True, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchRule("EscapeSequence", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("\"", initializers=MatcherInitializers(inverted=True, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['AlphaChar'] = Rule(name="AlphaChar", anonymous=True, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchRange("a", "z", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRange("A", "Z", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['HexChar'] = Rule(name="HexChar", anonymous=True, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchRange("0", "9", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRange("a", "f", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRange("A", "F", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['BinChar'] = Rule(name="BinChar", anonymous=True, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchRange("0", "1", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['OctChar'] = Rule(name="OctChar", anonymous=True, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchRange("0", "7", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['DecChar'] = Rule(name="DecChar", anonymous=True, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchRange("0", "9", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['AlnumChar'] = Rule(name="AlnumChar", anonymous=True, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchRule("AlphaChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchRule("DecChar", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['Newline'] = Rule(name="Newline", anonymous=True, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchExact("\n", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['Whitespace'] = Rule(name="Whitespace", anonymous=False, fuse_children=False, collapse=False, token=True, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchExact(" ", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={})), MatcherMatchExact("\t", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
+    rules['WoNwoC'] = Rule(name="WoNwoC", anonymous=True, fuse_children=False, collapse=False, token=False, skip=False, skipping=False, lazy=False, comment=False, options=[MatcherMatchAll([MatcherMatchAny([MatcherMatchRule("Whitespace", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Newline", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=True, match_repl=None, actions={})), MatcherMatchRule("Comment", initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=-1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))], initializers=MatcherInitializers(inverted=False, count_min=1, count_max=1, look_ahead=False, omit_match=False, match_repl=None, actions={}))
     return Grammar(rules=rules)
@@ -0,0 +1,35 @@
+#pragma once
+
+#include <stddef.h>
+
+// C interface of libQrawlr, e.g. for ctypes (see GrammarNative.py).
+// Functions that can fail return 0 on success. Otherwise '*error' is set to
+// a message that has to be released with qrawlr_free.
+
+#if defined(QRAWLR_PLATFORM_WIN32)
+    #define QRAWLR_API __declspec(dllexport)
+#else
+    #define QRAWLR_API __attribute__((visibility("default")))
+#endif
+
+#ifdef __cplusplus
+extern "C"
+{
+#endif
+
+    typedef struct qrawlr_grammar qrawlr_grammar;
+
+    QRAWLR_API int qrawlr_grammar_load_from_file(const char* path, qrawlr_grammar** grammar, char** error);
+    QRAWLR_API int qrawlr_grammar_load_from_text(const char* text, size_t text_size, const char* filename, qrawlr_grammar** grammar, char** error);
+    QRAWLR_API void qrawlr_grammar_free(qrawlr_grammar* grammar);
+
+    // '*tree' is the serialized tree (see GrammarSerializer.py) or NULL if
+    // the rule did not match. 'farthest' receives index, line and column of
+    // the farthest match. Indices count bytes of the utf-8 encoded text.
+    QRAWLR_API int qrawlr_grammar_apply_to(const qrawlr_grammar* grammar, const char* text, size_t text_size, const char* rule, const char* filename, char** tree, size_t* tree_size, int* farthest, char** error);
+
+    QRAWLR_API void qrawlr_free(void* data);
+
+#ifdef __cplusplus
+}
+#endif
@@ -4,6 +4,8 @@ namespace qrawlr
 {
     constexpr const char* TRIGGER_ON_MATCH = "onMatch";
     constexpr const char* TRIGGER_ON_FAIL  = "onFail";
+    // Only used by precedence matchers, when an operator is not followed by an operand
+    constexpr const char* TRIGGER_ON_MISSING_OPERAND = "onMissingOperand";
 
     constexpr const char* QUANTIFIER_ZERO_OR_ONE = "?";
     constexpr const char* QUANTIFIER_ZERO_OR_MORE = "*";
@@ -32,6 +32,8 @@ namespace qrawlr
         MatcherRef load_rule_option_definition_from_tree(ParseTreeNodeRef node);
         MatcherRef load_full_matcher_from_tree(ParseTreeNodeRef node);
         MatcherRef load_matcher_from_tree(ParseTreeNodeRef node);
+        MatcherRef load_match_precedence_from_tree(ParseTreeNodeRef node);
+        MatcherMatchPrecedence::Operator load_precedence_operator_from_tree(ParseTreeNodeRef node);
         void load_matcher_modifiers_from_tree(MatcherRef matcher, ParseTreeNodeRef node);
         void load_matcher_modifier_quantifier_from_tree(MatcherRef matcher, ParseTreeNodeRef node);
         void load_matcher_modifier_replace_match_from_tree(MatcherRef matcher, ParseTreeNodeRef node);
@@ -53,10 +53,10 @@ namespace qrawlr
         std::string actions_to_string() const;
         std::string action_list_to_string(const std::vector<Action>& actions) const;
         std::string action_args_to_string(const std::vector<Action::Arg>& args) const;
+        void run_actions_for_trigger(const std::string& trigger_name, const ParseTreeRef tree, ParseData& data, int index) const;
     private:
         MatchResult apply_invert(const ParseData& data, int index_old, ParseTreeRef tree) const;
         ParseTreeRef apply_optional_match_repl(ParseTreeRef tree, ParseData& data, int index) const;
-        void run_actions_for_trigger(const std::string& trigger_name, const ParseTreeRef tree, ParseData& data, int index) const;
     protected:
         virtual MatchResult match_impl(ParseData& data, int index) const = 0;
         virtual std::string to_string_impl() const = 0;
@@ -220,4 +220,83 @@ namespace qrawlr
         std::string m_stack_name;
         int m_index;
     };
+
+    // :indent: :same: :dedent:
+    class MatcherMatchIndentation : public Matcher
+    {
+    public:
+        MatcherMatchIndentation() = delete;
+        template <typename... Args>
+        MatcherMatchIndentation(const std::string& kind, Args... args)
+            : Matcher(args...), m_kind(kind)
+        {}
+        virtual ~MatcherMatchIndentation() = default;
+    protected:
+        virtual MatchResult match_impl(ParseData& data, int index) const override;
+        virtual std::string to_string_impl() const override;
+        virtual const char* get_matcher_name() const override { return "MatcherMatchIndentation"; }
+    public:
+        virtual std::string gen_cpp_code() const override;
+    private:
+        std::string m_kind;
+    };
+
+    // <...>
+    class MatcherMatchPrecedence : public Matcher
+    {
+    public:
+        enum class Associativity
+        {
+            Left,
+            Right,
+        };
+        struct Operator
+        {
+            int precedence;
+            Associativity associativity;
+            std::string name;
+            MatcherRef matcher;
+        };
+    public:
+        MatcherMatchPrecedence() = delete;
+        template <typename... Args>
+        MatcherMatchPrecedence(MatcherRef operand, const std::vector<Operator>& operators, Args... args)
+            : Matcher(args...), m_operand(operand), m_operators(operators)
+        {
+            if (!m_operand)
+                throw std::runtime_error("MatcherMatchPrecedence: operand is nullptr");
+            for (auto& op : m_operators)
+                if (!op.matcher)
+                    throw std::runtime_error("MatcherMatchPrecedence: operator matcher is nullptr");
+            sort_operators_by_precedence();
+        }
+        virtual ~MatcherMatchPrecedence() = default;
+    protected:
+        virtual MatchResult match_impl(ParseData& data, int index) const override;
+        virtual std::string to_string_impl() const override;
+        virtual const char* get_matcher_name() const override { return "MatcherMatchPrecedence"; }
+    public:
+        virtual std::string gen_cpp_code() const override;
+    private:
+        void sort_operators_by_precedence();
+    private:
+        MatcherRef m_operand;
+        std::vector<Operator> m_operators;
+        std::vector<Operator> m_operators_by_precedence;
+    };
+
+    // ^
+    class MatcherCut : public Matcher
+    {
+    public:
+        using Matcher::Matcher;
+        MatcherCut() = default;
+        virtual ~MatcherCut() = default;
+    protected:
+        virtual MatchResult match_impl(ParseData& data, int index) const override;
+        virtual std::string to_string_impl() const override;
+        virtual const char* get_matcher_name() const override { return "MatcherCut"; }
+    public:
+        virtual std::string gen_cpp_code() const override;
+    };
 } // namespace qrawlr
\ No newline at end of file
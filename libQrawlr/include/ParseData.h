@@ -7,6 +7,7 @@
 
 #include "RuleRef.h"
 #include "Position.h"
+#include "ParseTree.h"
 
 namespace qrawlr
 {
@@ -15,8 +16,24 @@ namespace qrawlr
     public:
         struct Checkpoint
         {
+            int indentation;
             std::map<std::string, int> stack_sizes;
         };
+        struct LeftRecursionHead
+        {
+            bool detected = false;
+            bool growing = false;
+            ParseTreeRef seed_tree;
+            int seed_index = -1;
+            std::set<int> recursive_options;
+            int base_option = -1;
+        };
+        struct ChoicePoint
+        {
+            bool has_alternatives;
+            bool can_cut;
+            bool cut = false;
+        };
     public:
         ParseData() = delete;
         ParseData(const std::string& text, const std::string& filename, const std::map<std::string, RuleRef>& rules);
@@ -28,6 +45,18 @@ namespace qrawlr
         std::set<std::string> get_stack_names() const;
         std::vector<std::string>& get_stack(const std::string& name) { return m_stacks[name]; }
         std::vector<std::pair<std::string, std::string>>& get_stack_history(const std::string& name) { return m_stack_histories[name]; }
+        const std::string& get_indentation() const { return m_indentation_strings[m_indentation]; }
+        void push_indentation(const std::string& indentation);
+        bool pop_indentation();
+        int get_line_indentation(int index);
+        LeftRecursionHead* get_left_recursion_head(const std::string& rule_name, int index);
+        LeftRecursionHead* begin_left_recursion_head(const std::string& rule_name, int index);
+        void end_left_recursion_head(const std::string& rule_name, int index);
+        std::size_t push_choice_point(bool has_alternatives, bool can_cut = true);
+        void pop_choice_point() { m_choice_points.pop_back(); }
+        ChoicePoint& get_choice_point(std::size_t id) { return m_choice_points[id]; }
+        void cut(int index);
+        int get_committed_index() const { return m_committed_index; }
         bool eof(int index) const { return (std::size_t)index >= m_text.size(); }
         Checkpoint get_checkpoint() const;
         void restore_checkpoint(const Checkpoint& checkpoint);
@@ -35,8 +64,14 @@ namespace qrawlr
         bool stacks_are_empty() const;
         int get_farthest_match_index() const { return m_farthest_match_index; }
         void set_farthest_match_index(int index) { m_farthest_match_index = index; }
+        bool is_skipping() const { return m_skipping; }
+        void set_skipping(bool skipping) { m_skipping = skipping; }
+        int skip(int index);
     private:
         void generate_newline_indices();
+        void generate_line_indentations();
+        int find_indentation_end(int index) const;
+        void commit(int index);
     private:
         const int m_tree_id;
         std::string m_text;
@@ -44,8 +79,22 @@ namespace qrawlr
         const std::map<std::string, RuleRef>& m_rules;
         std::map<std::string, std::vector<std::string>> m_stacks;
         std::map<std::string, std::vector<std::pair<std::string, std::string>>> m_stack_histories;
+        std::map<std::string, int> m_stack_history_offsets;
+        // Indentation levels form a tree of (indentation, parent) nodes that is
+        // only ever appended to. The current level is a node id. Node 0 is column one.
+        std::vector<std::string> m_indentation_strings;
+        std::vector<int> m_indentation_parents;
+        int m_indentation;
+        std::map<int, int> m_line_indentations;
+        std::map<std::pair<std::string, int>, LeftRecursionHead> m_left_recursion_heads;
+        std::vector<ChoicePoint> m_choice_points;
         std::vector<int> m_newline_indices;
         int m_farthest_match_index;
+        int m_committed_index;
+        // The grammar's skip rule and where it ends per index it was tried at
+        RuleRef m_skip_rule;
+        std::map<int, int> m_skip_ends;
+        bool m_skipping;
     public:
         static const std::string& tree_id_to_name(int tree_id);
     private:
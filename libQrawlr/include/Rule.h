@@ -12,7 +12,17 @@ namespace qrawlr
         {
             Anonymous = 0,
             FuseChildren = 1,
-            Collapse = 2
+            Collapse = 2,
+            // Matched like any other rule here, only the tree is fused
+            Token = 3,
+            // The text matched by the skip rule is skipped between the
+            // parts of skipping rules, see ParseData::skip
+            Skip = 4,
+            Skipping = 5,
+            // Always parsed right away here
+            Lazy = 6,
+            // Only used to find the end of lazy rules
+            Comment = 7
         };
     public:
         Rule();
@@ -35,6 +45,10 @@ namespace qrawlr
         virtual std::string to_string_impl() const override;
         virtual std::string gen_cpp_code() const override;
     private:
+        MatchResult match_options(ParseData& data, int index, ParseData::LeftRecursionHead& head) const;
+        MatchResult match_options(ParseData& data, int index, ParseData::LeftRecursionHead& head, std::size_t choice_point) const;
+        MatchResult match_once(ParseData& data, int index, ParseData::LeftRecursionHead& head) const;
+        MatchResult grow_seed(ParseData& data, int index, ParseData::LeftRecursionHead& head, MatchResult result) const;
         void fuse_children(ParseTreeRef tree) const;
     protected:
         std::string m_name;
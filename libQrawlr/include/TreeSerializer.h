@@ -0,0 +1,11 @@
+#pragma once
+
+#include <string>
+
+#include "ParseTree.h"
+
+namespace qrawlr
+{
+    // Writes the binary format of GrammarSerializer.py (version 1, without a source hash)
+    std::string serialize_tree(ParseTreeRef tree);
+} // namespace qrawlr
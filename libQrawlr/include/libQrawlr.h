@@ -3,4 +3,5 @@
 #include "Grammar.h"
 #include "FileReader.h"
 #include "FileWriter.h"
-#include "EscapeString.h"
\ No newline at end of file
+#include "EscapeString.h"
+#include "TreeSerializer.h"
\ No newline at end of file
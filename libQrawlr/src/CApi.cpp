@@ -0,0 +1,97 @@
+#include "CApi.h"
+
+#include <cstdlib>
+#include <cstring>
+#include <exception>
+
+#include "Grammar.h"
+#include "TreeSerializer.h"
+
+struct qrawlr_grammar
+{
+    qrawlr::Grammar grammar;
+};
+
+static char* copy_to_buffer(const std::string& data)
+{
+    // Terminated, so messages can be used as C strings
+    char* buffer = (char*)std::malloc(data.size() + 1);
+    if (buffer != nullptr)
+    {
+        std::memcpy(buffer, data.data(), data.size());
+        buffer[data.size()] = '\0';
+    }
+    return buffer;
+}
+
+static int set_error(char** error, const char* message)
+{
+    if (error != nullptr)
+        *error = copy_to_buffer(message);
+    return 1;
+}
+
+extern "C"
+{
+    int qrawlr_grammar_load_from_file(const char* path, qrawlr_grammar** grammar, char** error)
+    {
+        try
+        {
+            *grammar = new qrawlr_grammar{ qrawlr::Grammar::load_from_file(path) };
+            return 0;
+        }
+        catch (const std::exception& e)
+        {
+            return set_error(error, e.what());
+        }
+    }
+
+    int qrawlr_grammar_load_from_text(const char* text, size_t text_size, const char* filename, qrawlr_grammar** grammar, char** error)
+    {
+        try
+        {
+            *grammar = new qrawlr_grammar{ qrawlr::Grammar::load_from_text(std::string(text, text_size), filename) };
+            return 0;
+        }
+        catch (const std::exception& e)
+        {
+            return set_error(error, e.what());
+        }
+    }
+
+    void qrawlr_grammar_free(qrawlr_grammar* grammar)
+    {
+        delete grammar;
+    }
+
+    int qrawlr_grammar_apply_to(const qrawlr_grammar* grammar, const char* text, size_t text_size, const char* rule, const char* filename, char** tree, size_t* tree_size, int* farthest, char** error)
+    {
+        try
+        {
+            auto result = grammar->grammar.apply_to(std::string(text, text_size), rule, filename);
+
+            farthest[0] = result.pos_end.index;
+            farthest[1] = result.pos_end.line;
+            farthest[2] = result.pos_end.column;
+
+            *tree = nullptr;
+            *tree_size = 0;
+            if (result.tree != nullptr)
+            {
+                auto data = qrawlr::serialize_tree(result.tree);
+                *tree = copy_to_buffer(data);
+                *tree_size = data.size();
+            }
+            return 0;
+        }
+        catch (const std::exception& e)
+        {
+            return set_error(error, e.what());
+        }
+    }
+
+    void qrawlr_free(void* data)
+    {
+        std::free(data);
+    }
+}
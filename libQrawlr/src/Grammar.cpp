@@ -21,7 +21,7 @@ namespace qrawlr
         if (auto node = get_node(result.tree); node != nullptr)
             node->set_name(rule_name);
         
-        if (!data.stacks_are_empty())
+        if (result.tree && !data.stacks_are_empty())
         {
             std::string data_str;
             for (const auto& stack_name : data.get_stack_names())
@@ -96,6 +96,18 @@ namespace qrawlr
             else
                 throw make_node_exception("[*load_from_tree*]: Expected node in grammar tree", child);
         }
+
+        int skip_rules = 0;
+        bool has_skipping_rules = false;
+        for (const auto& [name, rule] : m_rules)
+        {
+            if (rule->get_rule_flags().is_set(Rule::Flags::Skip))
+                ++skip_rules;
+            if (rule->get_rule_flags().is_set(Rule::Flags::Skipping))
+                has_skipping_rules = true;
+        }
+        if (has_skipping_rules && skip_rules != 1)
+            throw GrammarException("Grammar has skipping rules and " + std::to_string(skip_rules) + " skip rules instead of one");
     }
 
     RuleRef Grammar::load_rule_definition_from_tree(ParseTreeNodeRef node) // "RuleDefinition"
@@ -144,6 +156,16 @@ namespace qrawlr
             rule->get_rule_flags().set(Rule::Flags::FuseChildren);
         else if (modifier_name == "collapse")
             rule->get_rule_flags().set(Rule::Flags::Collapse);
+        else if (modifier_name == "token")
+            rule->get_rule_flags().set(Rule::Flags::Token);
+        else if (modifier_name == "skip")
+            rule->get_rule_flags().set(Rule::Flags::Skip);
+        else if (modifier_name == "skipping")
+            rule->get_rule_flags().set(Rule::Flags::Skipping);
+        else if (modifier_name == "lazy")
+            rule->get_rule_flags().set(Rule::Flags::Lazy);
+        else if (modifier_name == "comment")
+            rule->get_rule_flags().set(Rule::Flags::Comment);
         else
             throw make_node_exception("Unknown rule modifier '" + modifier_name + "'", node);
     }
@@ -235,18 +257,80 @@ namespace qrawlr
             auto& rule_name = expect_child_leaf(node, "Identifier.0")->get_value();
             return std::make_shared<MatcherMatchRule>(rule_name);
         }
+        else if (node->get_name() == "MatchIndentation")
+        {
+            auto& kind = expect_child_leaf(node, "0")->get_value();
+            return std::make_shared<MatcherMatchIndentation>(kind);
+        }
         else if (node->get_name() == "MatchStack")
         {
             auto& stack_name = expect_child_leaf(node, "Identifier.0")->get_value();
             auto index = load_integer_from_tree(expect_child_node(node, "Integer"));
             return std::make_shared<MatcherMatchStack>(stack_name, index);
         }
+        else if (node->get_name() == "MatchPrecedence")
+        {
+            return load_match_precedence_from_tree(node);
+        }
+        else if (node->get_name() == "MatchCut")
+        {
+            return std::make_shared<MatcherCut>();
+        }
         else
         {
             throw make_node_exception("Unknown matcher type '" + node->get_name() + "'", node);
         }
     }
 
+    MatcherRef Grammar::load_match_precedence_from_tree(ParseTreeNodeRef node) // "MatchPrecedence"
+    {
+        if (node->get_name() != "MatchPrecedence")
+            throw make_node_exception("Expected node with name 'MatchPrecedence', but got '" + node->get_name() + "'", node);
+
+        auto& children = node->get_children();
+
+        auto operand = load_full_matcher_from_tree(expect_node(children[0], "FullMatcher"));
+
+        std::vector<MatcherMatchPrecedence::Operator> operators;
+        std::map<int, std::pair<MatcherMatchPrecedence::Associativity, std::string>> levels;
+        for (std::size_t i = 1; i < children.size(); ++i)
+        {
+            auto op = load_precedence_operator_from_tree(expect_node(children[i], "PrecedenceOperator"));
+
+            auto it = levels.find(op.precedence);
+            if (it != levels.end() && (it->second.first != op.associativity || it->second.second != op.name))
+                throw make_node_exception("Operators with precedence " + std::to_string(op.precedence) + " must share associativity and node name", children[i]);
+            levels[op.precedence] = { op.associativity, op.name };
+
+            operators.push_back(op);
+        }
+
+        return std::make_shared<MatcherMatchPrecedence>(operand, operators);
+    }
+
+    MatcherMatchPrecedence::Operator Grammar::load_precedence_operator_from_tree(ParseTreeNodeRef node) // "PrecedenceOperator"
+    {
+        if (node->get_name() != "PrecedenceOperator")
+            throw make_node_exception("Expected node with name 'PrecedenceOperator', but got '" + node->get_name() + "'", node);
+
+        MatcherMatchPrecedence::Operator op;
+
+        op.precedence = load_integer_from_tree(expect_child_node(node, "Integer"));
+
+        auto& associativity = expect_child_leaf(node, "PrecedenceAssociativity.0")->get_value();
+        if (associativity == "left")
+            op.associativity = MatcherMatchPrecedence::Associativity::Left;
+        else if (associativity == "right")
+            op.associativity = MatcherMatchPrecedence::Associativity::Right;
+        else
+            throw make_node_exception("Unknown associativity '" + associativity + "'", node);
+
+        op.name = expect_child_leaf(node, "Identifier.0")->get_value();
+        op.matcher = load_full_matcher_from_tree(expect_child_node(node, "FullMatcher"));
+
+        return op;
+    }
+
     void Grammar::load_matcher_modifiers_from_tree(MatcherRef matcher, ParseTreeNodeRef node) // "MatcherModifiers"
     {
         if (node->get_name() != "MatcherModifiers")
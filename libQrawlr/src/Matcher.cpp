@@ -1,5 +1,7 @@
 #include "Matcher.h"
 
+#include <algorithm>
+
 #include "Rule.h"
 #include "Constants.h"
 #include "EscapeString.h"
@@ -29,18 +31,44 @@ namespace qrawlr
         int match_count = 0;
         auto checkpoint = data.get_checkpoint();
 
+        bool committed = false;
+
         MatchResult sub_result;
         auto base_tree = ParseTreeNode::make(data.get_position(index));
         while (true)
         {
-            sub_result = match_impl(data, index);
-            if (m_flags.is_set(Flags::Invert))
-                sub_result = apply_invert(data, index, sub_result.tree);
+            // A repetition beyond the minimum count and an inverted match may
+            // fail without failing the matcher, which makes them choice points.
+            bool is_choice_point = match_count >= m_count_min || m_flags.is_set(Flags::Invert);
+            std::size_t choice_point = 0;
+            if (is_choice_point)
+                choice_point = data.push_choice_point(true, !m_flags.is_set(Flags::Invert));
+
+            // Text is skipped between repetitions, but only kept skipped if
+            // the repetition after it matches something
+            int index_begin = index;
+            if (index > index_old && data.is_skipping())
+                index_begin = data.skip(index);
+
+            sub_result = match_impl(data, index_begin);
+
+            bool cut = false;
+            if (is_choice_point)
+            {
+                cut = data.get_choice_point(choice_point).cut;
+                data.pop_choice_point();
+            }
 
-            index = sub_result.pos_end.index;
+            if (m_flags.is_set(Flags::Invert))
+                sub_result = apply_invert(data, index_begin, sub_result.tree);
 
             if (!sub_result.tree)
+            {
+                committed = cut;
                 break;
+            }
+            if (sub_result.pos_end.index > index_begin)
+                index = sub_result.pos_end.index;
             ++match_count;
             
             base_tree->add_child(sub_result.tree, m_flags.is_set(Flags::OmitMatch));
@@ -50,7 +78,7 @@ namespace qrawlr
         }
         ParseTreeRef tree = base_tree;
 
-        if (match_count < m_count_min)
+        if (match_count < m_count_min || committed)
         {
             run_actions_for_trigger(TRIGGER_ON_FAIL, nullptr, data, index_old);
             data.restore_checkpoint(checkpoint);
@@ -328,11 +356,17 @@ namespace qrawlr
 
         for (const auto& matcher : m_matchers)
         {
-            auto result = matcher->match(data, index);
+            // Same as between repetitions, see Matcher::match
+            int index_begin = index;
+            if (index > index_old && data.is_skipping())
+                index_begin = data.skip(index);
+
+            auto result = matcher->match(data, index_begin);
             if (!result.tree)
                 return { nullptr, data.get_position(index_old) };
             children.push_back(result.tree);
-            index = result.pos_end.index;
+            if (result.pos_end.index > index_begin)
+                index = result.pos_end.index;
         }
 
         auto node = ParseTreeNode::make(data.get_position(index_old));
@@ -369,12 +403,20 @@ namespace qrawlr
 
     MatchResult MatcherMatchAny::match_impl(ParseData& data, int index) const
     {
-        for (const auto& matcher : m_matchers)
+        auto choice_point = data.push_choice_point(true);
+        for (std::size_t i = 0; i < m_matchers.size(); ++i)
         {
-            auto result = matcher->match(data, index);
+            data.get_choice_point(choice_point).has_alternatives = i + 1 < m_matchers.size();
+            auto result = m_matchers[i]->match(data, index);
             if (result.tree)
+            {
+                data.pop_choice_point();
                 return result;
+            }
+            if (data.get_choice_point(choice_point).cut)
+                break;
         }
+        data.pop_choice_point();
 
         return { nullptr, data.get_position(index) };
     }
@@ -440,7 +482,8 @@ namespace qrawlr
 
     MatchResult MatcherMatchExact::match_impl(ParseData& data, int index) const
     {
-        if (data.eof(index))
+        // The empty string also matches at the end of the text
+        if (data.eof(index) && !m_exact.empty())
             return { nullptr, data.get_position(index) };
 
         if (data.get_text().substr(index, m_exact.size()) != m_exact)
@@ -531,4 +574,212 @@ namespace qrawlr
         return "MatcherMatchStack()";
     }
 
+    // -------------------- MATCHER MATCH INDENTATION -------------------- //
+
+    MatchResult MatcherMatchIndentation::match_impl(ParseData& data, int index) const
+    {
+        // 'indent' takes all indentation if it is the current level's followed
+        // by more and starts a new level, 'same' takes exactly the current
+        // level's indentation and 'dedent' returns to the enclosing level.
+        // Levels are compared as strings, so a tab is never a number of spaces.
+        const std::string& indentation = data.get_indentation();
+
+        if (m_kind == "dedent")
+        {
+            if (!data.pop_indentation())
+                return { nullptr, data.get_position(index) };
+            return { ParseTreeExactMatch::make("", data.get_position(index), data.get_position(index)), data.get_position(index) };
+        }
+
+        if (data.get_text().compare(index, indentation.size(), indentation) != 0)
+            return { nullptr, data.get_position(index) };
+
+        int width = indentation.size();
+        if (m_kind == "indent")
+        {
+            int line_width = data.get_line_indentation(index);
+            if (line_width <= width)
+                return { nullptr, data.get_position(index) };
+            data.push_indentation(data.get_text().substr(index, line_width));
+            width = line_width;
+        }
+
+        int index_next = index + width;
+        return {
+            ParseTreeExactMatch::make(
+                data.get_text().substr(index, width),
+                data.get_position(index),
+                data.get_position(index_next)
+            ),
+            data.get_position(index_next)
+        };
+    }
+
+    std::string MatcherMatchIndentation::to_string_impl() const
+    {
+        return ":" + m_kind + ":";
+    }
+
+    std::string MatcherMatchIndentation::gen_cpp_code() const
+    {
+        // TODO: Proper implementation
+        return "MatcherMatchIndentation()";
+    }
+
+    // -------------------- MATCHER MATCH PRECEDENCE -------------------- //
+
+    namespace
+    {
+        struct OpenPrecedenceNode
+        {
+            int precedence;
+            const std::string* name;
+            std::vector<ParseTreeRef> children;
+        };
+
+        ParseTreeRef close_precedence_node(OpenPrecedenceNode& open_node, ParseTreeRef last_operand)
+        {
+            auto node = ParseTreeNode::make(open_node.children.front()->get_pos_begin());
+            node->set_name(*open_node.name);
+            for (auto& child : open_node.children)
+                node->add_child(child);
+            node->add_child(last_operand);
+            return node;
+        }
+    }
+
+    MatchResult MatcherMatchPrecedence::match_impl(ParseData& data, int index) const
+    {
+        auto result = m_operand->match(data, index);
+        if (!result.tree)
+            return result;
+
+        ParseTreeRef tree = result.tree;
+        index = result.pos_end.index;
+
+        // Nodes still waiting for their last operand.
+        // Precedences strictly increase towards the back.
+        std::vector<OpenPrecedenceNode> open_nodes;
+
+        while (true)
+        {
+            auto checkpoint = data.get_checkpoint();
+            // Ending the chain is always possible, so cuts cannot leave the operator.
+            data.push_choice_point(true, false);
+
+            const Operator* matched_op = nullptr;
+            MatchResult op_result;
+            MatchResult operand_result;
+            int missing_operand = -1;
+            int op_begin = data.is_skipping() ? data.skip(index) : index;
+            for (const auto& op : m_operators_by_precedence)
+            {
+                op_result = op.matcher->match(data, op_begin);
+                if (!op_result.tree)
+                    continue;
+
+                int operand_begin = data.is_skipping() ? data.skip(op_result.pos_end.index) : op_result.pos_end.index;
+                operand_result = m_operand->match(data, operand_begin);
+                if (!operand_result.tree)
+                {
+                    if (missing_operand < 0)
+                        missing_operand = operand_begin;
+                    data.restore_checkpoint(checkpoint);
+                    continue;
+                }
+
+                matched_op = &op;
+                break;
+            }
+            data.pop_choice_point();
+
+            if (!matched_op)
+            {
+                // Only reported if no other operator continues the chain
+                if (missing_operand >= 0)
+                    run_actions_for_trigger(TRIGGER_ON_MISSING_OPERAND, nullptr, data, missing_operand);
+                break;
+            }
+
+            while (!open_nodes.empty() && open_nodes.back().precedence > matched_op->precedence)
+            {
+                tree = close_precedence_node(open_nodes.back(), tree);
+                open_nodes.pop_back();
+            }
+
+            if (!open_nodes.empty() && open_nodes.back().precedence == matched_op->precedence && matched_op->associativity == Associativity::Left)
+            {
+                open_nodes.back().children.push_back(tree);
+                open_nodes.back().children.push_back(op_result.tree);
+            }
+            else
+            {
+                open_nodes.push_back({ matched_op->precedence, &matched_op->name, { tree, op_result.tree } });
+            }
+
+            tree = operand_result.tree;
+            index = operand_result.pos_end.index;
+        }
+
+        while (!open_nodes.empty())
+        {
+            tree = close_precedence_node(open_nodes.back(), tree);
+            open_nodes.pop_back();
+        }
+
+        return { tree, data.get_position(index) };
+    }
+
+    std::string MatcherMatchPrecedence::to_string_impl() const
+    {
+        std::string result = "<" + m_operand->to_string();
+
+        for (const auto& op : m_operators)
+        {
+            result += " " + std::to_string(op.precedence);
+            result += op.associativity == Associativity::Left ? " left " : " right ";
+            result += op.name + ": " + op.matcher->to_string();
+        }
+
+        result += ">";
+
+        return result;
+    }
+
+    std::string MatcherMatchPrecedence::gen_cpp_code() const
+    {
+        // TODO: Proper implementation
+        return "MatcherMatchPrecedence()";
+    }
+
+    // -------------------- MATCHER CUT -------------------- //
+
+    MatchResult MatcherCut::match_impl(ParseData& data, int index) const
+    {
+        data.cut(index);
+        return { ParseTreeNode::make(data.get_position(index)), data.get_position(index) };
+    }
+
+    std::string MatcherCut::to_string_impl() const
+    {
+        return "^";
+    }
+
+    std::string MatcherCut::gen_cpp_code() const
+    {
+        // TODO: Proper implementation
+        return "MatcherCut()";
+    }
+
+    void MatcherMatchPrecedence::sort_operators_by_precedence()
+    {
+        // Operators are tried from the highest to the lowest precedence, the
+        // same order a chain of one rule per precedence level would use.
+        m_operators_by_precedence = m_operators;
+        std::stable_sort(
+            m_operators_by_precedence.begin(), m_operators_by_precedence.end(),
+            [](const Operator& a, const Operator& b) { return a.precedence > b.precedence; }
+        );
+    }
+
 } // namespace qrawlr
\ No newline at end of file
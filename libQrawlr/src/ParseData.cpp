@@ -2,6 +2,7 @@
 
 #include <algorithm>
 
+#include "Rule.h"
 #include "GrammarException.h"
 
 namespace qrawlr
@@ -9,9 +10,18 @@ namespace qrawlr
     ParseData::ParseData(const std::string& text, const std::string& filename, const std::map<std::string, RuleRef>& rules)
         : m_tree_id(++s_last_tree_id), m_text(text), m_filename(filename), m_rules(rules),
         m_stacks(), m_stack_histories(),
-        m_farthest_match_index(0)
+        m_indentation_strings({ "" }), m_indentation_parents({ -1 }), m_indentation(0),
+        m_farthest_match_index(0), m_committed_index(0),
+        m_skip_rule(), m_skip_ends(), m_skipping(false)
     {
+        for (const auto& [name, rule] : m_rules)
+        {
+            if (rule->get_rule_flags().is_set(Rule::Flags::Skip))
+                m_skip_rule = rule;
+        }
+
         generate_newline_indices();
+        generate_line_indentations();
         s_tree_id_to_name_mappings.insert({ m_tree_id, filename });
     }
 
@@ -23,21 +33,119 @@ namespace qrawlr
         return names;
     }
 
+    void ParseData::push_indentation(const std::string& indentation)
+    {
+        m_indentation_strings.push_back(indentation);
+        m_indentation_parents.push_back(m_indentation);
+        m_indentation = m_indentation_strings.size() - 1;
+    }
+
+    bool ParseData::pop_indentation()
+    {
+        if (m_indentation == 0)
+            return false;
+        m_indentation = m_indentation_parents[m_indentation];
+        return true;
+    }
+
+    int ParseData::skip(int index)
+    {
+        if (!m_skip_rule)
+            return index;
+
+        auto it = m_skip_ends.find(index);
+        if (it != m_skip_ends.end())
+            return it->second;
+
+        // Matching the rule already counts the skipped text as matched
+        auto result = m_skip_rule->match(*this, index);
+        int end = result.tree ? result.pos_end.index : index;
+        m_skip_ends.insert({ index, end });
+        return end;
+    }
+
+    int ParseData::get_line_indentation(int index)
+    {
+        auto it = m_line_indentations.find(index);
+        if (it != m_line_indentations.end())
+            return it->second;
+        return find_indentation_end(index) - index;
+    }
+
+    ParseData::LeftRecursionHead* ParseData::get_left_recursion_head(const std::string& rule_name, int index)
+    {
+        auto it = m_left_recursion_heads.find({ rule_name, index });
+        return it == m_left_recursion_heads.end() ? nullptr : &it->second;
+    }
+
+    ParseData::LeftRecursionHead* ParseData::begin_left_recursion_head(const std::string& rule_name, int index)
+    {
+        auto& head = m_left_recursion_heads[{ rule_name, index }];
+        head = LeftRecursionHead();
+        head.seed_index = index;
+        return &head;
+    }
+
+    void ParseData::end_left_recursion_head(const std::string& rule_name, int index)
+    {
+        m_left_recursion_heads.erase({ rule_name, index });
+    }
+
+    std::size_t ParseData::push_choice_point(bool has_alternatives, bool can_cut)
+    {
+        m_choice_points.push_back({ has_alternatives, can_cut });
+        return m_choice_points.size() - 1;
+    }
+
+    void ParseData::cut(int index)
+    {
+        if (!m_choice_points.empty() && m_choice_points.back().can_cut)
+            m_choice_points.back().cut = true;
+
+        // Only when no enclosing choice can backtrack anymore, everything
+        // before the cut is final and its bookkeeping can be dropped.
+        for (const auto& choice_point : m_choice_points)
+            if (choice_point.has_alternatives && !choice_point.cut)
+                return;
+
+        commit(index);
+    }
+
+    void ParseData::commit(int index)
+    {
+        m_committed_index = std::max(m_committed_index, index);
+
+        for (auto& [name, history] : m_stack_histories)
+        {
+            m_stack_history_offsets[name] += history.size();
+            history.clear();
+        }
+    }
+
     ParseData::Checkpoint ParseData::get_checkpoint() const
     {
         Checkpoint checkpoint;
+        checkpoint.indentation = m_indentation;
         for (const auto& pair : m_stack_histories)
-            checkpoint.stack_sizes[pair.first] = pair.second.size();
+        {
+            auto it = m_stack_history_offsets.find(pair.first);
+            int offset = it == m_stack_history_offsets.end() ? 0 : it->second;
+            checkpoint.stack_sizes[pair.first] = offset + pair.second.size();
+        }
         return checkpoint;
     }
 
     void ParseData::restore_checkpoint(const Checkpoint& checkpoint)
     {
+        m_indentation = checkpoint.indentation;
         for (auto& [name, size] : checkpoint.stack_sizes)
         {
             auto& stack = get_stack(name);
             auto& history = get_stack_history(name);
-            while (stack.size() > (std::size_t)size)
+            // Committed history is gone. Restoring past it only happens while
+            // a committed parse is failing as a whole.
+            int remaining = std::max(size - m_stack_history_offsets[name], 0);
+            while (history.size() > (std::size_t)remaining)
             {
                 auto item = history.back();
                 history.pop_back();
@@ -61,6 +169,9 @@ namespace qrawlr
 
     bool ParseData::stacks_are_empty() const
     {
+        if (m_indentation != 0)
+            return false;
+
         for (auto& pair : m_stacks)
             if (!pair.second.empty())
                 return false;
@@ -77,6 +188,32 @@ namespace qrawlr
                 m_newline_indices.push_back(i);
     }
 
+    void ParseData::generate_line_indentations()
+    {
+        m_line_indentations.clear();
+        for (int line_begin : m_newline_indices)
+        {
+            int index = line_begin + 1;
+            m_line_indentations[index] = find_indentation_end(index) - index;
+        }
+    }
+
+    int ParseData::find_indentation_end(int index) const
+    {
+        // Spaces and tabs, a backslash-newline continues them on the next line
+        int end = index;
+        while ((std::size_t)end < m_text.size())
+        {
+            if (m_text[end] == ' ' || m_text[end] == '\t')
+                ++end;
+            else if (m_text[end] == '\\' && (std::size_t)end + 1 < m_text.size() && m_text[end + 1] == '\n')
+                end += 2;
+            else
+                break;
+        }
+        return end;
+    }
+
     const std::string& ParseData::tree_id_to_name(int tree_id)
     {
         static const std::string unknown_name;
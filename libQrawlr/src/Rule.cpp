@@ -9,12 +9,123 @@ namespace qrawlr
 
     MatchResult Rule::match_impl(ParseData& data, int index) const
     {
-        MatchResult result = MatcherMatchAny::match_impl(data, index);
-        if (m_rule_flags.is_set(Flags::FuseChildren))
+        // A rule entered again at the same index can only be left recursion.
+        // The inner invocation returns the current seed (initially a failure)
+        // and the outer invocation grows it until it stops getting longer.
+        if (auto head = data.get_left_recursion_head(m_name, index); head != nullptr)
+        {
+            head->detected = true;
+            return { head->seed_tree, data.get_position(head->seed_index) };
+        }
+
+        // The matchers of the body skip if the rule is skipping, the rules
+        // they refer to decide for themselves
+        bool skipping = data.is_skipping();
+        data.set_skipping(m_rule_flags.is_set(Flags::Skipping));
+
+        auto& head = *data.begin_left_recursion_head(m_name, index);
+
+        MatchResult result = match_once(data, index, head);
+        if (head.detected)
+            result = grow_seed(data, index, head, result);
+
+        data.end_left_recursion_head(m_name, index);
+
+        data.set_skipping(skipping);
+
+        return result;
+    }
+
+    MatchResult Rule::match_options(ParseData& data, int index, ParseData::LeftRecursionHead& head) const
+    {
+        auto choice_point = data.push_choice_point(true);
+        auto result = match_options(data, index, head, choice_point);
+        data.pop_choice_point();
+        return result;
+    }
+
+    MatchResult Rule::match_options(ParseData& data, int index, ParseData::LeftRecursionHead& head, std::size_t choice_point) const
+    {
+        if (head.growing)
+        {
+            // Options that did not recurse cannot produce a longer match, so
+            // only the left recursive ones are retried. Reaching the option
+            // the seed originated from ends the growth.
+            for (int i = 0; i < (int)m_matchers.size(); ++i)
+            {
+                if (head.recursive_options.count(i) > 0)
+                {
+                    auto result = m_matchers[i]->match(data, index);
+                    if (result.tree)
+                        return result;
+                    if (data.get_choice_point(choice_point).cut)
+                        break;
+                }
+                else if (i == head.base_option)
+                {
+                    break;
+                }
+            }
+
+            return { nullptr, data.get_position(index) };
+        }
+
+        for (int i = 0; i < (int)m_matchers.size(); ++i)
+        {
+            data.get_choice_point(choice_point).has_alternatives = i + 1 < (int)m_matchers.size();
+
+            bool detected = head.detected;
+            head.detected = false;
+            auto result = m_matchers[i]->match(data, index);
+            if (head.detected)
+                head.recursive_options.insert(i);
+            head.detected = head.detected || detected;
+
+            if (result.tree)
+            {
+                head.base_option = i;
+                return result;
+            }
+            if (data.get_choice_point(choice_point).cut)
+                break;
+        }
+
+        return { nullptr, data.get_position(index) };
+    }
+
+    MatchResult Rule::match_once(ParseData& data, int index, ParseData::LeftRecursionHead& head) const
+    {
+        MatchResult result = match_options(data, index, head);
+        if (m_rule_flags.is_set(Flags::FuseChildren) || m_rule_flags.is_set(Flags::Token))
             fuse_children(result.tree);
         return result;
     }
 
+    MatchResult Rule::grow_seed(ParseData& data, int index, ParseData::LeftRecursionHead& head, MatchResult result) const
+    {
+        head.growing = true;
+        while (result.tree)
+        {
+            head.seed_tree = result.tree;
+            head.seed_index = result.pos_end.index;
+
+            // The current seed stays a valid result, whatever the growth does.
+            auto checkpoint = data.get_checkpoint();
+            data.push_choice_point(true, false);
+            auto grown = match_once(data, index, head);
+            data.pop_choice_point();
+            if (!grown.tree || grown.pos_end.index <= result.pos_end.index)
+            {
+                data.restore_checkpoint(checkpoint);
+                break;
+            }
+
+            result = grown;
+        }
+
+        return result;
+    }
+
     std::string Rule::to_string_impl() const
     {
         std::string header_str;
@@ -29,6 +140,16 @@ namespace qrawlr
                 flags.push_back("fuse");
             if (m_rule_flags.is_set(Flags::Collapse))
                 flags.push_back("collapse");
+            if (m_rule_flags.is_set(Flags::Token))
+                flags.push_back("token");
+            if (m_rule_flags.is_set(Flags::Skip))
+                flags.push_back("skip");
+            if (m_rule_flags.is_set(Flags::Skipping))
+                flags.push_back("skipping");
+            if (m_rule_flags.is_set(Flags::Lazy))
+                flags.push_back("lazy");
+            if (m_rule_flags.is_set(Flags::Comment))
+                flags.push_back("comment");
 
             if (!flags.empty())
             {
@@ -61,6 +182,7 @@ namespace qrawlr
 
         std::size_t i = 0;
         std::shared_ptr<ParseTreeExactMatch> prevLeaf;
+        std::size_t prevLeafIndex = 0;
         while (i < node->get_children().size())
         {
             auto leaf = std::dynamic_pointer_cast<ParseTreeExactMatch>(node->get_children()[i]);
@@ -69,12 +191,18 @@ namespace qrawlr
                 if (!prevLeaf)
                 {
                     prevLeaf = leaf;
+                    prevLeafIndex = i;
                 }
                 else
                 {
-                    prevLeaf->get_value() += leaf->get_value();
-                    if (prevLeaf->get_pos_end().index < leaf->get_pos_end().index)
-                        prevLeaf->set_pos_end(leaf->get_pos_end());
+                    // Leaves may be shared with a left recursion seed, so
+                    // fuse into a new leaf instead of modifying them in place.
+                    auto pos_end = prevLeaf->get_pos_end();
+                    if (pos_end.index < leaf->get_pos_end().index)
+                        pos_end = leaf->get_pos_end();
+                    auto fused = ParseTreeExactMatch::make(prevLeaf->get_value() + leaf->get_value(), prevLeaf->get_pos_begin(), pos_end);
+                    node->get_children()[prevLeafIndex] = fused;
+                    prevLeaf = fused;
                     node->get_children().erase(node->get_children().begin() + i);
                     continue;
                 }
@@ -0,0 +1,117 @@
+#include "TreeSerializer.h"
+
+#include <map>
+#include <vector>
+
+#include "GrammarException.h"
+
+namespace qrawlr
+{
+    static const char s_magic[] = "QPT";
+    static const int s_format_version = 1;
+
+    static const int s_record_node = 0;
+    static const int s_record_leaf = 1;
+
+    class TreeWriter
+    {
+    public:
+        std::string write(ParseTreeRef tree)
+        {
+            std::string body = write_record(tree, { -1, 0, 0, 0 });
+
+            std::string result = s_magic;
+            write_varint(result, s_format_version);
+            write_varint(result, 0);
+
+            write_varint(result, m_strings.size());
+            for (auto& string : m_strings)
+            {
+                write_varint(result, string.size());
+                result += string;
+            }
+
+            result += body;
+
+            return result;
+        }
+    private:
+        std::string write_record(ParseTreeRef tree, const Position& parent_begin)
+        {
+            std::string result;
+
+            auto node = get_node(tree);
+            if (node != nullptr)
+            {
+                int reference = node->get_name().empty() ? 0 : get_string_index(node->get_name()) + 1;
+                write_varint(result, (reference << 1) | s_record_node);
+            }
+            else if (auto leaf = get_leaf(tree); leaf != nullptr)
+            {
+                write_varint(result, (get_string_index(leaf->get_value()) << 1) | s_record_leaf);
+            }
+            else
+            {
+                throw GrammarException("Cannot serialize unknown tree type");
+            }
+
+            auto& begin = tree->get_pos_begin();
+            auto& end = tree->get_pos_end();
+
+            write_varint(result, zigzag(begin.index - parent_begin.index));
+            write_varint(result, zigzag(begin.line - parent_begin.line));
+            write_varint(result, begin.column);
+            write_varint(result, end.index - begin.index);
+            write_varint(result, end.line - begin.line);
+            write_varint(result, end.column);
+
+            if (node != nullptr)
+            {
+                std::string children;
+                for (auto& child : node->get_children())
+                    children += write_record(child, begin);
+
+                write_varint(result, node->get_children().size());
+                write_varint(result, children.size());
+                result += children;
+            }
+
+            return result;
+        }
+
+        int get_string_index(const std::string& string)
+        {
+            auto it = m_string_indices.find(string);
+            if (it != m_string_indices.end())
+                return it->second;
+
+            int index = m_strings.size();
+            m_string_indices[string] = index;
+            m_strings.push_back(string);
+            return index;
+        }
+
+        static unsigned long long zigzag(long long value)
+        {
+            return value >= 0 ? (unsigned long long)value << 1 : ((unsigned long long)(-value) << 1) - 1;
+        }
+
+        static void write_varint(std::string& result, unsigned long long value)
+        {
+            while (value >= 0x80)
+            {
+                result += (char)((value & 0x7F) | 0x80);
+                value >>= 7;
+            }
+            result += (char)value;
+        }
+    private:
+        std::map<std::string, int> m_string_indices;
+        std::vector<std::string> m_strings;
+    };
+
+    std::string serialize_tree(ParseTreeRef tree)
+    {
+        return TreeWriter().write(tree);
+    }
+} // namespace qrawlr